@@ -0,0 +1,33 @@
+"""
+Prints the runner overhead of each benchmark case without requiring pytest-benchmark:
+
+    python -m benchmarks [--rounds N] [case ...]
+"""
+
+import argparse
+import sys
+
+from benchmarks.cases import CASES
+from benchmarks.harness import measure_peak_memory, run_case, summarize
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks the Workflow Runner over the tests/workflows fixtures")
+    parser.add_argument("cases", nargs="*", help="The names of the cases to run, all of them by default")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if not args.cases or case.name in args.cases]
+    sys.stdout.write(f"{'case':<28}{'latency ms':>12}{'per node ms':>13}{'events/s':>11}{'peak KiB':>10}\n")
+    for case in cases:
+        run_case(case)
+        stats = summarize([run_case(case) for _ in range(args.rounds)])
+        peak_memory = measure_peak_memory(case)
+        sys.stdout.write(
+            f"{case.name:<28}{stats.latency * 1000:>12.2f}{stats.per_node_latency * 1000:>13.2f}"
+            f"{stats.events_per_second:>11.0f}{peak_memory / 1024:>10.0f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+from unittest import mock
+from uuid import uuid4
+from typing import Any, ContextManager, Iterator, List
+
+from vellum import ExecutePromptEvent, FulfilledExecutePromptEvent, InitiatedExecutePromptEvent, StringVellumValue
+
+from benchmarks.harness import WorkflowBenchmarkCase, skip_sleep
+from tests.workflows import max_concurrent_threads, streaming_node_pipeline
+from tests.workflows.basic_conditional_node.workflow import CategoryWorkflow, Inputs as CategoryInputs
+from tests.workflows.basic_emitter_workflow.workflow import BasicEmitterWorkflow
+from tests.workflows.basic_inline_prompt_node.workflow import (
+    BasicInlinePromptWorkflow,
+    ExampleBaseInlinePromptNode,
+    WorkflowInputs as PromptInputs,
+)
+from tests.workflows.basic_inline_subworkflow.workflow import BasicInlineSubworkflowWorkflow, Inputs as WeatherInputs
+from tests.workflows.basic_looping.workflow import BasicLoopingWorkflow
+from tests.workflows.basic_map_node.workflow import Inputs as FruitInputs, SimpleMapExample
+from tests.workflows.basic_node_mocking.workflow import MockedNodeWorkflow, StartNode as MockedStartNode
+from tests.workflows.basic_node_streaming.workflow import BasicNodeStreaming, Inputs as StreamingInputs
+from tests.workflows.basic_state_forking.workflow import BasicStateForkingWorkflow
+from tests.workflows.max_concurrent_threads.workflow import MaxConcurrentThreadsExample
+from tests.workflows.streaming_node_pipeline.workflow import (
+    Inputs as PipelineInputs,
+    State as PipelineState,
+    StreamingNodePipelineWorkflow,
+)
+from tests.workflows.trivial.workflow import TrivialWorkflow
+
+
+def _generate_prompt_events() -> Iterator[ExecutePromptEvent]:
+    execution_id = str(uuid4())
+    yield InitiatedExecutePromptEvent(execution_id=execution_id)
+    yield FulfilledExecutePromptEvent(
+        execution_id=execution_id,
+        outputs=[StringVellumValue(value="Blue")],
+    )
+
+
+def _mock_prompt_execution() -> ContextManager[Any]:
+    return mock.patch.object(
+        ExampleBaseInlinePromptNode, "_get_prompt_event_stream", side_effect=_generate_prompt_events
+    )
+
+
+def _reset_pipeline_state() -> ContextManager[Any]:
+    # The fixture's state accumulates into a list shared across runs, which would make later runs slower
+    outputs: List[str] = []
+    return mock.patch.object(PipelineState, "outputs", outputs)
+
+
+CASES: List[WorkflowBenchmarkCase] = [
+    WorkflowBenchmarkCase(name="trivial", workflow_class=TrivialWorkflow),
+    WorkflowBenchmarkCase(
+        name="basic_map_node",
+        workflow_class=SimpleMapExample,
+        inputs=FruitInputs(fruits=["apple", "banana", "cherry", "date", "elderberry"]),
+    ),
+    WorkflowBenchmarkCase(name="basic_looping", workflow_class=BasicLoopingWorkflow),
+    WorkflowBenchmarkCase(
+        name="streaming_node_pipeline",
+        workflow_class=StreamingNodePipelineWorkflow,
+        inputs=PipelineInputs(fruits=["apple", "banana", "cherry"]),
+        patches=(skip_sleep(streaming_node_pipeline.workflow), _reset_pipeline_state),
+    ),
+    WorkflowBenchmarkCase(name="basic_state_forking", workflow_class=BasicStateForkingWorkflow),
+    WorkflowBenchmarkCase(
+        name="max_concurrent_threads",
+        workflow_class=MaxConcurrentThreadsExample,
+        patches=(skip_sleep(max_concurrent_threads.workflow),),
+    ),
+    WorkflowBenchmarkCase(
+        name="basic_inline_subworkflow",
+        workflow_class=BasicInlineSubworkflowWorkflow,
+        inputs=WeatherInputs(city="San Francisco", date="2024-01-01"),
+    ),
+    WorkflowBenchmarkCase(
+        name="basic_conditional_node",
+        workflow_class=CategoryWorkflow,
+        inputs=CategoryInputs(category="question"),
+    ),
+    WorkflowBenchmarkCase(
+        name="basic_node_streaming",
+        workflow_class=BasicNodeStreaming,
+        inputs=StreamingInputs(foo="Hello"),
+    ),
+    WorkflowBenchmarkCase(name="basic_emitter_workflow", workflow_class=BasicEmitterWorkflow),
+    WorkflowBenchmarkCase(
+        name="basic_node_mocking",
+        workflow_class=MockedNodeWorkflow,
+        node_output_mocks=[MockedStartNode.Outputs(greeting="Hello")],
+    ),
+    WorkflowBenchmarkCase(
+        name="basic_inline_prompt_node",
+        workflow_class=BasicInlinePromptWorkflow,
+        inputs=PromptInputs(noun="color"),
+        patches=(_mock_prompt_execution,),
+    ),
+]
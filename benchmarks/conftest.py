@@ -0,0 +1,5 @@
+import importlib.util
+
+# The benchmarks are run with `make benchmark`. Environments without pytest-benchmark installed skip collecting them,
+# rather than failing, or skipping, the rest of the run
+collect_ignore_glob = [] if importlib.util.find_spec("pytest_benchmark") else ["test_*.py"]
@@ -0,0 +1,124 @@
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+import time
+import tracemalloc
+from types import ModuleType, SimpleNamespace
+from unittest import mock
+from typing import Any, Callable, ContextManager, Iterator, List, Optional, Tuple, Type
+
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.mocks import MockNodeExecutionArg
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+PatchFactory = Callable[[], ContextManager[Any]]
+
+_NODE_TERMINAL_EVENT_NAMES = {"node.execution.fulfilled", "node.execution.rejected"}
+
+
+@dataclass(frozen=True)
+class WorkflowBenchmarkCase:
+    name: str
+    workflow_class: Type[BaseWorkflow]
+    inputs: Optional[BaseInputs] = None
+    node_output_mocks: Optional[MockNodeExecutionArg] = None
+    # Applied around every run, e.g. to mock external calls or skip the sleeps within a fixture
+    patches: Tuple[PatchFactory, ...] = ()
+
+
+@dataclass(frozen=True)
+class WorkflowRunStats:
+    latency: float
+    event_count: int
+    node_execution_count: int
+
+    @property
+    def events_per_second(self) -> float:
+        return self.event_count / self.latency if self.latency else 0.0
+
+    @property
+    def per_node_latency(self) -> float:
+        """
+        The run's latency divided across its node executions. For fixtures whose nodes do no real work, this is the
+        runner's overhead per node.
+        """
+
+        return self.latency / self.node_execution_count if self.node_execution_count else self.latency
+
+
+def skip_sleep(module: ModuleType) -> PatchFactory:
+    """
+    Skips the `time.sleep` calls made by a module that imports `time`, without affecting other modules.
+    """
+
+    return lambda: mock.patch.object(module, "time", SimpleNamespace(sleep=lambda seconds: None))
+
+
+@contextmanager
+def apply_patches(case: WorkflowBenchmarkCase) -> Iterator[None]:
+    with ExitStack() as stack:
+        for patch in case.patches:
+            stack.enter_context(patch())
+        yield
+
+
+def run_case(case: WorkflowBenchmarkCase) -> WorkflowRunStats:
+    """
+    Streams every event of a single run of the case's Workflow, raising if the Workflow doesn't fulfill.
+    """
+
+    with apply_patches(case):
+        started_at = time.perf_counter()
+        workflow = case.workflow_class()
+        event_count = 0
+        node_execution_count = 0
+        last_event = None
+        for event in workflow.stream(
+            inputs=case.inputs,
+            node_output_mocks=case.node_output_mocks,
+            event_filter=all_workflow_event_filter,
+        ):
+            event_count += 1
+            if event.name in _NODE_TERMINAL_EVENT_NAMES:
+                node_execution_count += 1
+            last_event = event
+
+        latency = time.perf_counter() - started_at
+
+    if last_event is None or last_event.name != "workflow.execution.fulfilled":
+        raise RuntimeError(f"Benchmark case {case.name} did not fulfill, last event: {last_event}")
+
+    return WorkflowRunStats(latency=latency, event_count=event_count, node_execution_count=node_execution_count)
+
+
+def measure_peak_memory(case: WorkflowBenchmarkCase) -> int:
+    """
+    Returns the most memory, in bytes, allocated at once during a single run of the case's Workflow.
+    """
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+
+    try:
+        tracemalloc.reset_peak()
+        allocated_before, _ = tracemalloc.get_traced_memory()
+        run_case(case)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return max(peak - allocated_before, 0)
+
+
+def summarize(runs: List[WorkflowRunStats]) -> WorkflowRunStats:
+    """
+    Averages the stats of several runs of the same case.
+    """
+
+    return WorkflowRunStats(
+        latency=sum(run.latency for run in runs) / len(runs),
+        event_count=round(sum(run.event_count for run in runs) / len(runs)),
+        node_execution_count=round(sum(run.node_execution_count for run in runs) / len(runs)),
+    )
@@ -0,0 +1,298 @@
+"""
+Drives many concurrent runs of a synthetic Workflow to measure how the Workflow Runner scales:
+
+    python -m benchmarks.load_test --concurrency 100 --runs 1000 --width 4 --depth 3 --sleep 0.01
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+import json
+import sys
+import threading
+import time
+from types import new_class
+from typing import Any, Iterator, List, Optional, Type, Union
+
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.core.map_node.node import MapNode
+from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class SyntheticWorkflowSpec:
+    # The number of independent chains of nodes that run concurrently
+    width: int = 1
+    # The number of nodes in each chain
+    depth: int = 1
+    # If set, each chain starts with a MapNode that runs a single node subworkflow over this many items
+    map_fanout: int = 0
+    # Seconds that each node sleeps for, simulating I/O such as a model call
+    sleep: float = 0.0
+    # Seconds of CPU time that each node burns, simulating work that holds the GIL
+    cpu: float = 0.0
+    # If set, each node streams its output in this many chunks, spread evenly across its sleep
+    stream_chunks: int = 0
+
+
+class SyntheticNode(BaseNode):
+    sleep: float = 0.0
+    cpu: float = 0.0
+    stream_chunks: int = 0
+
+    class Outputs(BaseNode.Outputs):
+        value: str
+
+    def run(self) -> Union[Outputs, Iterator[BaseOutput]]:
+        if not self.stream_chunks:
+            self._work(self.sleep)
+            return self.Outputs(value="done")
+
+        return self._stream()
+
+    def _stream(self) -> Iterator[BaseOutput]:
+        chunks = []
+        for index in range(self.stream_chunks):
+            self._work(self.sleep / self.stream_chunks)
+            chunk = f"chunk-{index} "
+            chunks.append(chunk)
+            yield BaseOutput(name="value", delta=chunk)
+
+        yield BaseOutput(name="value", value="".join(chunks))
+
+    def _work(self, sleep: float) -> None:
+        if sleep:
+            time.sleep(sleep)
+
+        if self.cpu:
+            started_at = time.thread_time()
+            while time.thread_time() - started_at < self.cpu:
+                pass
+
+
+def _create_node(name: str, spec: SyntheticWorkflowSpec) -> Type[SyntheticNode]:
+    return type(
+        name,
+        (SyntheticNode,),
+        {
+            "__module__": __name__,
+            "sleep": spec.sleep,
+            "cpu": spec.cpu,
+            "stream_chunks": spec.stream_chunks,
+        },
+    )
+
+
+def _create_map_node(name: str, spec: SyntheticWorkflowSpec) -> Type[BaseNode]:
+    iteration_node = _create_node(f"{name}Iteration", spec)
+    subworkflow = new_class(
+        f"{name}Subworkflow",
+        (BaseWorkflow[MapNode.SubworkflowInputs, BaseState],),
+        exec_body=lambda namespace: namespace.update({"__module__": __name__, "graph": iteration_node}),
+    )
+    return type(
+        name,
+        (MapNode,),
+        {"__module__": __name__, "items": list(range(spec.map_fanout)), "subworkflow": subworkflow},
+    )
+
+
+def create_synthetic_workflow(spec: SyntheticWorkflowSpec) -> Type[BaseWorkflow]:
+    """
+    Generates a Workflow of `width` independent chains, each of `depth` synthetic nodes.
+    """
+
+    chains: List[Any] = []
+    for lane in range(spec.width):
+        nodes: List[Type[BaseNode]] = []
+        if spec.map_fanout:
+            nodes.append(_create_map_node(f"MapNode{lane}", spec))
+        nodes.extend(_create_node(f"Node{lane}_{layer}", spec) for layer in range(spec.depth))
+
+        chain: Any = nodes[0]
+        for node in nodes[1:]:
+            chain = chain >> node
+        chains.append(chain)
+
+    graph = set(chains) if len(chains) > 1 else chains[0]
+    return new_class(
+        "SyntheticWorkflow",
+        (BaseWorkflow[BaseInputs, BaseState],),
+        exec_body=lambda namespace: namespace.update({"__module__": __name__, "graph": graph}),
+    )
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    runs: int
+    failed_runs: int
+    concurrency: int
+    duration: float
+    throughput: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    events_per_second: float
+    peak_thread_count: int
+    peak_rss_bytes: Optional[int]
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+
+    index = min(int(round(percentile / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def _get_rss_bytes() -> Optional[int]:
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+
+    if resource is not None:
+        # The peak rather than the current RSS, in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    return None
+
+
+class _ResourceSampler:
+    """
+    Samples the process's thread count and RSS in the background, keeping the peaks.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_thread_count = threading.active_count()
+        self.peak_rss_bytes = _get_rss_bytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="LoadTestResourceSampler", daemon=True)
+
+    def __enter__(self) -> "_ResourceSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        self.peak_thread_count = max(self.peak_thread_count, threading.active_count())
+        rss_bytes = _get_rss_bytes()
+        if rss_bytes is not None:
+            self.peak_rss_bytes = max(self.peak_rss_bytes or 0, rss_bytes)
+
+
+@dataclass(frozen=True)
+class _RunResult:
+    latency: float
+    event_count: int
+    is_fulfilled: bool
+
+
+def _stream_workflow(workflow_class: Type[BaseWorkflow]) -> _RunResult:
+    started_at = time.perf_counter()
+    event_count = 0
+    last_event = None
+    for event in workflow_class().stream(event_filter=all_workflow_event_filter):
+        event_count += 1
+        last_event = event
+
+    return _RunResult(
+        latency=time.perf_counter() - started_at,
+        event_count=event_count,
+        is_fulfilled=last_event is not None and last_event.name == "workflow.execution.fulfilled",
+    )
+
+
+def run_load_test(
+    workflow_class: Type[BaseWorkflow],
+    *,
+    concurrency: int,
+    runs: int,
+) -> LoadTestReport:
+    """
+    Streams `runs` runs of a Workflow, keeping `concurrency` of them in flight at once.
+    """
+
+    with _ResourceSampler() as sampler, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        started_at = time.perf_counter()
+        results = list(executor.map(lambda _: _stream_workflow(workflow_class), range(runs)))
+        duration = time.perf_counter() - started_at
+
+    latencies = sorted(result.latency for result in results)
+    return LoadTestReport(
+        runs=runs,
+        failed_runs=sum(1 for result in results if not result.is_fulfilled),
+        concurrency=concurrency,
+        duration=duration,
+        throughput=runs / duration,
+        latency_p50=_percentile(latencies, 50),
+        latency_p95=_percentile(latencies, 95),
+        latency_p99=_percentile(latencies, 99),
+        events_per_second=sum(result.event_count for result in results) / duration,
+        peak_thread_count=sampler.peak_thread_count,
+        peak_rss_bytes=sampler.peak_rss_bytes,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load tests the Workflow Runner with synthetic Workflows")
+    parser.add_argument("--concurrency", type=int, default=10, help="The number of runs in flight at once")
+    parser.add_argument("--runs", type=int, default=100, help="The total number of runs")
+    parser.add_argument("--width", type=int, default=1)
+    parser.add_argument("--depth", type=int, default=1)
+    parser.add_argument("--map-fanout", type=int, default=0)
+    parser.add_argument("--sleep", type=float, default=0.0, help="Seconds that each node sleeps for")
+    parser.add_argument("--cpu", type=float, default=0.0, help="Seconds of CPU time that each node burns")
+    parser.add_argument("--stream-chunks", type=int, default=0, help="The number of chunks each node streams")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    spec = SyntheticWorkflowSpec(
+        width=args.width,
+        depth=args.depth,
+        map_fanout=args.map_fanout,
+        sleep=args.sleep,
+        cpu=args.cpu,
+        stream_chunks=args.stream_chunks,
+    )
+    report = run_load_test(create_synthetic_workflow(spec), concurrency=args.concurrency, runs=args.runs)
+
+    if args.json:
+        sys.stdout.write(json.dumps({"spec": asdict(spec), **asdict(report)}, indent=2) + "\n")
+        return
+
+    rss = f"{report.peak_rss_bytes / 1024 / 1024:.1f} MiB" if report.peak_rss_bytes is not None else "unknown"
+    sys.stdout.write(
+        f"runs:          {report.runs} ({report.failed_runs} failed) at a concurrency of {report.concurrency}\n"
+        f"throughput:    {report.throughput:.1f} runs/s, {report.events_per_second:.0f} events/s\n"
+        f"latency:       p50 {report.latency_p50 * 1000:.1f} ms, p95 {report.latency_p95 * 1000:.1f} ms, "
+        f"p99 {report.latency_p99 * 1000:.1f} ms\n"
+        f"peak threads:  {report.peak_thread_count}\n"
+        f"peak rss:      {rss}\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
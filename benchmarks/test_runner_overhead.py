@@ -0,0 +1,65 @@
+import pytest
+from typing import Any
+
+from vellum.workflows.events.ndjson import serialize_event
+from vellum.workflows.state.encoder import to_json_bytes
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+from benchmarks.cases import CASES
+from benchmarks.harness import WorkflowBenchmarkCase, apply_patches, measure_peak_memory, run_case
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_workflow_run(benchmark: Any, case: WorkflowBenchmarkCase) -> None:
+    # Warm up class level caches, e.g. for descriptors and serializers, so that they don't skew the first round
+    run_case(case)
+
+    runs = []
+    benchmark.pedantic(lambda: runs.append(run_case(case)), rounds=20, iterations=1)
+
+    mean_latency = benchmark.stats.stats.mean
+    node_execution_count = runs[-1].node_execution_count
+    event_count = runs[-1].event_count
+    benchmark.extra_info.update(
+        {
+            "node_executions": node_execution_count,
+            "events": event_count,
+            "per_node_latency": mean_latency / max(node_execution_count, 1),
+            "events_per_second": event_count / mean_latency,
+            "peak_memory_bytes": measure_peak_memory(case),
+        }
+    )
+
+
+# Nodes that consume a streamed output are initiated with a generator as an input, which isn't serializable
+SERIALIZATION_CASES = [case for case in CASES if case.name != "streaming_node_pipeline"]
+
+
+def _run_and_capture(case: WorkflowBenchmarkCase) -> BaseWorkflow:
+    workflow = case.workflow_class()
+    with apply_patches(case):
+        for _ in workflow.stream(
+            inputs=case.inputs,
+            node_output_mocks=case.node_output_mocks,
+            event_filter=all_workflow_event_filter,
+        ):
+            pass
+
+    return workflow
+
+
+@pytest.mark.parametrize("case", SERIALIZATION_CASES, ids=[case.name for case in SERIALIZATION_CASES])
+def test_event_serialization(benchmark: Any, case: WorkflowBenchmarkCase) -> None:
+    events = list(_run_and_capture(case)._store.events)
+
+    benchmark(lambda: [serialize_event(event) for event in events])
+    benchmark.extra_info["events"] = len(events)
+
+
+@pytest.mark.parametrize("case", SERIALIZATION_CASES, ids=[case.name for case in SERIALIZATION_CASES])
+def test_state_snapshot_serialization(benchmark: Any, case: WorkflowBenchmarkCase) -> None:
+    state_snapshots = list(_run_and_capture(case)._store.state_snapshots)
+
+    benchmark(lambda: [to_json_bytes(state) for state in state_snapshots])
+    benchmark.extra_info["state_snapshots"] = len(state_snapshots)
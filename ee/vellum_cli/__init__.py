@@ -6,6 +6,7 @@ from vellum_cli.aliased_group import ClickAliasedGroup
 from vellum_cli.image_push import image_push_command
 from vellum_cli.init import init_command
 from vellum_cli.ping import ping_command
+from vellum_cli.profile import profile_command
 from vellum_cli.pull import pull_command
 from vellum_cli.push import push_command
 
@@ -374,5 +375,53 @@ def workflows_init(template_name: Optional[str] = None, target_directory: Option
     init_command(template_name=template_name, target_directory=target_directory)
 
 
+@workflows.command(name="profile")
+@click.argument("module", required=True)
+@click.option("--inputs", type=str, help="The Workflow's inputs as a JSON object, or a JSON list of them")
+@click.option(
+    "--inputs-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="A JSON file containing the Workflow's inputs as an object, or a list of them",
+)
+@click.option(
+    "--index",
+    type=int,
+    default=0,
+    help="The index of the inputs to run when a list of them is provided. Defaults to the first",
+)
+@click.option(
+    "--mocks-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="A JSON file mapping the names of Nodes to mock to the outputs they should return",
+)
+@click.option(
+    "--cprofile",
+    "cprofile_output",
+    type=click.Path(dir_okay=False),
+    help="Profiles the Workflow Runner's internals with cProfile across all of its threads, writing the stats here",
+)
+def workflows_profile(
+    module: str,
+    inputs: Optional[str],
+    inputs_file: Optional[str],
+    index: int,
+    mocks_file: Optional[str],
+    cprofile_output: Optional[str],
+) -> None:
+    """
+    Run a Workflow locally and report how long each of its Nodes took, how long they waited to be scheduled, the
+    cost of the state snapshots they triggered, and how many events and bytes of output they produced
+    """
+
+    profile_command(
+        module=module,
+        inputs=inputs,
+        inputs_file=inputs_file,
+        index=index,
+        mocks_file=mocks_file,
+        cprofile_output=cprofile_output,
+    )
+
+
 if __name__ == "__main__":
     main()
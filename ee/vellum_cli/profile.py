@@ -0,0 +1,294 @@
+import cProfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from uuid import UUID
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from dotenv import load_dotenv
+
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.outputs.base import BaseOutputs
+from vellum.workflows.runner.metrics import STATE_SNAPSHOT_DURATION, InMemoryRunnerMetrics
+from vellum.workflows.state.encoder import DefaultStateEncoder
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+from vellum_cli.logger import load_cli_logger
+
+_NODE_TERMINAL_EVENT_NAMES = {"node.execution.fulfilled", "node.execution.rejected"}
+
+
+@dataclass
+class _NodeProfile:
+    path: str
+    depth: int
+    runs: int = 0
+    self_time: float = 0.0
+    queue_wait: float = 0.0
+    snapshot_time: Optional[float] = None
+    events: int = 0
+    output_bytes: int = 0
+
+
+def _load_inputs(
+    workflow_class: Type[BaseWorkflow],
+    inputs: Optional[str],
+    inputs_file: Optional[str],
+    index: int,
+) -> Optional[BaseInputs]:
+    if inputs and inputs_file:
+        raise ValueError("Only one of --inputs and --inputs-file may be provided.")
+
+    if inputs_file:
+        with open(inputs_file) as f:
+            raw_inputs = json.load(f)
+    elif inputs:
+        raw_inputs = json.loads(inputs)
+    else:
+        return None
+
+    # Like a Workflow Sandbox, a list of inputs may be provided, from which we run the one at `index`
+    if isinstance(raw_inputs, list):
+        if not 0 <= index < len(raw_inputs):
+            raise ValueError(f"Index {index} is out of range for the {len(raw_inputs)} provided inputs.")
+        raw_inputs = raw_inputs[index]
+
+    if not isinstance(raw_inputs, dict):
+        raise ValueError("Workflow inputs must be a JSON object of input names to values.")
+
+    return workflow_class.get_inputs_class()(**raw_inputs)
+
+
+def _load_node_output_mocks(workflow_class: Type[BaseWorkflow], mocks_file: Optional[str]) -> List[BaseOutputs]:
+    if not mocks_file:
+        return []
+
+    with open(mocks_file) as f:
+        raw_mocks = json.load(f)
+
+    if not isinstance(raw_mocks, dict):
+        raise ValueError("Node mocks must be a JSON object of Node names to their mocked outputs.")
+
+    nodes_by_name = {node.__name__: node for node in workflow_class.get_nodes()}
+    node_output_mocks: List[BaseOutputs] = []
+    for node_name, outputs in raw_mocks.items():
+        node_class = nodes_by_name.get(node_name)
+        if node_class is None:
+            raise ValueError(f"Could not find a Node named '{node_name}' to mock in {workflow_class.__name__}.")
+
+        node_output_mocks.append(node_class.Outputs(**outputs))
+
+    return node_output_mocks
+
+
+@contextmanager
+def _profile_threads(output_path: Optional[str]) -> Iterator[None]:
+    """
+    Profiles the calling thread along with every thread it starts, e.g. the runner's and each Node's, merging their
+    stats into a single dump.
+    """
+
+    if not output_path:
+        yield
+        return
+
+    profilers = [cProfile.Profile()]
+    if sys.version_info < (3, 12):
+        # Before python 3.12, cProfile only profiles the thread that enabled it, so we give every new thread its own
+        # profiler, which replaces this hook the first time it's called
+        def start_thread_profiler(*args: Any) -> None:
+            profiler = cProfile.Profile()
+            profilers.append(profiler)
+            profiler.enable()
+
+        threading.setprofile(start_thread_profiler)
+
+    profilers[0].enable()
+    try:
+        yield
+    finally:
+        profilers[0].disable()
+        threading.setprofile(None)  # type: ignore[arg-type]
+        pstats.Stats(*profilers).dump_stats(output_path)
+
+
+def _get_definition_name(definition: Any) -> str:
+    # Definitions in parent contexts are serialized, rather than the classes themselves
+    return str(getattr(definition, "__name__", None) or getattr(definition, "name", definition))
+
+
+def _get_node_path(event: WorkflowEvent) -> Tuple[str, int]:
+    # Nodes within subworkflows are prefixed with the Nodes that ran them, e.g. `MapNode > Iteration`
+    names = [_get_definition_name(getattr(event.body, "node_definition"))]
+    parent = event.parent
+    while parent is not None:
+        if parent.type == "WORKFLOW_NODE":
+            names.append(_get_definition_name(getattr(parent, "node_definition")))
+        parent = parent.parent
+
+    return " > ".join(reversed(names)), len(names) - 1
+
+
+def _get_output_bytes(outputs: Any) -> int:
+    return len(json.dumps(outputs, cls=DefaultStateEncoder).encode("utf-8"))
+
+
+def _get_covered_seconds(intervals: List[Tuple[datetime, datetime]]) -> float:
+    # Subworkflows, e.g. MapNode iterations, may run concurrently, so we only count overlapping time once
+    total = 0.0
+    covered_until: Optional[datetime] = None
+    for start, end in sorted(intervals):
+        if covered_until is not None:
+            start = max(start, covered_until)
+        if end > start:
+            total += (end - start).total_seconds()
+        covered_until = end if covered_until is None else max(covered_until, end)
+
+    return total
+
+
+def _build_node_profiles(
+    events: List[WorkflowEvent],
+    metrics: InMemoryRunnerMetrics,
+    workflow_class: Type[BaseWorkflow],
+) -> List[_NodeProfile]:
+    profiles: Dict[str, _NodeProfile] = {}
+    paths_by_span_id: Dict[UUID, str] = {}
+    workflow_starts: Dict[UUID, datetime] = {}
+    # The time each Node spent running subworkflows, which we exclude from its self time
+    nested_intervals: Dict[UUID, List[Tuple[datetime, datetime]]] = {}
+
+    for event in events:
+        if event.name == "workflow.execution.initiated":
+            workflow_starts[event.span_id] = event.timestamp
+            continue
+
+        if event.name.startswith("workflow.execution.") and event.span_id in workflow_starts:
+            if event.name in {"workflow.execution.fulfilled", "workflow.execution.rejected"}:
+                if event.parent is not None and event.parent.type == "WORKFLOW_NODE":
+                    nested_intervals.setdefault(event.parent.span_id, []).append(
+                        (workflow_starts.pop(event.span_id), event.timestamp)
+                    )
+            continue
+
+        if not event.name.startswith("node."):
+            continue
+
+        if event.span_id not in paths_by_span_id:
+            path, depth = _get_node_path(event)
+            paths_by_span_id[event.span_id] = path
+            if path not in profiles:
+                profiles[path] = _NodeProfile(path=path, depth=depth)
+
+        profile = profiles[paths_by_span_id[event.span_id]]
+        profile.events += 1
+        if event.name not in _NODE_TERMINAL_EVENT_NAMES:
+            continue
+
+        profile.runs += 1
+        timings = getattr(event.body, "timings", None)
+        if timings is not None:
+            nested_time = _get_covered_seconds(nested_intervals.pop(event.span_id, []))
+            profile.self_time += max(timings.run_duration - nested_time, 0.0)
+            profile.queue_wait += timings.queue_wait
+
+        outputs = getattr(event.body, "outputs", None)
+        if outputs is not None:
+            profile.output_bytes += _get_output_bytes(outputs)
+
+    # The runner only reports metrics for the Workflow being profiled, not its subworkflows
+    for profile in profiles.values():
+        if profile.depth == 0:
+            profile.snapshot_time = sum(
+                metrics.get_histogram(STATE_SNAPSHOT_DURATION, workflow=workflow_class.__name__, node=profile.path)
+            )
+
+    return list(profiles.values())
+
+
+def _format_table(profiles: List[_NodeProfile]) -> str:
+    headers = ["Node", "Runs", "Self (ms)", "Queue wait (ms)", "Snapshots (ms)", "Events", "Output bytes"]
+    rows = [
+        [
+            profile.path,
+            str(profile.runs),
+            f"{profile.self_time * 1000:.2f}",
+            f"{profile.queue_wait * 1000:.2f}",
+            f"{profile.snapshot_time * 1000:.2f}" if profile.snapshot_time is not None else "-",
+            str(profile.events),
+            str(profile.output_bytes),
+        ]
+        for profile in profiles
+    ]
+
+    widths = [max(len(row[column]) for row in [headers, *rows]) for column in range(len(headers))]
+    lines = [
+        "  ".join(
+            cell.ljust(widths[column]) if column == 0 else cell.rjust(widths[column]) for column, cell in enumerate(row)
+        )
+        for row in [headers, *rows]
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def profile_command(
+    module: str,
+    inputs: Optional[str] = None,
+    inputs_file: Optional[str] = None,
+    index: int = 0,
+    mocks_file: Optional[str] = None,
+    cprofile_output: Optional[str] = None,
+) -> None:
+    load_dotenv(dotenv_path=os.path.join(os.getcwd(), ".env"))
+    logger = load_cli_logger()
+
+    # Allow the module to be imported relative to the current working directory
+    sys.path.insert(0, os.getcwd())
+
+    logger.info(f"Loading workflow from {module}")
+    workflow_class = BaseWorkflow.load_from_module(module)
+    workflow_inputs = _load_inputs(workflow_class, inputs, inputs_file, index)
+    node_output_mocks = _load_node_output_mocks(workflow_class, mocks_file)
+
+    metrics = InMemoryRunnerMetrics()
+    workflow = workflow_class()
+    with _profile_threads(cprofile_output):
+        started_at = time.perf_counter()
+        events = list(
+            workflow.stream(
+                inputs=workflow_inputs,
+                event_filter=all_workflow_event_filter,
+                node_output_mocks=node_output_mocks,
+                metrics=metrics,
+            )
+        )
+        duration = time.perf_counter() - started_at
+
+    terminal_event = next(
+        (event for event in reversed(events) if event.name.startswith("workflow.") and event.parent is None), None
+    )
+    status = terminal_event.name.rsplit(".", 1)[-1] if terminal_event else "unknown"
+    snapshot_durations = metrics.get_histogram(STATE_SNAPSHOT_DURATION, workflow=workflow_class.__name__)
+
+    logger.info(
+        f"""\
+Workflow {status} in {duration * 1000:.2f} ms, emitting {len(events)} events and \
+{len(snapshot_durations)} state snapshots taking {sum(snapshot_durations) * 1000:.2f} ms
+
+{_format_table(_build_node_profiles(events, metrics, workflow_class))}"""
+    )
+
+    error = getattr(terminal_event.body, "error", None) if terminal_event else None
+    if error is not None:
+        logger.error(f"Workflow rejected with: {error.message}")
+
+    if cprofile_output:
+        logger.info(f"Wrote cProfile stats to {cprofile_output}, which can be viewed with `python -m pstats`")
@@ -0,0 +1,146 @@
+import json
+import os
+import pstats
+import re
+from typing import Dict, List
+
+from click.testing import CliRunner
+
+from vellum_cli import main as cli_main
+
+
+def _ensure_workflow_py(temp_dir: str, module: str) -> None:
+    base_dir = os.path.join(temp_dir, *module.split("."))
+    os.makedirs(base_dir, exist_ok=True)
+    with open(os.path.join(base_dir, "workflow.py"), "w") as f:
+        f.write(
+            """\
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.inputs import BaseInputs
+from vellum.workflows.nodes import BaseNode
+from vellum.workflows.state import BaseState
+
+
+class Inputs(BaseInputs):
+    name: str
+
+
+class GreetNode(BaseNode):
+    name = Inputs.name
+
+    class Outputs(BaseNode.Outputs):
+        greeting: str
+
+    def run(self) -> Outputs:
+        return self.Outputs(greeting=f"Hello, {self.name}!")
+
+
+class ShoutNode(BaseNode):
+    greeting = GreetNode.Outputs.greeting
+
+    class Outputs(BaseNode.Outputs):
+        shout: str
+
+    def run(self) -> Outputs:
+        return self.Outputs(shout=self.greeting.upper())
+
+
+class ExampleWorkflow(BaseWorkflow[Inputs, BaseState]):
+    graph = GreetNode >> ShoutNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        shout = ShoutNode.Outputs.shout
+"""
+        )
+
+
+def _get_table_rows(output: str) -> Dict[str, List[str]]:
+    # Strip the CLI logger's color codes before splitting the table into cells
+    lines = re.sub(r"\x1b\[[0-9;]*m", "", output).splitlines()
+    return {line.split()[0]: line.split() for line in lines if line.startswith(("GreetNode", "ShoutNode"))}
+
+
+def test_profile__inputs(mock_module):
+    # GIVEN a Workflow module
+    _ensure_workflow_py(mock_module.temp_dir, mock_module.module)
+
+    # WHEN profiling the Workflow with a list of inputs, selecting the second
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_main,
+        [
+            "workflows",
+            "profile",
+            mock_module.module,
+            "--inputs",
+            json.dumps([{"name": "Alice"}, {"name": "Bob"}]),
+            "--index",
+            "1",
+        ],
+    )
+
+    # THEN it should succeed
+    assert result.exit_code == 0, result.output
+    assert "Workflow fulfilled" in result.output
+
+    # AND report a row for each Node
+    rows = _get_table_rows(result.output)
+    assert rows["GreetNode"][1] == "1"
+    assert rows["ShoutNode"][1] == "1"
+
+    # AND the size of each Node's outputs, based on the selected inputs
+    assert rows["ShoutNode"][-1] == str(len(json.dumps({"shout": "HELLO, BOB!"})))
+
+
+def test_profile__mocks_and_cprofile(mock_module):
+    # GIVEN a Workflow module
+    _ensure_workflow_py(mock_module.temp_dir, mock_module.module)
+
+    # AND a file of Node mocks
+    mocks_file = os.path.join(mock_module.temp_dir, "mocks.json")
+    with open(mocks_file, "w") as f:
+        json.dump({"GreetNode": {"greeting": "Mocked!"}}, f)
+
+    # WHEN profiling the Workflow with cProfile
+    cprofile_output = os.path.join(mock_module.temp_dir, "workflow.prof")
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_main,
+        [
+            "workflows",
+            "profile",
+            mock_module.module,
+            "--inputs",
+            json.dumps({"name": "Alice"}),
+            "--mocks-file",
+            mocks_file,
+            "--cprofile",
+            cprofile_output,
+        ],
+    )
+
+    # THEN it should succeed, using the mocked outputs
+    assert result.exit_code == 0, result.output
+    assert _get_table_rows(result.output)["ShoutNode"][-1] == str(len(json.dumps({"shout": "MOCKED!"})))
+
+    # AND the cProfile stats should include the Nodes, which run on their own threads
+    stats = pstats.Stats(cprofile_output)
+    profiled_functions = {function_name for _, _, function_name in stats.stats}  # type: ignore[attr-defined]
+    assert "run" in profiled_functions
+    assert "_run_work_item" in profiled_functions
+
+
+def test_profile__invalid_index(mock_module):
+    # GIVEN a Workflow module
+    _ensure_workflow_py(mock_module.temp_dir, mock_module.module)
+
+    # WHEN profiling the Workflow with an index outside of the provided inputs
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_main,
+        ["workflows", "profile", mock_module.module, "--inputs", json.dumps([{"name": "Alice"}]), "--index", "3"],
+    )
+
+    # THEN it should fail
+    assert result.exit_code == 1
+    assert str(result.exception) == "Index 3 is out of range for the 1 provided inputs."
@@ -42,10 +42,13 @@ class OnValidatePython(ValidatePythonHandlerProtocol):
         input: Any,
         *,
         strict: Optional[bool] = None,
+        extra: Optional[Literal["allow", "ignore", "forbid"]] = None,
         from_attributes: Optional[bool] = None,
         context: Optional[Dict[str, Any]] = None,
         self_instance: Optional[Any] = None,
         allow_partial: Union[bool, Literal["off", "on", "trailing-strings"]] = False,
+        by_alias: Optional[bool] = None,
+        by_name: Optional[bool] = None,
     ) -> None:
         if not isinstance(input, dict):
             return
@@ -484,6 +484,9 @@ class VellumMypyPlugin(Plugin):
         if fullname.endswith(".run"):
             return self._run_method_hook
 
+        if fullname.endswith(".resume_from_checkpoint"):
+            return self._workflow_run_method_hook
+
         if fullname.endswith(".stream"):
             return self._stream_method_hook
 
@@ -0,0 +1,210 @@
+import asyncio
+from dataclasses import dataclass
+import email.utils
+from threading import Lock
+import time
+from typing import List, Optional, Tuple
+
+import httpx
+
+from vellum.client.environment import VellumEnvironment
+
+# Matches the longest wait that the client's own retries will honor from a `retry-after` header
+MAX_PAUSE_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Allows up to `requests_per_second` requests on average, with bursts of up to `burst` requests at once.
+    """
+
+    requests_per_second: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        if self.requests_per_second <= 0:
+            raise ValueError(f"requests_per_second must be greater than 0, got {self.requests_per_second}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+
+
+class _TokenBucket:
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self._tokens = float(limit.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = Lock()
+
+    def try_acquire(self) -> float:
+        """
+        Takes a token if one is available, returning 0, or otherwise how many seconds to wait before trying again.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            elapsed = max(now - self._updated_at, 0.0)
+            self._tokens = min(self._tokens + elapsed * self.limit.requests_per_second, self.limit.burst)
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+
+            return (1 - self._tokens) / self.limit.requests_per_second
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            paused_until = time.monotonic() + min(seconds, MAX_PAUSE_SECONDS)
+            if paused_until <= self._paused_until:
+                return
+
+            # Tokens only start refilling once the pause is over, so that callers resume at the limit rather than
+            # all at once
+            self._paused_until = paused_until
+            self._updated_at = paused_until
+            self._tokens = 0.0
+
+
+def _parse_retry_after(headers: httpx.Headers) -> Optional[float]:
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+
+    retry_date = email.utils.parsedate_tz(retry_after)
+    if retry_date is None:
+        return None
+
+    return max(email.utils.mktime_tz(retry_date) - time.time(), 0.0)
+
+
+class RateLimiter:
+    """
+    A token bucket rate limiter for each of the URLs of a Vellum environment, shared by every request sent through
+    the transports that use it. Share one across clients, e.g. those of concurrent Workflow runs, to cap their
+    combined request rate.
+
+    When the API responds with a `retry-after` or `retry-after-ms` header, the URL's bucket is paused for that
+    long, so that every caller backs off together rather than each retrying on its own.
+    """
+
+    def __init__(
+        self,
+        environment: VellumEnvironment,
+        *,
+        default: Optional[RateLimit] = None,
+        predict: Optional[RateLimit] = None,
+        documents: Optional[RateLimit] = None,
+    ):
+        self._environment_urls = (environment.default, environment.predict, environment.documents)
+        self._buckets: List[Tuple[str, _TokenBucket]] = []
+        for base_url, limit in [
+            (environment.default, default),
+            (environment.predict, predict),
+            (environment.documents, documents),
+        ]:
+            # URLs that are configured more than once, e.g. when every URL points at the same host, share the bucket
+            # configured first
+            if limit is None or any(url == base_url for url, _ in self._buckets):
+                continue
+
+            self._buckets.append((base_url, _TokenBucket(limit)))
+
+    def is_for_environment(self, environment: VellumEnvironment) -> bool:
+        """
+        Whether the limiter was created for the same URLs as `environment`. Requests to any other URL aren't limited.
+        """
+
+        return self._environment_urls == (environment.default, environment.predict, environment.documents)
+
+    def _get_bucket(self, url: httpx.URL) -> Optional[_TokenBucket]:
+        request_url = str(url)
+        for base_url, bucket in self._buckets:
+            if request_url.startswith(base_url):
+                return bucket
+
+        return None
+
+    def wait(self, url: httpx.URL) -> None:
+        bucket = self._get_bucket(url)
+        if bucket is None:
+            return
+
+        while (seconds := bucket.try_acquire()) > 0:
+            time.sleep(seconds)
+
+    async def wait_async(self, url: httpx.URL) -> None:
+        bucket = self._get_bucket(url)
+        if bucket is None:
+            return
+
+        while (seconds := bucket.try_acquire()) > 0:
+            await asyncio.sleep(seconds)
+
+    def observe(self, url: httpx.URL, response: httpx.Response) -> None:
+        bucket = self._get_bucket(url)
+        if bucket is None or (response.status_code != 429 and response.status_code < 500):
+            return
+
+        retry_after = _parse_retry_after(response.headers)
+        if retry_after is None and response.status_code == 429:
+            # Without a hint from the API, we back off for as long as a single request is allowed to take
+            retry_after = 1 / bucket.limit.requests_per_second
+
+        if retry_after is not None:
+            bucket.pause(retry_after)
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """
+    An httpx transport that waits on a `RateLimiter` before sending each request, e.g.
+
+        Vellum(api_key=..., httpx_client=httpx.Client(transport=RateLimitedTransport(rate_limiter)))
+    """
+
+    def __init__(self, rate_limiter: RateLimiter, transport: Optional[httpx.BaseTransport] = None):
+        self.rate_limiter = rate_limiter
+        self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.rate_limiter.wait(request.url)
+        response = self._transport.handle_request(request)
+        self.rate_limiter.observe(request.url, response)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    The async counterpart of `RateLimitedTransport`, for use with `AsyncVellum`.
+    """
+
+    def __init__(self, rate_limiter: RateLimiter, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.rate_limiter = rate_limiter
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.rate_limiter.wait_async(request.url)
+        response = await self._transport.handle_async_request(request)
+        self.rate_limiter.observe(request.url, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
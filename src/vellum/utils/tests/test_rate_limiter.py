@@ -0,0 +1,92 @@
+import pytest
+import asyncio
+import time
+from typing import List
+
+import httpx
+
+from vellum.client.environment import VellumEnvironment
+from vellum.utils.rate_limiter import AsyncRateLimitedTransport, RateLimit, RateLimitedTransport, RateLimiter
+
+ENVIRONMENT = VellumEnvironment(
+    default="https://api.example.com",
+    predict="https://predict.example.com",
+    documents="https://documents.example.com",
+)
+
+
+def test_rate_limited_transport__limits_requests_per_url():
+    # GIVEN a rate limiter that only limits the predict URL
+    rate_limiter = RateLimiter(ENVIRONMENT, predict=RateLimit(requests_per_second=20))
+    client = httpx.Client(
+        transport=RateLimitedTransport(rate_limiter, transport=httpx.MockTransport(lambda _: httpx.Response(200)))
+    )
+
+    # WHEN we send several requests to the default URL
+    started_at = time.monotonic()
+    for _ in range(5):
+        client.get("https://api.example.com/v1/deployments")
+
+    # THEN they aren't limited
+    assert time.monotonic() - started_at < 0.1
+
+    # WHEN we send several requests to the predict URL
+    started_at = time.monotonic()
+    for _ in range(5):
+        client.post("https://predict.example.com/v1/execute-prompt")
+
+    # THEN all but the first wait for a token
+    assert time.monotonic() - started_at >= 0.19
+
+
+def test_rate_limited_transport__backs_off_on_retry_after():
+    # GIVEN an API that rate limits the first request, asking callers to wait
+    sent_at: List[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_at.append(time.monotonic())
+        if len(sent_at) == 1:
+            return httpx.Response(429, headers={"retry-after-ms": "200"})
+
+        return httpx.Response(200)
+
+    # AND a rate limiter that would otherwise allow a burst of requests
+    rate_limiter = RateLimiter(ENVIRONMENT, default=RateLimit(requests_per_second=1000, burst=10))
+    client = httpx.Client(transport=RateLimitedTransport(rate_limiter, transport=httpx.MockTransport(handler)))
+
+    # WHEN we send a request that is rate limited, followed by another
+    assert client.get("https://api.example.com/v1/deployments").status_code == 429
+    assert client.get("https://api.example.com/v1/deployments").status_code == 200
+
+    # THEN the second request waits for as long as the API asked
+    assert sent_at[1] - sent_at[0] >= 0.19
+
+
+def test_async_rate_limited_transport__limits_requests():
+    # GIVEN an async client with a rate limiter
+    rate_limiter = RateLimiter(ENVIRONMENT, default=RateLimit(requests_per_second=20, burst=2))
+
+    async def send_requests() -> float:
+        async with httpx.AsyncClient(
+            transport=AsyncRateLimitedTransport(
+                rate_limiter, transport=httpx.MockTransport(lambda _: httpx.Response(200))
+            )
+        ) as client:
+            started_at = time.monotonic()
+            await asyncio.gather(*(client.get("https://api.example.com/v1/deployments") for _ in range(4)))
+            return time.monotonic() - started_at
+
+    # WHEN we send requests concurrently
+    duration = asyncio.run(send_requests())
+
+    # THEN the requests beyond the burst wait for a token
+    assert duration >= 0.09
+
+
+def test_rate_limit__invalid():
+    # WHEN we create a rate limit that allows no requests
+    with pytest.raises(ValueError) as exc_info:
+        RateLimit(requests_per_second=0)
+
+    # THEN we get a helpful error
+    assert str(exc_info.value) == "requests_per_second must be greater than 0, got 0"
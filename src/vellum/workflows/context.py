@@ -1,10 +1,10 @@
 from contextlib import contextmanager
-import threading
+from contextvars import ContextVar
 from uuid import UUID
-from typing import Iterator, Optional, cast
+from typing import Any, Iterator, Optional, cast
 
 from vellum.client.core import UniversalBaseModel
-from vellum.workflows.events.types import ParentContext
+from vellum.workflows.events.types import BaseParentContext, ParentContext
 
 
 class ExecutionContext(UniversalBaseModel):
@@ -12,23 +12,39 @@ class ExecutionContext(UniversalBaseModel):
     trace_id: Optional[UUID] = None
 
 
-_CONTEXT_KEY = "_execution_context"
+def _create_execution_context(parent_context: Any, trace_id: Any) -> ExecutionContext:
+    # One is created every time the context is entered, almost always from values that have already been validated,
+    # so validation is only run for anything else, e.g. a parent context passed as a dict or a trace id as a str
+    is_validated = (parent_context is None or isinstance(parent_context, BaseParentContext)) and (
+        trace_id is None or isinstance(trace_id, UUID)
+    )
+    if is_validated:
+        return super(UniversalBaseModel, ExecutionContext).model_construct(
+            parent_context=parent_context, trace_id=trace_id
+        )
 
-local = threading.local()
+    return ExecutionContext(parent_context=parent_context, trace_id=trace_id)
+
+
+_EMPTY_EXECUTION_CONTEXT = ExecutionContext()
+
+# Context variables are inherited by asyncio tasks and by anything run through `contextvars.copy_context().run`,
+# such as the threads that the Workflow Runner starts for each Node
+_execution_context: ContextVar[ExecutionContext] = ContextVar("execution_context", default=_EMPTY_EXECUTION_CONTEXT)
 
 
 def get_execution_context() -> ExecutionContext:
     """Retrieve the current execution context."""
-    return getattr(local, _CONTEXT_KEY, ExecutionContext())
+    return _execution_context.get()
 
 
 def set_execution_context(context: ExecutionContext) -> None:
     """Set the current execution context."""
-    setattr(local, _CONTEXT_KEY, context)
+    _execution_context.set(context)
 
 
 def get_parent_context() -> ParentContext:
-    return cast(ParentContext, get_execution_context().parent_context)
+    return cast(ParentContext, _execution_context.get().parent_context)
 
 
 @contextmanager
@@ -36,12 +52,18 @@ def execution_context(
     parent_context: Optional[ParentContext] = None, trace_id: Optional[UUID] = None
 ) -> Iterator[None]:
     """Context manager for handling execution context."""
-    prev_context = get_execution_context()
-    set_trace_id = prev_context.trace_id or trace_id
-    set_parent_context = parent_context or prev_context.parent_context
-    set_context = ExecutionContext(parent_context=set_parent_context, trace_id=set_trace_id)
+    prev_context = _execution_context.get()
+    set_context = _create_execution_context(
+        parent_context=parent_context or prev_context.parent_context,
+        trace_id=prev_context.trace_id or trace_id,
+    )
+    token = _execution_context.set(set_context)
     try:
-        set_execution_context(set_context)
         yield
     finally:
-        set_execution_context(prev_context)
+        try:
+            _execution_context.reset(token)
+        except ValueError:
+            # The context was exited within a different context than it was entered in, e.g. by a generator that was
+            # resumed on another thread
+            _execution_context.set(prev_context)
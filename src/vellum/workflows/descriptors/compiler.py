@@ -0,0 +1,241 @@
+from collections.abc import Mapping
+import dataclasses
+import inspect
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Set, Tuple, Type, cast
+
+from pydantic import BaseModel
+
+from vellum.workflows.constants import undefined
+from vellum.workflows.descriptors.base import BaseDescriptor
+from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.expressions.and_ import AndExpression
+from vellum.workflows.expressions.coalesce_expression import CoalesceExpression
+from vellum.workflows.expressions.does_not_equal import DoesNotEqualExpression
+from vellum.workflows.expressions.equals import EqualsExpression
+from vellum.workflows.expressions.is_nil import IsNilExpression
+from vellum.workflows.expressions.is_not_nil import IsNotNilExpression
+from vellum.workflows.expressions.is_not_null import IsNotNullExpression
+from vellum.workflows.expressions.is_not_undefined import IsNotUndefinedExpression
+from vellum.workflows.expressions.is_null import IsNullExpression
+from vellum.workflows.expressions.is_undefined import IsUndefinedExpression
+from vellum.workflows.expressions.or_ import OrExpression
+from vellum.workflows.references.constant import ConstantValueReference
+
+if TYPE_CHECKING:
+    from vellum.workflows.state.base import BaseState
+
+CompiledDescriptor = Callable[["BaseState"], Any]
+
+_EXPRESSIONS_MODULE = "vellum.workflows.expressions."
+_DESCRIPTOR_METADATA_ATTRIBUTES = {"_name", "_types", "_instance"}
+
+
+def compile_descriptor(value: Any, path: str = "") -> CompiledDescriptor:
+    """
+    Compiles a value that may contain Descriptors into a closure that resolves it against a given state.
+
+    The closure is semantically equivalent to `resolve_value(value, state, path=path)`, but constant subtrees are
+    folded at compile time and common expressions are specialized into direct calls, skipping the generic dispatch
+    that `resolve_value` performs for every node of the tree. Nothing is cached here, so callers that resolve the
+    same value repeatedly should hold on to the closure, e.g. on the Port or NodeReference that the value belongs to.
+    """
+
+    folded = _fold(value)
+    if folded is not None:
+        constant_value = folded[0]
+        return lambda state: constant_value
+
+    if isinstance(value, BaseDescriptor):
+        expression_compiler = _EXPRESSION_COMPILERS.get(type(value))
+        if expression_compiler:
+            return expression_compiler(value)
+
+        return value.resolve
+
+    return lambda state: resolve_value(value, state, path=path)
+
+
+def _fold(value: Any) -> Optional[Tuple[Any]]:
+    """
+    Resolves a value at compile time if it doesn't depend on state, returning it wrapped in a tuple so
+    that falsy constants can be told apart from values that can't be folded.
+    """
+
+    if not _is_constant(value):
+        return None
+
+    try:
+        # Constant expressions never read from state, including those nested within containers
+        return (resolve_value(value, cast("BaseState", None)),)
+    except Exception:
+        # Errors are raised at resolution time, so we defer to the uncompiled path
+        return None
+
+
+def _is_constant(value: Any) -> bool:
+    """
+    Whether a value resolves to the same result regardless of state.
+    """
+
+    if inspect.isclass(value):
+        return True
+
+    if isinstance(value, ConstantValueReference):
+        return True
+
+    if isinstance(value, BaseDescriptor):
+        if not value.__class__.__module__.startswith(_EXPRESSIONS_MODULE):
+            return False
+
+        return all(
+            _is_constant(attribute_value)
+            for attribute_name, attribute_value in vars(value).items()
+            if attribute_name not in _DESCRIPTOR_METADATA_ATTRIBUTES
+        )
+
+    if isinstance(value, property) or callable(value):
+        return True
+
+    if isinstance(value, (str, bytes)):
+        return True
+
+    if dataclasses.is_dataclass(value):
+        return all(_is_constant(getattr(value, field.name)) for field in dataclasses.fields(value))
+
+    if isinstance(value, BaseModel):
+        return all(_is_constant(getattr(value, key)) for key in value.__class__.model_fields.keys())
+
+    if isinstance(value, Mapping):
+        return all(_is_constant(item) for item in value.values())
+
+    if isinstance(value, (Sequence, Set)):
+        return all(_is_constant(item) for item in value)
+
+    return True
+
+
+def _compile_and(expression: AndExpression) -> CompiledDescriptor:
+    folded_lhs = _fold(expression._lhs)
+    if folded_lhs is not None:
+        lhs = folded_lhs[0]
+        return compile_descriptor(expression._rhs) if lhs else lambda state: lhs
+
+    resolve_lhs = compile_descriptor(expression._lhs)
+    resolve_rhs = compile_descriptor(expression._rhs)
+
+    def resolve(state: "BaseState") -> Any:
+        lhs = resolve_lhs(state)
+        if lhs:
+            return resolve_rhs(state)
+
+        return lhs
+
+    return resolve
+
+
+def _compile_or(expression: OrExpression) -> CompiledDescriptor:
+    folded_lhs = _fold(expression._lhs)
+    if folded_lhs is not None:
+        lhs = folded_lhs[0]
+        return (lambda state: lhs) if lhs else compile_descriptor(expression._rhs)
+
+    resolve_lhs = compile_descriptor(expression._lhs)
+    resolve_rhs = compile_descriptor(expression._rhs)
+
+    def resolve(state: "BaseState") -> Any:
+        lhs = resolve_lhs(state)
+        if lhs:
+            return lhs
+
+        return resolve_rhs(state)
+
+    return resolve
+
+
+def _compile_coalesce(expression: CoalesceExpression) -> CompiledDescriptor:
+    folded_lhs = _fold(expression._lhs)
+    if folded_lhs is not None:
+        lhs = folded_lhs[0]
+        if lhs is not undefined and lhs is not None:
+            return lambda state: lhs
+
+        return compile_descriptor(expression._rhs)
+
+    resolve_lhs = compile_descriptor(expression._lhs)
+    resolve_rhs = compile_descriptor(expression._rhs)
+
+    def resolve(state: "BaseState") -> Any:
+        lhs = resolve_lhs(state)
+        if lhs is not undefined and lhs is not None:
+            return lhs
+
+        return resolve_rhs(state)
+
+    return resolve
+
+
+def _compile_equals(expression: EqualsExpression) -> CompiledDescriptor:
+    resolve_lhs = compile_descriptor(expression._lhs)
+    resolve_rhs = compile_descriptor(expression._rhs)
+    return lambda state: resolve_lhs(state) == resolve_rhs(state)
+
+
+def _compile_does_not_equal(expression: DoesNotEqualExpression) -> CompiledDescriptor:
+    resolve_lhs = compile_descriptor(expression._lhs)
+    resolve_rhs = compile_descriptor(expression._rhs)
+    return lambda state: resolve_lhs(state) != resolve_rhs(state)
+
+
+def _compile_is_null(expression: IsNullExpression) -> CompiledDescriptor:
+    resolve_expression = compile_descriptor(expression._expression)
+    return lambda state: resolve_expression(state) is None
+
+
+def _compile_is_not_null(expression: IsNotNullExpression) -> CompiledDescriptor:
+    resolve_expression = compile_descriptor(expression._expression)
+    return lambda state: resolve_expression(state) is not None
+
+
+def _compile_is_undefined(expression: IsUndefinedExpression) -> CompiledDescriptor:
+    resolve_expression = compile_descriptor(expression._expression)
+    return lambda state: resolve_expression(state) is undefined
+
+
+def _compile_is_not_undefined(expression: IsNotUndefinedExpression) -> CompiledDescriptor:
+    resolve_expression = compile_descriptor(expression._expression)
+    return lambda state: resolve_expression(state) is not undefined
+
+
+def _compile_is_nil(expression: IsNilExpression) -> CompiledDescriptor:
+    resolve_expression = compile_descriptor(expression._expression)
+
+    def resolve(state: "BaseState") -> bool:
+        value = resolve_expression(state)
+        return value is None or value is undefined
+
+    return resolve
+
+
+def _compile_is_not_nil(expression: IsNotNilExpression) -> CompiledDescriptor:
+    resolve_expression = compile_descriptor(expression._expression)
+
+    def resolve(state: "BaseState") -> bool:
+        value = resolve_expression(state)
+        return value is not None and value is not undefined
+
+    return resolve
+
+
+_EXPRESSION_COMPILERS: Dict[Type[BaseDescriptor], Callable[[Any], CompiledDescriptor]] = {
+    AndExpression: _compile_and,
+    OrExpression: _compile_or,
+    CoalesceExpression: _compile_coalesce,
+    EqualsExpression: _compile_equals,
+    DoesNotEqualExpression: _compile_does_not_equal,
+    IsNullExpression: _compile_is_null,
+    IsNotNullExpression: _compile_is_not_null,
+    IsUndefinedExpression: _compile_is_undefined,
+    IsNotUndefinedExpression: _compile_is_not_undefined,
+    IsNilExpression: _compile_is_nil,
+    IsNotNilExpression: _compile_is_not_nil,
+}
@@ -0,0 +1,136 @@
+import pytest
+from uuid import uuid4
+
+from vellum.workflows.constants import undefined
+from vellum.workflows.descriptors.compiler import compile_descriptor
+from vellum.workflows.descriptors.exceptions import InvalidExpressionException
+from vellum.workflows.descriptors.utils import resolve_value
+from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.ports.port import Port
+from vellum.workflows.references.constant import ConstantValueReference
+from vellum.workflows.state.base import BaseState
+
+
+class FixtureState(BaseState):
+    alpha = 1
+    beta = 2
+
+    gamma = "hello"
+    delta = "el"
+
+    eta = None
+    theta = ["baz"]
+
+
+class DummyNode(BaseNode[FixtureState]):
+    class Outputs(BaseNode.Outputs):
+        empty: str
+
+
+@pytest.mark.parametrize(
+    "descriptor",
+    [
+        FixtureState.alpha | FixtureState.beta,
+        FixtureState.alpha & FixtureState.beta,
+        FixtureState.eta & FixtureState.beta,
+        FixtureState.eta.coalesce(FixtureState.alpha),
+        DummyNode.Outputs.empty.coalesce(FixtureState.gamma),
+        FixtureState.alpha.equals(FixtureState.beta),
+        FixtureState.alpha.does_not_equal(FixtureState.beta),
+        FixtureState.alpha.less_than(FixtureState.beta),
+        FixtureState.gamma.contains(FixtureState.delta),
+        FixtureState.eta.is_null(),
+        FixtureState.alpha.is_not_null(),
+        DummyNode.Outputs.empty.is_nil(),
+        DummyNode.Outputs.empty.is_not_nil(),
+        DummyNode.Outputs.empty.is_undefined(),
+        DummyNode.Outputs.empty.is_not_undefined(),
+        FixtureState.theta[0].equals("baz"),
+        ConstantValueReference(1).equals(FixtureState.alpha) & FixtureState.gamma.begins_with("he"),
+        ConstantValueReference(0) | FixtureState.gamma,
+        ConstantValueReference(None).coalesce(FixtureState.beta),
+        ConstantValueReference("foo").equals("foo"),
+        {"foo": FixtureState.alpha, "bar": [FixtureState.beta]},
+        [ConstantValueReference(1).equals(1)],
+        {"foo": ConstantValueReference(1)},
+        "constant",
+    ],
+)
+def test_compile_descriptor__matches_resolve_value(descriptor):
+    # GIVEN a state
+    state = FixtureState()
+
+    # WHEN we compile the descriptor and resolve it against the state
+    compiled_value = compile_descriptor(descriptor)(state)
+
+    # THEN the compiled value matches the interpreted value
+    assert compiled_value == resolve_value(descriptor, state)
+
+
+def test_port__resolve_condition__compiles_once():
+    # GIVEN a port with a condition
+    port = Port.on_if(FixtureState.alpha.equals(FixtureState.beta))
+
+    # WHEN we resolve its condition twice
+    state = FixtureState()
+    assert port.resolve_condition(state) is False
+    compiled_condition = port._compiled_condition
+    state.alpha = 2
+    assert port.resolve_condition(state) is True
+
+    # THEN the condition is only compiled once, and the closure is kept on the port
+    assert compiled_condition is not None
+    assert port._compiled_condition is compiled_condition
+
+
+def test_trigger__compiled_attributes_are_kept_per_node():
+    # GIVEN a node whose attribute references a state value
+    class AttributeNode(BaseNode[FixtureState]):
+        alpha = FixtureState.alpha
+
+    # WHEN we check whether it should initiate
+    AttributeNode.Trigger.should_initiate(FixtureState(), set(), uuid4())
+
+    # THEN the compiled attribute is kept on the node's Trigger
+    compiled_attributes = AttributeNode.Trigger.__dict__["__compiled_attributes__"]
+    assert list(compiled_attributes.keys()) == ["alpha"]
+
+    # AND not on the Trigger of its base node
+    assert "__compiled_attributes__" not in BaseNode.Trigger.__dict__
+
+
+def test_compile_descriptor__short_circuits_on_constant_lhs():
+    # GIVEN an `and` expression whose LHS is a falsy constant and whose RHS would fail to resolve
+    descriptor = ConstantValueReference(False) & FixtureState.alpha.between("a", "b")
+
+    # WHEN we compile and resolve it
+    value = compile_descriptor(descriptor)(FixtureState())
+
+    # THEN the RHS is never evaluated
+    assert value is False
+
+
+def test_compile_descriptor__defers_errors_to_resolution():
+    # GIVEN a constant expression that is invalid
+    descriptor = ConstantValueReference(1).begins_with("a")
+
+    # WHEN we compile it
+    compiled = compile_descriptor(descriptor)
+
+    # THEN the error is only raised once the expression is resolved
+    with pytest.raises(InvalidExpressionException):
+        compiled(FixtureState())
+
+
+def test_compile_descriptor__reads_latest_state():
+    # GIVEN a compiled expression that depends on state
+    compiled = compile_descriptor(DummyNode.Outputs.empty.coalesce("fallback"))
+    state = FixtureState()
+    assert compiled(state) == "fallback"
+
+    # WHEN the state is updated
+    state.meta.node_outputs[DummyNode.Outputs.empty] = "hello"
+
+    # THEN the compiled expression reflects the update
+    assert compiled(state) == "hello"
+    assert compile_descriptor(DummyNode.Outputs.empty)(FixtureState()) is undefined
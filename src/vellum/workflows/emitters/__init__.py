@@ -1,5 +1,13 @@
 from .base import BaseWorkflowEmitter
+from .batching import BatchingWorkflowEmitter
+from .dispatcher import EmitterDispatcher, EmitterQueueOverflowPolicy
+from .ndjson_file import NDJSONFileEmitter, read_ndjson_events
 
 __all__ = [
     "BaseWorkflowEmitter",
+    "BatchingWorkflowEmitter",
+    "EmitterDispatcher",
+    "EmitterQueueOverflowPolicy",
+    "NDJSONFileEmitter",
+    "read_ndjson_events",
 ]
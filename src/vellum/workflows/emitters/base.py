@@ -5,6 +5,14 @@ from vellum.workflows.state.base import BaseState
 
 
 class BaseWorkflowEmitter(ABC):
+    """
+    Receives the events and state snapshots of the Workflows it's attached to.
+
+    Emitters are called from the `EmitterDispatcher`'s background thread, asynchronously to the Workflow run. They
+    share that thread, so an Emitter that blocks delays the delivery to every other Emitter, and anything still
+    queued when the process exits may never be delivered. See `EmitterDispatcher` for how to flush it.
+    """
+
     @abstractmethod
     def emit_event(self, event: WorkflowEvent) -> None:
         pass
@@ -0,0 +1,85 @@
+from abc import abstractmethod
+from threading import RLock
+import time
+from typing import List, Optional
+
+from vellum.workflows.emitters.base import BaseWorkflowEmitter
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.state.base import BaseState
+
+
+class BatchingWorkflowEmitter(BaseWorkflowEmitter):
+    """
+    An Emitter that buffers events and state snapshots, handing them off in batches. A batch is flushed once it
+    reaches `max_batch_size` items or once `max_batch_interval` seconds have passed since its first item.
+    """
+
+    max_batch_size: int = 100
+    max_batch_interval: float = 1.0
+
+    def __init__(self, max_batch_size: Optional[int] = None, max_batch_interval: Optional[float] = None):
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size
+        if max_batch_interval is not None:
+            self.max_batch_interval = max_batch_interval
+
+        self._lock = RLock()
+        self._events: List[WorkflowEvent] = []
+        self._events_started_at = 0.0
+        self._states: List[BaseState] = []
+        self._states_started_at = 0.0
+
+    @abstractmethod
+    def emit_events(self, events: List[WorkflowEvent]) -> None:
+        pass
+
+    @abstractmethod
+    def snapshot_states(self, states: List[BaseState]) -> None:
+        pass
+
+    def emit_event(self, event: WorkflowEvent) -> None:
+        with self._lock:
+            if not self._events:
+                self._events_started_at = time.monotonic()
+            self._events.append(event)
+
+            if len(self._events) >= self.max_batch_size or self._is_due(self._events_started_at):
+                self._flush_events()
+
+    def snapshot_state(self, state: BaseState) -> None:
+        with self._lock:
+            if not self._states:
+                self._states_started_at = time.monotonic()
+            self._states.append(state)
+
+            if len(self._states) >= self.max_batch_size or self._is_due(self._states_started_at):
+                self._flush_states()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_events()
+            self._flush_states()
+
+    def flush_if_due(self) -> None:
+        with self._lock:
+            if self._events and self._is_due(self._events_started_at):
+                self._flush_events()
+            if self._states and self._is_due(self._states_started_at):
+                self._flush_states()
+
+    def _is_due(self, started_at: float) -> bool:
+        return time.monotonic() - started_at >= self.max_batch_interval
+
+    def _flush_events(self) -> None:
+        if not self._events:
+            return
+
+        events, self._events = self._events, []
+        self.emit_events(events)
+
+    def _flush_states(self) -> None:
+        if not self._states:
+            return
+
+        states, self._states = self._states, []
+        self.snapshot_states(states)
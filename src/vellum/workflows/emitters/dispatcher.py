@@ -0,0 +1,241 @@
+import atexit
+from collections import deque
+from enum import Enum
+import logging
+from threading import Condition, Lock, Thread
+import time
+from weakref import WeakSet
+from typing import TYPE_CHECKING, Callable, Deque, NamedTuple, Optional, Sequence, Union
+
+from vellum.workflows.emitters.base import BaseWorkflowEmitter
+from vellum.workflows.emitters.batching import BatchingWorkflowEmitter
+
+if TYPE_CHECKING:
+    from vellum.workflows.events.workflow import WorkflowEvent
+    from vellum.workflows.state.base import BaseState
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+DEFAULT_IDLE_FLUSH_INTERVAL = 0.1
+
+
+class EmitterQueueOverflowPolicy(Enum):
+    """
+    What the dispatcher does when an item is dispatched while its queue is full.
+    """
+
+    # Wait until the dispatcher has made room in the queue
+    BLOCK = "BLOCK"
+
+    # Discard the oldest queued item to make room
+    DROP_OLDEST = "DROP_OLDEST"
+
+    # Discard the oldest queued state snapshot to make room, waiting if only events are queued
+    DROP_SNAPSHOTS_FIRST = "DROP_SNAPSHOTS_FIRST"
+
+
+class _DispatchItem(NamedTuple):
+    emitters: Sequence[BaseWorkflowEmitter]
+    value: Union["WorkflowEvent", "BaseState"]
+    is_snapshot: bool
+    dispatched_at: float
+    # Called with how long the item waited before being delivered
+    on_delivered: Optional[Callable[[float], None]]
+
+
+class EmitterDispatcher:
+    """
+    Delivers events and state snapshots to Workflow Emitters from a single background thread, shared across all
+    Workflow runs. Items are delivered in the order they are dispatched, and are held in a bounded queue whose
+    overflow behavior is governed by `overflow_policy`.
+
+    Since every Emitter is called from that one thread, one Emitter that's slow to handle an item holds up the
+    delivery of every item queued behind it, including those bound for other Emitters and other runs. Emitters that
+    make network calls should buffer them, e.g. by extending `BatchingWorkflowEmitter`.
+
+    The thread is a daemon thread, so items that are still queued when the process exits are lost, except for those
+    that the dispatcher manages to deliver within the five seconds it's given at exit. A Workflow's terminal event
+    is returned before it's been delivered, so callers that need its events delivered should call `flush()` first.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow_policy: EmitterQueueOverflowPolicy = EmitterQueueOverflowPolicy.BLOCK,
+        idle_flush_interval: float = DEFAULT_IDLE_FLUSH_INTERVAL,
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.idle_flush_interval = idle_flush_interval
+        self.dropped_items = 0
+
+        self._queue: Deque[_DispatchItem] = deque()
+        self._condition = Condition()
+        self._unfinished_items = 0
+        self._batching_emitters: WeakSet[BatchingWorkflowEmitter] = WeakSet()
+        self._thread: Optional[Thread] = None
+        self._thread_lock = Lock()
+
+    def dispatch_event(
+        self,
+        emitters: Sequence[BaseWorkflowEmitter],
+        event: "WorkflowEvent",
+        on_delivered: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self._dispatch(_DispatchItem(emitters, event, False, time.monotonic(), on_delivered))
+
+    def dispatch_state_snapshot(
+        self,
+        emitters: Sequence[BaseWorkflowEmitter],
+        state: "BaseState",
+        on_delivered: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self._dispatch(_DispatchItem(emitters, state, True, time.monotonic(), on_delivered))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every dispatched item has been delivered and every batching emitter has been flushed. Returns
+        `False` if the timeout elapsed first.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._unfinished_items:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+
+        self._flush_batching_emitters(force=True)
+        return True
+
+    def _dispatch(self, item: _DispatchItem) -> None:
+        if not item.emitters:
+            return
+
+        self._ensure_thread()
+        with self._condition:
+            while len(self._queue) >= self.max_queue_size:
+                if self.overflow_policy == EmitterQueueOverflowPolicy.DROP_OLDEST:
+                    self._drop(0)
+                elif self.overflow_policy == EmitterQueueOverflowPolicy.DROP_SNAPSHOTS_FIRST and any(
+                    queued_item.is_snapshot for queued_item in self._queue
+                ):
+                    self._drop(next(index for index, queued_item in enumerate(self._queue) if queued_item.is_snapshot))
+                else:
+                    self._condition.wait()
+
+            self._queue.append(item)
+            self._unfinished_items += 1
+            self._condition.notify_all()
+
+    def _drop(self, index: int) -> None:
+        del self._queue[index]
+        self._unfinished_items -= 1
+        if not self.dropped_items:
+            logger.warning("Emitter queue is full, dropping items according to the %s policy", self.overflow_policy)
+        self.dropped_items += 1
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+
+            self._thread = Thread(target=self._run, name="EmitterDispatcher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._condition.wait(self.idle_flush_interval)
+
+                item = self._queue.popleft() if self._queue else None
+                if item is not None:
+                    # Frees up room for callers blocked on a full queue
+                    self._condition.notify_all()
+
+            if item is None:
+                self._flush_batching_emitters(force=False)
+                continue
+
+            try:
+                self._deliver(item)
+            finally:
+                with self._condition:
+                    self._unfinished_items -= 1
+                    self._condition.notify_all()
+
+    def _deliver(self, item: _DispatchItem) -> None:
+        if item.on_delivered:
+            try:
+                item.on_delivered(time.monotonic() - item.dispatched_at)
+            except Exception:
+                logger.exception("Failed to report the delivery of a dispatched item")
+
+        for emitter in item.emitters:
+            if isinstance(emitter, BatchingWorkflowEmitter):
+                self._batching_emitters.add(emitter)
+
+            try:
+                if item.is_snapshot:
+                    emitter.snapshot_state(item.value)  # type: ignore[arg-type]
+                else:
+                    emitter.emit_event(item.value)  # type: ignore[arg-type]
+            except Exception:
+                logger.exception("Emitter %s failed to handle a dispatched item", emitter.__class__.__name__)
+
+    def _flush_batching_emitters(self, force: bool) -> None:
+        for emitter in list(self._batching_emitters):
+            try:
+                if force:
+                    emitter.flush()
+                else:
+                    emitter.flush_if_due()
+            except Exception:
+                logger.exception("Emitter %s failed to flush", emitter.__class__.__name__)
+
+
+_default_emitter_dispatcher: Optional[EmitterDispatcher] = None
+_default_emitter_dispatcher_lock = Lock()
+
+
+def get_default_emitter_dispatcher() -> EmitterDispatcher:
+    """
+    Returns the dispatcher that Workflow Runners use to deliver to their Emitters, creating it on first use.
+    """
+
+    global _default_emitter_dispatcher
+    if _default_emitter_dispatcher is not None:
+        return _default_emitter_dispatcher
+
+    with _default_emitter_dispatcher_lock:
+        if _default_emitter_dispatcher is None:
+            _default_emitter_dispatcher = EmitterDispatcher()
+        return _default_emitter_dispatcher
+
+
+def set_default_emitter_dispatcher(dispatcher: EmitterDispatcher) -> None:
+    """
+    Replaces the dispatcher used by Workflow Runners, e.g. to configure its queue size or overflow policy.
+    """
+
+    global _default_emitter_dispatcher
+    with _default_emitter_dispatcher_lock:
+        _default_emitter_dispatcher = dispatcher
+
+
+def _flush_default_emitter_dispatcher(timeout: float = 5.0) -> None:
+    # The dispatcher runs on a daemon thread, so we give it a chance to deliver what's queued before exiting
+    if _default_emitter_dispatcher is not None:
+        _default_emitter_dispatcher.flush(timeout=timeout)
+
+
+atexit.register(_flush_default_emitter_dispatcher)
@@ -0,0 +1,210 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+import gzip
+import io
+import logging
+import os
+import shutil
+import time
+from uuid import uuid4
+from typing import IO, Iterator, List, Literal, Optional
+
+from vellum.workflows.emitters.batching import BatchingWorkflowEmitter
+from vellum.workflows.events.ndjson import from_ndjson, serialize_event
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.encoder import to_json_bytes
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+SegmentCompression = Literal["gzip", "zstd"]
+
+SEGMENT_SUFFIX = ".ndjson"
+_COMPRESSED_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+class NDJSONFileEmitter(BatchingWorkflowEmitter):
+    """
+    Persists events, and optionally state snapshots, to newline delimited JSON files within `directory`.
+
+    Writes are buffered and batched. The active segment is rotated once it grows past `max_segment_bytes` or has
+    been open for `max_segment_seconds`, at which point closed segments are compressed on a background thread if
+    `compression` is set. Segment names include the process id and a per-emitter id, so that several emitters can
+    share a `directory`.
+    State snapshots are already captured by `workflow.execution.snapshotted` events, so they are only written
+    separately, as `{"state": ...}` lines, if `include_state_snapshots` is set.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        prefix: str = "events",
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_segment_seconds: Optional[float] = None,
+        compression: Optional[SegmentCompression] = None,
+        include_state_snapshots: bool = False,
+        buffer_size: int = 1024 * 1024,
+        max_batch_size: Optional[int] = None,
+        max_batch_interval: Optional[float] = None,
+    ):
+        super().__init__(max_batch_size=max_batch_size, max_batch_interval=max_batch_interval)
+
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstd compression requires the `zstandard` package to be installed")
+
+        self.directory = directory
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_seconds = max_segment_seconds
+        self.compression = compression
+        self.include_state_snapshots = include_state_snapshots
+        self.buffer_size = buffer_size
+
+        self._segment: Optional[IO[bytes]] = None
+        self._segment_path: Optional[str] = None
+        self._segment_bytes = 0
+        self._segment_opened_at = 0.0
+        self._segment_count = 0
+        self._segment_id = f"{os.getpid()}-{uuid4().hex}"
+        self._compressor: Optional[ThreadPoolExecutor] = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def emit_events(self, events: List[WorkflowEvent]) -> None:
+        self._write_lines([serialize_event(event) + b"\n" for event in events])
+
+    def snapshot_states(self, states: List[BaseState]) -> None:
+        if not self.include_state_snapshots:
+            return
+
+        self._write_lines([to_json_bytes({"state": state}) + b"\n" for state in states])
+
+    def close(self) -> None:
+        """
+        Flushes any buffered items and closes, and compresses, the active segment, waiting for every closed segment
+        to finish compressing.
+        """
+
+        with self._lock:
+            self.flush()
+            self._close_segment()
+
+            compressor, self._compressor = self._compressor, None
+
+        if compressor:
+            compressor.shutdown(wait=True)
+
+    def _write_lines(self, lines: List[bytes]) -> None:
+        for line in lines:
+            if self._should_rotate():
+                self._close_segment()
+
+            segment = self._segment or self._open_segment()
+            segment.write(line)
+            self._segment_bytes += len(line)
+
+        if self._segment:
+            self._segment.flush()
+
+    def _should_rotate(self) -> bool:
+        if not self._segment:
+            return False
+
+        if self._segment_bytes >= self.max_segment_bytes:
+            return True
+
+        return (
+            self.max_segment_seconds is not None
+            and time.monotonic() - self._segment_opened_at >= self.max_segment_seconds
+        )
+
+    def _open_segment(self) -> IO[bytes]:
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        self._segment_count += 1
+        self._segment_path = os.path.join(
+            self.directory,
+            f"{self.prefix}-{timestamp}-{self._segment_count:06d}-{self._segment_id}{SEGMENT_SUFFIX}",
+        )
+        self._segment = open(self._segment_path, "xb", buffering=self.buffer_size)
+        self._segment_bytes = 0
+        self._segment_opened_at = time.monotonic()
+        return self._segment
+
+    def _close_segment(self) -> None:
+        if not self._segment or not self._segment_path:
+            return
+
+        self._segment.close()
+        self._segment = None
+        if self.compression:
+            # Compressing can take a while, so it's kept off of the thread that's delivering events
+            if not self._compressor:
+                self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NDJSONFileEmitter")
+            compression = self._compressor.submit(_compress_segment, self._segment_path, self.compression)
+            compression.add_done_callback(_log_compression_failure)
+        self._segment_path = None
+
+
+def _compress_segment(path: str, compression: SegmentCompression) -> str:
+    compressed_path = path + _COMPRESSED_SUFFIXES[compression]
+    # Written under a temporary name, so that readers never list a partially compressed segment
+    partial_path = compressed_path + ".partial"
+    with open(path, "rb") as source, open(partial_path, "wb") as destination:
+        if compression == "gzip":
+            with gzip.GzipFile(fileobj=destination, mode="wb") as compressed:
+                shutil.copyfileobj(source, compressed)
+        else:
+            zstandard.ZstdCompressor().copy_stream(source, destination)
+
+    os.replace(partial_path, compressed_path)
+    os.remove(path)
+    return compressed_path
+
+
+def _log_compression_failure(compression: Future) -> None:
+    exception = compression.exception()
+    if exception:
+        logger.error("Failed to compress an NDJSON segment", exc_info=exception)
+
+
+def _open_segment_for_reading(path: str) -> IO[bytes]:
+    if path.endswith(_COMPRESSED_SUFFIXES["gzip"]):
+        return gzip.GzipFile(path, mode="rb")  # type: ignore[return-value]
+
+    if path.endswith(_COMPRESSED_SUFFIXES["zstd"]):
+        if zstandard is None:
+            raise ImportError("Reading zstd compressed segments requires the `zstandard` package to be installed")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True))
+
+    return open(path, "rb")
+
+
+def list_ndjson_segments(directory: str, prefix: str = "events") -> List[str]:
+    """
+    Lists the segments written by an `NDJSONFileEmitter`, oldest first.
+    """
+
+    suffixes = tuple(SEGMENT_SUFFIX + suffix for suffix in ["", *_COMPRESSED_SUFFIXES.values()])
+    return sorted(
+        os.path.join(directory, file_name)
+        for file_name in os.listdir(directory)
+        if file_name.startswith(f"{prefix}-") and file_name.endswith(suffixes)
+    )
+
+
+def read_ndjson_events(path: str, prefix: str = "events") -> Iterator[WorkflowEvent]:
+    """
+    Streams typed events back from a segment, or from every segment in a directory written by an
+    `NDJSONFileEmitter`, in the order they were written.
+    """
+
+    paths = list_ndjson_segments(path, prefix) if os.path.isdir(path) else [path]
+    for segment_path in paths:
+        with _open_segment_for_reading(segment_path) as segment:
+            yield from from_ndjson(segment)
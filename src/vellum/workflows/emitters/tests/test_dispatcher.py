@@ -0,0 +1,141 @@
+from threading import Event
+import time
+from typing import List, Optional
+
+from vellum.workflows.emitters.base import BaseWorkflowEmitter
+from vellum.workflows.emitters.batching import BatchingWorkflowEmitter
+from vellum.workflows.emitters.dispatcher import EmitterDispatcher, EmitterQueueOverflowPolicy
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.state.base import BaseState
+
+
+class RecordingEmitter(BaseWorkflowEmitter):
+    def __init__(self, gate: Optional[Event] = None):
+        self.items: List = []
+        self.gate = gate
+
+    def emit_event(self, event: WorkflowEvent) -> None:
+        if self.gate:
+            self.gate.wait()
+        self.items.append(event)
+
+    def snapshot_state(self, state: BaseState) -> None:
+        if self.gate:
+            self.gate.wait()
+        self.items.append(state)
+
+
+class RecordingBatchingEmitter(BatchingWorkflowEmitter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.event_batches: List[List] = []
+        self.state_batches: List[List] = []
+
+    def emit_events(self, events: List[WorkflowEvent]) -> None:
+        self.event_batches.append(events)
+
+    def snapshot_states(self, states: List[BaseState]) -> None:
+        self.state_batches.append(states)
+
+
+def test_emitter_dispatcher__delivers_in_order():
+    # GIVEN a dispatcher and an emitter
+    dispatcher = EmitterDispatcher()
+    emitter = RecordingEmitter()
+
+    # WHEN we dispatch a mix of events and state snapshots
+    state = BaseState()
+    dispatcher.dispatch_event([emitter], "first")  # type: ignore[arg-type]
+    dispatcher.dispatch_state_snapshot([emitter], state)
+    dispatcher.dispatch_event([emitter], "second")  # type: ignore[arg-type]
+
+    # THEN they are all delivered in order once the dispatcher is flushed
+    assert dispatcher.flush(timeout=5)
+    assert emitter.items == ["first", state, "second"]
+
+
+def test_emitter_dispatcher__survives_failing_emitters():
+    # GIVEN an emitter that fails on every event
+    class FailingEmitter(RecordingEmitter):
+        def emit_event(self, event: WorkflowEvent) -> None:
+            raise Exception("boom")
+
+    dispatcher = EmitterDispatcher()
+    emitter = RecordingEmitter()
+
+    # WHEN we dispatch events to both emitters
+    dispatcher.dispatch_event([FailingEmitter(), emitter], "first")  # type: ignore[arg-type]
+    dispatcher.dispatch_event([emitter], "second")  # type: ignore[arg-type]
+
+    # THEN the healthy emitter still receives every event
+    assert dispatcher.flush(timeout=5)
+    assert emitter.items == ["first", "second"]
+
+
+def test_emitter_dispatcher__drop_oldest():
+    # GIVEN a dispatcher with a queue of size two, whose emitter is blocked on the first item
+    dispatcher = EmitterDispatcher(max_queue_size=2, overflow_policy=EmitterQueueOverflowPolicy.DROP_OLDEST)
+    gate = Event()
+    emitter = RecordingEmitter(gate=gate)
+    dispatcher.dispatch_event([emitter], "in flight")  # type: ignore[arg-type]
+    while dispatcher._queue:
+        time.sleep(0.001)
+
+    # WHEN we dispatch more items than the queue can hold
+    for event in ["a", "b", "c"]:
+        dispatcher.dispatch_event([emitter], event)  # type: ignore[arg-type]
+    gate.set()
+
+    # THEN the oldest queued item is dropped
+    assert dispatcher.flush(timeout=5)
+    assert emitter.items == ["in flight", "b", "c"]
+    assert dispatcher.dropped_items == 1
+
+
+def test_emitter_dispatcher__drop_snapshots_first():
+    # GIVEN a dispatcher with a queue of size two, whose emitter is blocked on the first item
+    dispatcher = EmitterDispatcher(max_queue_size=2, overflow_policy=EmitterQueueOverflowPolicy.DROP_SNAPSHOTS_FIRST)
+    gate = Event()
+    emitter = RecordingEmitter(gate=gate)
+    dispatcher.dispatch_event([emitter], "in flight")  # type: ignore[arg-type]
+    while dispatcher._queue:
+        time.sleep(0.001)
+
+    # WHEN we fill the queue with an event and a snapshot, and then dispatch another event
+    state = BaseState()
+    dispatcher.dispatch_event([emitter], "a")  # type: ignore[arg-type]
+    dispatcher.dispatch_state_snapshot([emitter], state)
+    dispatcher.dispatch_event([emitter], "b")  # type: ignore[arg-type]
+    gate.set()
+
+    # THEN the snapshot is dropped instead of the event
+    assert dispatcher.flush(timeout=5)
+    assert emitter.items == ["in flight", "a", "b"]
+    assert dispatcher.dropped_items == 1
+
+
+def test_batching_emitter__flushes_by_size_and_on_flush():
+    # GIVEN a batching emitter with a batch size of two and a long interval
+    dispatcher = EmitterDispatcher()
+    emitter = RecordingBatchingEmitter(max_batch_size=2, max_batch_interval=60)
+
+    # WHEN we dispatch three events
+    for event in ["a", "b", "c"]:
+        dispatcher.dispatch_event([emitter], event)  # type: ignore[arg-type]
+
+    # THEN the first two are delivered as a batch, and the rest once the dispatcher is flushed
+    assert dispatcher.flush(timeout=5)
+    assert emitter.event_batches == [["a", "b"], ["c"]]
+    assert emitter.state_batches == []
+
+
+def test_batching_emitter__flushes_by_interval():
+    # GIVEN a batching emitter with a large batch size and no interval
+    emitter = RecordingBatchingEmitter(max_batch_size=100, max_batch_interval=0)
+
+    # WHEN we snapshot a state
+    state = BaseState()
+    emitter.snapshot_state(state)
+
+    # THEN it is delivered immediately since its batch is already due
+    assert emitter.state_batches == [[state]]
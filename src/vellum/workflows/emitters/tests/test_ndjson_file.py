@@ -0,0 +1,145 @@
+import pytest
+import os
+import threading
+
+from vellum.workflows.emitters import ndjson_file
+from vellum.workflows.emitters.dispatcher import get_default_emitter_dispatcher
+from vellum.workflows.emitters.ndjson_file import NDJSONFileEmitter, list_ndjson_segments, read_ndjson_events
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+
+class Inputs(BaseInputs):
+    greeting: str
+
+
+class GreetingNode(BaseNode):
+    greeting = Inputs.greeting
+
+    class Outputs(BaseNode.Outputs):
+        message: str
+
+    def run(self) -> Outputs:
+        return self.Outputs(message=f"{self.greeting}, World!")
+
+
+class GreetingWorkflow(BaseWorkflow[Inputs, BaseState]):
+    graph = GreetingNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        message = GreetingNode.Outputs.message
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_ndjson_file_emitter__round_trip(tmp_path, compression):
+    # GIVEN a file emitter that rotates segments after every event
+    emitter = NDJSONFileEmitter(str(tmp_path), max_segment_bytes=1, compression=compression)
+
+    # WHEN we run a workflow with it
+    workflow = GreetingWorkflow(emitters=[emitter])
+    events = list(workflow.stream(inputs=Inputs(greeting="Hello"), event_filter=all_workflow_event_filter))
+    assert get_default_emitter_dispatcher().flush(timeout=5)
+    emitter.close()
+
+    # THEN each event is written to its own segment
+    segments = list_ndjson_segments(str(tmp_path))
+    assert len(segments) == len(events)
+    if compression:
+        assert all(segment.endswith(".ndjson.gz") for segment in segments)
+
+    # AND the events are read back as typed events, in order
+    read_events = list(read_ndjson_events(str(tmp_path)))
+    assert [type(event) for event in read_events] == [type(event) for event in events]
+    assert [event.model_dump(mode="json") for event in read_events] == [
+        event.model_dump(mode="json") for event in events
+    ]
+
+    # AND definitions are resolved back to their classes
+    initiated_event = read_events[0]
+    assert initiated_event.name == "workflow.execution.initiated"
+    assert initiated_event.workflow_definition is GreetingWorkflow
+
+    fulfilled_event = read_events[-1]
+    assert fulfilled_event.name == "workflow.execution.fulfilled"
+    assert fulfilled_event.outputs == {"message": "Hello, World!"}
+
+
+def test_ndjson_file_emitter__buffers_until_flushed(tmp_path):
+    # GIVEN a file emitter with a large batch size
+    emitter = NDJSONFileEmitter(str(tmp_path), max_batch_size=100, max_batch_interval=60)
+
+    # WHEN we emit an event without flushing
+    workflow = GreetingWorkflow()
+    event = next(iter(workflow.stream(inputs=Inputs(greeting="Hello"))))
+    emitter.emit_event(event)
+
+    # THEN nothing is written yet
+    assert os.listdir(tmp_path) == []
+
+    # AND once the emitter is closed, the event is persisted
+    emitter.close()
+    assert [read_event.id for read_event in read_ndjson_events(str(tmp_path))] == [event.id]
+
+
+def test_ndjson_file_emitter__compresses_segments_in_the_background(tmp_path, mocker):
+    # GIVEN a gzip compressing file emitter, whose compression records the thread it runs on
+    compress_segment = ndjson_file._compress_segment
+    compression_threads = []
+
+    def record_compression_thread(*args):
+        compression_threads.append(threading.current_thread())
+        return compress_segment(*args)
+
+    mocker.patch("vellum.workflows.emitters.ndjson_file._compress_segment", side_effect=record_compression_thread)
+    emitter = NDJSONFileEmitter(str(tmp_path), compression="gzip")
+
+    # WHEN we emit an event and close the emitter
+    workflow = GreetingWorkflow()
+    event = next(iter(workflow.stream(inputs=Inputs(greeting="Hello"))))
+    emitter.emit_event(event)
+    emitter.close()
+
+    # THEN the segment was compressed off of the calling thread
+    assert len(compression_threads) == 1
+    assert compression_threads[0] is not threading.current_thread()
+
+    # AND only the compressed segment is left once the emitter is closed
+    segments = list_ndjson_segments(str(tmp_path))
+    assert len(segments) == 1
+    assert segments[0].endswith(".ndjson.gz")
+    assert [read_event.id for read_event in read_ndjson_events(str(tmp_path))] == [event.id]
+
+
+def test_ndjson_file_emitter__emitters_sharing_a_directory(tmp_path):
+    # GIVEN two file emitters writing to the same directory
+    first_emitter = NDJSONFileEmitter(str(tmp_path))
+    second_emitter = NDJSONFileEmitter(str(tmp_path))
+
+    # WHEN they each write an event within the same second
+    workflow = GreetingWorkflow()
+    events = list(workflow.stream(inputs=Inputs(greeting="Hello"), event_filter=all_workflow_event_filter))
+    first_emitter.emit_event(events[0])
+    second_emitter.emit_event(events[-1])
+    first_emitter.close()
+    second_emitter.close()
+
+    # THEN each writes to its own segment
+    segments = list_ndjson_segments(str(tmp_path))
+    assert len(segments) == 2
+
+    # AND both events are read back intact
+    assert sorted(str(event.id) for event in read_ndjson_events(str(tmp_path))) == sorted(
+        [str(events[0].id), str(events[-1].id)]
+    )
+
+
+def test_ndjson_file_emitter__zstd_requires_zstandard(tmp_path, mocker):
+    # GIVEN zstandard is not installed
+    mocker.patch("vellum.workflows.emitters.ndjson_file.zstandard", None)
+
+    # WHEN we create an emitter with zstd compression, THEN it fails fast
+    with pytest.raises(ImportError):
+        NDJSONFileEmitter(str(tmp_path), compression="zstd")
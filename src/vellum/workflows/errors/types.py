@@ -20,6 +20,8 @@ class WorkflowErrorCode(Enum):
     PROVIDER_ERROR = "PROVIDER_ERROR"
     USER_DEFINED_ERROR = "USER_DEFINED_ERROR"
     WORKFLOW_CANCELLED = "WORKFLOW_CANCELLED"
+    NODE_TIMEOUT = "NODE_TIMEOUT"
+    WORKFLOW_TIMEOUT = "WORKFLOW_TIMEOUT"
 
 
 @dataclass(frozen=True)
@@ -80,6 +82,8 @@ _WORKFLOW_ERROR_CODE_TO_VELLUM_ERROR_CODE: Dict[WorkflowErrorCode, VellumErrorCo
     WorkflowErrorCode.PROVIDER_ERROR: "PROVIDER_ERROR",
     WorkflowErrorCode.USER_DEFINED_ERROR: "USER_DEFINED_ERROR",
     WorkflowErrorCode.WORKFLOW_CANCELLED: "REQUEST_TIMEOUT",
+    WorkflowErrorCode.NODE_TIMEOUT: "REQUEST_TIMEOUT",
+    WorkflowErrorCode.WORKFLOW_TIMEOUT: "REQUEST_TIMEOUT",
 }
 
 
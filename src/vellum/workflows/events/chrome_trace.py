@@ -0,0 +1,223 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+from uuid import UUID
+from typing import IO, Any, Dict, Iterable, List, Optional, Union
+
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.state.store import Store
+
+_INITIATED_EVENT_NAMES = {
+    "workflow.execution.initiated",
+    "workflow.execution.resumed",
+    "node.execution.initiated",
+    "node.execution.resumed",
+}
+_TERMINAL_EVENT_NAMES = {
+    "workflow.execution.fulfilled",
+    "workflow.execution.rejected",
+    "workflow.execution.paused",
+    "node.execution.fulfilled",
+    "node.execution.rejected",
+    "node.execution.paused",
+}
+
+
+@dataclass
+class _Span:
+    span_id: UUID
+    trace_id: UUID
+    category: str
+    name: str
+    parent_span_id: Optional[UUID]
+    start: datetime
+    end: Optional[datetime] = None
+    status: str = "unfinished"
+    args: Dict[str, Any] = field(default_factory=dict)
+    track: int = 0
+
+
+def _get_definition_name(definition: Any) -> str:
+    # Events deserialized from NDJSON may hold definitions that could not be re-imported
+    if isinstance(definition, dict):
+        return str(definition.get("name"))
+
+    return getattr(definition, "__name__", str(definition))
+
+
+def _get_map_iteration_index(event: WorkflowEvent) -> Optional[int]:
+    # MapNode runs its subworkflow once per item, with the item's index as one of the subworkflow's inputs
+    if event.name != "workflow.execution.initiated" or not event.parent or event.parent.type != "WORKFLOW_NODE":
+        return None
+
+    inputs = getattr(event.body, "inputs", None)
+    index = getattr(inputs, "index", None)
+    if isinstance(index, int) and hasattr(inputs, "all_items"):
+        return index
+
+    return None
+
+
+def _to_microseconds(timestamp: datetime) -> float:
+    return timestamp.timestamp() * 1_000_000
+
+
+def _collect_spans(events: Iterable[WorkflowEvent]) -> List[_Span]:
+    spans: Dict[UUID, _Span] = {}
+    last_timestamp: Optional[datetime] = None
+
+    for event in events:
+        last_timestamp = event.timestamp if last_timestamp is None else max(last_timestamp, event.timestamp)
+
+        if event.name in _INITIATED_EVENT_NAMES:
+            if event.span_id in spans:
+                # A resumed span continues the span it was paused from
+                spans[event.span_id].end = None
+                spans[event.span_id].status = "unfinished"
+                continue
+
+            is_workflow_event = event.name.startswith("workflow.")
+            definition = getattr(event.body, "workflow_definition" if is_workflow_event else "node_definition")
+            name = _get_definition_name(definition)
+            map_iteration_index = _get_map_iteration_index(event)
+            if map_iteration_index is not None:
+                name = f"{name}[{map_iteration_index}]"
+
+            spans[event.span_id] = _Span(
+                span_id=event.span_id,
+                trace_id=event.trace_id,
+                category="workflow" if is_workflow_event else "node",
+                name=name,
+                parent_span_id=event.parent.span_id if event.parent else None,
+                start=event.timestamp,
+            )
+            continue
+
+        span = spans.get(event.span_id)
+        if span is None or event.name not in _TERMINAL_EVENT_NAMES:
+            continue
+
+        span.end = event.timestamp
+        span.status = event.name.rsplit(".", 1)[-1]
+        error = getattr(event.body, "error", None)
+        if error is not None:
+            span.args["error"] = error.message
+
+        timings = getattr(event.body, "timings", None)
+        if timings is not None:
+            span.args.update(
+                queue_wait_ms=timings.queue_wait * 1000,
+                time_to_first_output_ms=(
+                    timings.time_to_first_output * 1000 if timings.time_to_first_output is not None else None
+                ),
+            )
+
+    # Spans without a terminal event, e.g. from a run that crashed or is still in progress, end with the stream
+    for span in spans.values():
+        if span.end is None:
+            span.end = last_timestamp
+
+    return sorted(spans.values(), key=lambda span: (span.start, -(span.end or span.start).timestamp()))
+
+
+def _assign_tracks(spans: List[_Span]) -> None:
+    """
+    Lays spans out on tracks such that spans on a track are always properly nested. Children share their parent's
+    track unless a sibling is still running on it, in which case they move to the lowest free track.
+
+    Spans must be sorted by start time.
+    """
+
+    spans_by_id = {span.span_id: span for span in spans}
+    # Each track is a stack of the spans currently open on it
+    tracks: List[List[_Span]] = []
+
+    for span in spans:
+        for track in tracks:
+            while track and track[-1].end is not None and span.end is not None and track[-1].end <= span.start:
+                track.pop()
+
+        parent = spans_by_id.get(span.parent_span_id) if span.parent_span_id else None
+        if parent is not None and tracks[parent.track] and tracks[parent.track][-1] is parent:
+            span.track = parent.track
+        else:
+            span.track = next((index for index, track in enumerate(tracks) if not track), len(tracks))
+            if span.track == len(tracks):
+                tracks.append([])
+
+        tracks[span.track].append(span)
+
+
+def to_chrome_trace(events: Union[Iterable[WorkflowEvent], Store]) -> Dict[str, Any]:
+    """
+    Converts a stream of events, or the events held by a Store, into the Chrome Trace Event format, which can be
+    opened with Perfetto (https://ui.perfetto.dev) or `chrome://tracing`.
+
+    Workflows, Nodes, and MapNode iterations are rendered as nested spans, with one process per trace. Each Node runs
+    on its own thread, so concurrently running spans are laid out on separate tracks, with flow arrows linking spans
+    to parents on another track. To include subworkflow spans, stream the Workflow with `all_workflow_event_filter`.
+    """
+
+    spans = _collect_spans(events.events if isinstance(events, Store) else events)
+    _assign_tracks(spans)
+
+    process_ids: Dict[UUID, int] = {}
+    spans_by_id = {span.span_id: span for span in spans}
+    trace_events: List[Dict[str, Any]] = []
+    named_tracks = set()
+
+    for span in spans:
+        if span.trace_id not in process_ids:
+            process_ids[span.trace_id] = len(process_ids) + 1
+            trace_events.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": process_ids[span.trace_id],
+                    "args": {"name": f"{span.name} ({span.trace_id})"},
+                }
+            )
+
+        pid = process_ids[span.trace_id]
+        if (pid, span.track) not in named_tracks:
+            named_tracks.add((pid, span.track))
+            trace_events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": span.track,
+                    "args": {"name": f"Track {span.track}"},
+                }
+            )
+
+        start = _to_microseconds(span.start)
+        end = _to_microseconds(span.end or span.start)
+        trace_events.append(
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": start,
+                "dur": end - start,
+                "pid": pid,
+                "tid": span.track,
+                "args": {"span_id": str(span.span_id), "status": span.status, **span.args},
+            }
+        )
+
+        parent = spans_by_id.get(span.parent_span_id) if span.parent_span_id else None
+        if parent is not None and parent.track != span.track:
+            flow = {"name": "spawn", "cat": span.category, "id": str(span.span_id), "pid": pid, "ts": start}
+            trace_events.append({**flow, "ph": "s", "tid": parent.track})
+            trace_events.append({**flow, "ph": "f", "bp": "e", "tid": span.track})
+
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(events: Union[Iterable[WorkflowEvent], Store], stream: IO[str]) -> None:
+    """
+    Writes the Chrome Trace Event JSON for a stream of events, or the events held by a Store, to a text stream.
+    """
+
+    json.dump(to_chrome_trace(events), stream)
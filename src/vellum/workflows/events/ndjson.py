@@ -0,0 +1,170 @@
+from datetime import datetime
+import json
+from uuid import UUID
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Type, Union, get_args
+
+from vellum.core.pydantic_utilities import UniversalBaseModel
+from vellum.workflows.errors import WorkflowError
+from vellum.workflows.events.node import NodeExecutionTimings
+from vellum.workflows.events.types import ParentContext
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.references.node import NodeReference
+from vellum.workflows.types.utils import get_class_by_qualname
+
+_EVENT_CLASSES_BY_NAME: Dict[str, Type[Any]] = {
+    event_class.model_fields["name"].default: event_class
+    for union in get_args(WorkflowEvent)
+    for event_class in (get_args(union) or (union,))
+}
+_DEFINITION_FIELDS = {"workflow_definition", "node_definition"}
+
+# ParentContext is an annotated, discriminated union of parent context models
+_PARENT_CONTEXT_CLASSES_BY_TYPE: Dict[str, Type[Any]] = {
+    parent_class.model_fields["type"].default: parent_class for parent_class in get_args(get_args(ParentContext)[0])
+}
+
+
+def serialize_event(event: WorkflowEvent) -> bytes:
+    """
+    Serializes an event into JSON bytes, equivalent to `event.model_dump(mode="json")` without building the
+    intermediate dictionary or string.
+    """
+
+    return event.__pydantic_serializer__.to_json(event)
+
+
+def to_ndjson(events: Iterable[WorkflowEvent]) -> Iterator[bytes]:
+    """
+    Lazily serializes a stream of events into newline delimited JSON, yielding one line per event.
+    """
+
+    for event in events:
+        yield serialize_event(event) + b"\n"
+
+
+def write_ndjson(events: Iterable[WorkflowEvent], stream: IO[bytes]) -> int:
+    """
+    Writes a stream of events to a binary stream as newline delimited JSON, returning the number of events written.
+    """
+
+    count = 0
+    for line in to_ndjson(events):
+        stream.write(line)
+        count += 1
+
+    return count
+
+
+def _construct(model_class: Type[Any], **fields: Any) -> Any:
+    # `UniversalBaseModel.model_construct` evaluates every annotation, which fails on the forward references to
+    # Node and Workflow classes, so we skip straight to pydantic's unvalidated constructor
+    return super(UniversalBaseModel, model_class).model_construct(**fields)
+
+
+def _resolve_definition(definition: Any) -> Any:
+    if not isinstance(definition, dict):
+        return definition
+
+    try:
+        return get_class_by_qualname(".".join([*definition["module"], definition["name"]]))
+    except (ImportError, AttributeError, KeyError, ValueError):
+        # Definitions that are no longer importable, e.g. ones declared within a function, are left serialized
+        return definition
+
+
+def _resolve_node_inputs(node_definition: Type[Any], inputs: Dict[str, Any]) -> Dict[Any, Any]:
+    node_inputs = {}
+    for name, value in inputs.items():
+        node_reference = getattr(node_definition, name, None)
+        if not isinstance(node_reference, NodeReference) or node_reference.name != name:
+            # Node inputs are keyed by descriptor, so we only resolve them if every key can be resolved
+            return inputs
+
+        node_inputs[node_reference] = value
+
+    return node_inputs
+
+
+def _deserialize_timestamp(timestamp: str) -> datetime:
+    # `datetime.fromisoformat` only accepts a trailing `Z` starting in python 3.11
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+
+    return datetime.fromisoformat(timestamp)
+
+
+def _deserialize_parent(parent: Optional[Dict[str, Any]]) -> Any:
+    if parent is None:
+        return None
+
+    return _PARENT_CONTEXT_CLASSES_BY_TYPE[parent["type"]](**parent)
+
+
+def _deserialize_body(body_class: Type[Any], body: Dict[str, Any]) -> Any:
+    fields = dict(body)
+    for field_name in _DEFINITION_FIELDS & fields.keys():
+        fields[field_name] = _resolve_definition(fields[field_name])
+
+    if isinstance(fields.get("output"), dict):
+        fields["output"] = BaseOutput(**fields["output"])
+
+    if isinstance(fields.get("error"), dict):
+        fields["error"] = WorkflowError(**fields["error"])
+
+    if isinstance(fields.get("timings"), dict):
+        fields["timings"] = NodeExecutionTimings(**fields["timings"])
+
+    node_definition = fields.get("node_definition")
+    if isinstance(node_definition, type):
+        invoked_ports = fields.get("invoked_ports")
+        if invoked_ports is not None:
+            node_ports = getattr(node_definition, "Ports")
+            fields["invoked_ports"] = {getattr(node_ports, port["name"]) for port in invoked_ports}
+
+        if isinstance(fields.get("inputs"), dict):
+            fields["inputs"] = _resolve_node_inputs(node_definition, fields["inputs"])
+
+    return _construct(body_class, **fields)
+
+
+def deserialize_event(data: Union[bytes, str, Dict[str, Any]]) -> WorkflowEvent:
+    """
+    Rebuilds a typed event from its JSON serialization.
+
+    Node and Workflow definitions are re-imported, while values whose types aren't recorded in the serialization,
+    such as inputs, outputs, and state, are left as JSON compatible python.
+    """
+
+    event_data = data if isinstance(data, dict) else json.loads(data)
+    event_class = _EVENT_CLASSES_BY_NAME[event_data["name"]]
+    body_class = event_class.model_fields["body"].annotation
+    body_class = getattr(body_class, "__pydantic_generic_metadata__", {}).get("origin") or body_class
+
+    return _construct(
+        event_class,
+        id=UUID(event_data["id"]),
+        timestamp=_deserialize_timestamp(event_data["timestamp"]),
+        api_version=event_data["api_version"],
+        trace_id=UUID(event_data["trace_id"]),
+        span_id=UUID(event_data["span_id"]),
+        parent=_deserialize_parent(event_data.get("parent")),
+        name=event_data["name"],
+        body=_deserialize_body(body_class, event_data["body"]),
+    )
+
+
+def from_ndjson(lines: Iterable[Union[bytes, str]]) -> Iterator[WorkflowEvent]:
+    """
+    Lazily deserializes newline delimited JSON into typed events, skipping blank lines and lines that aren't events.
+    """
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        data = json.loads(line)
+        if data.get("name") not in _EVENT_CLASSES_BY_NAME:
+            continue
+
+        yield deserialize_event(data)
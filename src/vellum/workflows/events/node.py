@@ -30,9 +30,24 @@ class _BaseNodeExecutionBody(UniversalBaseModel):
         serialized = super().serialize_model(handler)  # type: ignore[call-arg, arg-type]
         if "invoked_ports" in serialized and serialized["invoked_ports"] is None:
             del serialized["invoked_ports"]
+        if "timings" in serialized and serialized["timings"] is None:
+            del serialized["timings"]
         return serialized
 
 
+class NodeExecutionTimings(UniversalBaseModel):
+    """
+    How long, in seconds, a Node execution spent in each phase, as measured by the Workflow Runner.
+    """
+
+    # From the Node becoming ready to run until it was initiated
+    queue_wait: float
+    # From the Node being initiated until it streamed its first output, if it streamed any
+    time_to_first_output: Optional[float] = None
+    # From the Node being initiated until it was fulfilled or rejected
+    run_duration: float
+
+
 class _BaseNodeEvent(BaseEvent):
     body: _BaseNodeExecutionBody
 
@@ -94,6 +109,7 @@ class NodeExecutionFulfilledBody(_BaseNodeExecutionBody, Generic[OutputsType]):
     outputs: OutputsType
     invoked_ports: InvokedPorts = None
     mocked: Optional[bool] = None
+    timings: Optional[NodeExecutionTimings] = None
 
     @field_serializer("outputs")
     def serialize_outputs(self, outputs: OutputsType, _info: Any) -> Dict[str, Any]:
@@ -122,9 +138,14 @@ class NodeExecutionFulfilledEvent(_BaseNodeEvent, Generic[OutputsType]):
     def mocked(self) -> Optional[bool]:
         return self.body.mocked
 
+    @property
+    def timings(self) -> Optional[NodeExecutionTimings]:
+        return self.body.timings
+
 
 class NodeExecutionRejectedBody(_BaseNodeExecutionBody):
     error: WorkflowError
+    timings: Optional[NodeExecutionTimings] = None
 
 
 class NodeExecutionRejectedEvent(_BaseNodeEvent):
@@ -135,6 +156,10 @@ class NodeExecutionRejectedEvent(_BaseNodeEvent):
     def error(self) -> WorkflowError:
         return self.body.error
 
+    @property
+    def timings(self) -> Optional[NodeExecutionTimings]:
+        return self.body.timings
+
 
 class NodeExecutionPausedBody(_BaseNodeExecutionBody):
     pass
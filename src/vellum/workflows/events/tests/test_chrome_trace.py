@@ -0,0 +1,95 @@
+import io
+import json
+import time
+from typing import Any, Dict, List
+
+from vellum.workflows.events.chrome_trace import to_chrome_trace, write_chrome_trace
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.core.map_node.node import MapNode
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+
+class SlowNode(BaseNode):
+    def run(self) -> BaseNode.Outputs:
+        time.sleep(0.01)
+        return self.Outputs()
+
+
+class OtherSlowNode(SlowNode):
+    pass
+
+
+@MapNode.wrap(items=[1, 2])
+class IterationNode(BaseNode):
+    item = MapNode.SubworkflowInputs.item
+
+    class Outputs(BaseNode.Outputs):
+        value: int
+
+    def run(self) -> Outputs:
+        time.sleep(0.01)
+        return self.Outputs(value=self.item)
+
+
+class TracedWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+    graph = {SlowNode, OtherSlowNode, IterationNode}
+
+
+def _get_spans(trace):
+    return [trace_event for trace_event in trace["traceEvents"] if trace_event["ph"] == "X"]
+
+
+def test_to_chrome_trace__nested_and_concurrent_spans():
+    # GIVEN the events of a workflow with concurrent nodes and a map node
+    events = list(TracedWorkflow().stream(event_filter=all_workflow_event_filter))
+
+    # WHEN we convert them into a chrome trace
+    trace = to_chrome_trace(events)
+
+    # THEN every workflow, node, and map node iteration is a span
+    spans = _get_spans(trace)
+    assert sorted(span["name"] for span in spans) == [
+        "IterationNode",
+        "IterationNode",
+        "MapNode",
+        "OtherSlowNode",
+        "SlowNode",
+        "Subworkflow[0]",
+        "Subworkflow[1]",
+        "TracedWorkflow",
+    ]
+    spans_by_name = {span["name"]: span for span in spans}
+    assert all(span["args"]["status"] == "fulfilled" for span in spans_by_name.values())
+
+    # AND the concurrently running nodes are on separate tracks
+    assert len({spans_by_name[name]["tid"] for name in ["SlowNode", "OtherSlowNode", "MapNode"]}) == 3
+
+    # AND spans sharing a track are properly nested
+    spans_by_track: Dict[int, List[Dict[str, Any]]] = {}
+    for span in sorted(_get_spans(trace), key=lambda span: (span["ts"], -span["dur"])):
+        open_spans = spans_by_track.setdefault(span["tid"], [])
+        while open_spans and open_spans[-1]["ts"] + open_spans[-1]["dur"] <= span["ts"]:
+            open_spans.pop()
+        if open_spans:
+            assert span["ts"] + span["dur"] <= open_spans[-1]["ts"] + open_spans[-1]["dur"]
+        open_spans.append(span)
+
+    # AND node spans include their timings
+    assert spans_by_name["SlowNode"]["args"]["queue_wait_ms"] >= 0
+
+
+def test_write_chrome_trace__from_store():
+    # GIVEN a workflow that has been run
+    workflow = TracedWorkflow()
+    workflow.run()
+
+    # WHEN we write the trace of its stored events
+    stream = io.StringIO()
+    write_chrome_trace(workflow._store, stream)
+
+    # THEN the trace is valid JSON with a span for the workflow
+    trace = json.loads(stream.getvalue())
+    assert "TracedWorkflow" in {span["name"] for span in _get_spans(trace)}
@@ -1,11 +1,14 @@
 import pytest
 from datetime import datetime
+from io import BytesIO
+import json
 from uuid import UUID
 
 from deepdiff import DeepDiff
 
 from vellum.workflows.constants import undefined
 from vellum.workflows.errors.types import WorkflowError, WorkflowErrorCode
+from vellum.workflows.events.ndjson import write_ndjson
 from vellum.workflows.events.node import (
     NodeExecutionFulfilledBody,
     NodeExecutionFulfilledEvent,
@@ -33,6 +36,7 @@ from vellum.workflows.state.base import BaseState
 from vellum.workflows.types.core import VellumSecret
 from vellum.workflows.utils.uuids import uuid4_from_hash
 from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
 
 
 class MockInputs(BaseInputs):
@@ -419,3 +423,20 @@ mock_node_uuid = str(uuid4_from_hash(MockNode.__qualname__))
 )
 def test_event_serialization(event, expected_json):
     assert not DeepDiff(event.model_dump(mode="json"), expected_json)
+
+
+def test_event_ndjson_serialization():
+    # GIVEN a stream of events from a workflow
+    events = list(MockWorkflow().stream(inputs=MockInputs(foo="bar"), event_filter=all_workflow_event_filter))
+
+    # WHEN we write them as newline delimited JSON
+    stream = BytesIO()
+    count = write_ndjson(events, stream)
+
+    # THEN each event is written on its own line
+    lines = stream.getvalue().splitlines()
+    assert count == len(events) == len(lines)
+
+    # AND each line matches the event's JSON serialization
+    for event, line in zip(events, lines):
+        assert not DeepDiff(json.loads(line), event.model_dump(mode="json"))
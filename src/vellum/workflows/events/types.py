@@ -1,12 +1,11 @@
 from datetime import datetime
-import json
 from uuid import UUID, uuid4
 from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
 from pydantic import BeforeValidator, Field
 
 from vellum.core.pydantic_utilities import UniversalBaseModel
-from vellum.workflows.state.encoder import DefaultStateEncoder
+from vellum.workflows.state.encoder import to_json_compatible
 from vellum.workflows.types.utils import datetime_now
 
 
@@ -38,12 +37,7 @@ def serialize_type_encoder_with_id(obj: type) -> Dict[str, Any]:
 
 
 def default_serializer(obj: Any) -> Any:
-    return json.loads(
-        json.dumps(
-            obj,
-            cls=DefaultStateEncoder,
-        )
-    )
+    return to_json_compatible(obj)
 
 
 class CodeResourceDefinition(UniversalBaseModel):
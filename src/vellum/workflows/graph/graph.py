@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Iterator, List, Set, Type, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Set, Type, Union
 
 from orderly_set import OrderedSet
 
@@ -26,13 +26,18 @@ GraphTarget = Union[
 
 class Graph:
     _entrypoints: Set["Port"]
-    _edges: List[Edge]
+    _edges: OrderedSet[Edge]
+    _edge_nodes: OrderedSet[Type["BaseNode"]]
     _terminals: Set["Port"]
 
-    def __init__(self, entrypoints: Set["Port"], edges: List[Edge], terminals: Set["Port"]):
-        self._edges = edges
+    def __init__(self, entrypoints: Set["Port"], edges: Iterable[Edge], terminals: Set["Port"]):
+        # Edges and the nodes they connect are kept in insertion ordered sets, so that deduplicating them stays
+        # constant time as graphs with thousands of nodes are assembled one `>>` at a time
+        self._edges = OrderedSet()
+        self._edge_nodes = OrderedSet()
         self._entrypoints = entrypoints
         self._terminals = terminals
+        self._extend_edges(edges)
 
     @staticmethod
     def from_port(port: "Port") -> "Graph":
@@ -63,7 +68,7 @@ class Graph:
                 entrypoints.update({target})
                 terminals.update({target})
 
-        return Graph(entrypoints=entrypoints, edges=list(edges), terminals=terminals)
+        return Graph(entrypoints=entrypoints, edges=edges, terminals=terminals)
 
     @staticmethod
     def from_edge(edge: Edge) -> "Graph":
@@ -134,23 +139,16 @@ class Graph:
 
     @property
     def nodes(self) -> Iterator[Type["BaseNode"]]:
-        nodes = set()
         if not self._edges:
-            for node in self.entrypoints:
-                if node not in nodes:
-                    nodes.add(node)
-                    yield node
-            return
-
-        for edge in self._edges:
-            if edge.from_port.node_class not in nodes:
-                nodes.add(edge.from_port.node_class)
-                yield edge.from_port.node_class
-            if edge.to_node not in nodes:
-                nodes.add(edge.to_node)
-                yield edge.to_node
-
-    def _extend_edges(self, edges: Iterator[Edge]) -> None:
+            return iter(OrderedSet(self.entrypoints))
+
+        return iter(self._edge_nodes)
+
+    def _extend_edges(self, edges: Iterable[Edge]) -> None:
         for edge in edges:
-            if edge not in self._edges:
-                self._edges.append(edge)
+            if edge in self._edges:
+                continue
+
+            self._edges.add(edge)
+            self._edge_nodes.add(edge.from_port.node_class)
+            self._edge_nodes.add(edge.to_node)
@@ -1,3 +1,5 @@
+from typing import List, Type
+
 from vellum.workflows.edges.edge import Edge
 from vellum.workflows.graph.graph import Graph
 from vellum.workflows.nodes.bases.base import BaseNode
@@ -484,3 +486,25 @@ def test_graph__set_to_graph():
 
     # AND two edges
     assert len(list(graph.edges)) == 2
+
+
+def test_graph__large_chain_preserves_order():
+    # GIVEN thousands of nodes
+    nodes: List[Type[BaseNode]] = [type(f"Node{i}", (BaseNode,), {"__module__": __name__}) for i in range(3000)]
+
+    # WHEN we chain them together one `>>` at a time, as generated workflows do
+    graph = Graph.from_node(nodes[0])
+    for node in nodes[1:]:
+        graph = graph >> node
+
+    # AND merge it with a graph that connects the first two nodes again
+    graph = Graph.from_set({graph, nodes[0] >> nodes[1]})
+
+    # THEN the repeated edge is only kept once
+    edges = list(graph.edges)
+    assert len(edges) == 2999
+
+    # AND the edges and nodes are in the order they were defined
+    assert edges[0] == Edge(from_port=nodes[0].Ports.default, to_node=nodes[1])
+    assert edges[-1] == Edge(from_port=nodes[-2].Ports.default, to_node=nodes[-1])
+    assert list(graph.nodes) == nodes
@@ -7,6 +7,7 @@ from typing import Any, Dict, Generic, Iterator, Optional, Set, Tuple, Type, Typ
 
 from vellum.workflows.constants import undefined
 from vellum.workflows.descriptors.base import BaseDescriptor
+from vellum.workflows.descriptors.compiler import CompiledDescriptor, compile_descriptor
 from vellum.workflows.descriptors.utils import is_unresolved, resolve_value
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
@@ -263,6 +264,23 @@ class BaseNode(Generic[StateType], metaclass=BaseNodeMeta):
         node_class: Type["BaseNode"]
         merge_behavior = MergeBehavior.AWAIT_ATTRIBUTES
 
+        @classmethod
+        def _get_compiled_attribute(cls, descriptor: NodeReference) -> CompiledDescriptor:
+            # Compiled attributes live on the Trigger class itself, so they're released along with the Node
+            compiled_attributes: Dict[str, Tuple[NodeReference, CompiledDescriptor]] = cls.__dict__.get(
+                "__compiled_attributes__", {}
+            )
+            if "__compiled_attributes__" not in cls.__dict__:
+                setattr(cls, "__compiled_attributes__", compiled_attributes)
+
+            cached = compiled_attributes.get(descriptor.name)
+            if cached is not None and cached[0] is descriptor:
+                return cached[1]
+
+            compiled = compile_descriptor(descriptor.instance, path=descriptor.name)
+            compiled_attributes[descriptor.name] = (descriptor, compiled)
+            return compiled
+
         @classmethod
         def should_initiate(
             cls,
@@ -282,7 +300,7 @@ class BaseNode(Generic[StateType], metaclass=BaseNodeMeta):
                     if not descriptor.instance:
                         continue
 
-                    resolved_value = resolve_value(descriptor.instance, state, path=descriptor.name)
+                    resolved_value = cls._get_compiled_attribute(descriptor)(state)
                     if is_unresolved(resolved_value):
                         return False
 
@@ -310,6 +328,14 @@ class BaseNode(Generic[StateType], metaclass=BaseNodeMeta):
     class Execution(metaclass=_BaseNodeExecutionMeta):
         node_class: Type["BaseNode"]
         count: int
+        # The max number of seconds the Node may run for before it's cancelled and rejected with `NODE_TIMEOUT`
+        timeout: Optional[float] = None
+        # The names of the resource pools that the Node takes a slot in while it runs, which cap how many Nodes
+        # across every Workflow in the process may use a resource at once. See `configure_resource_pools`
+        resource_pools: Tuple[str, ...] = ()
+        # Once the Workflow's `max_concurrency` is reached, ready Nodes with a higher priority run first. Nodes of
+        # the same priority run in order of the longest path of Nodes left to run after them
+        priority: int = 0
 
     def __init__(
         self,
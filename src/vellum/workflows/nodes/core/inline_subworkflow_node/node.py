@@ -10,7 +10,6 @@ from vellum.workflows.nodes.bases.base import BaseNode, BaseNodeMeta
 from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
 from vellum.workflows.references import OutputReference
 from vellum.workflows.state.base import BaseState
-from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.types.core import EntityInputsInterface
 from vellum.workflows.types.generics import InputsType, StateType
 from vellum.workflows.workflows.event_filters import all_workflow_event_filter
@@ -74,12 +73,11 @@ class InlineSubworkflowNode(
         with execution_context(parent_context=get_parent_context()):
             subworkflow = self.subworkflow(
                 parent_state=self.state,
-                context=WorkflowContext(vellum_client=self._context.vellum_client),
+                context=self._context._create_subworkflow_context(),
             )
             subworkflow_stream = subworkflow.stream(
                 inputs=self._compile_subworkflow_inputs(),
                 event_filter=all_workflow_event_filter,
-                node_output_mocks=self._context._get_all_node_output_mocks(),
             )
 
         outputs: Optional[BaseOutputs] = None
@@ -1,4 +1,7 @@
 import pytest
+import threading
+from unittest import mock
+from typing import List
 
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases.base import BaseNode
@@ -6,6 +9,7 @@ from vellum.workflows.nodes.core.inline_subworkflow_node.node import InlineSubwo
 from vellum.workflows.nodes.core.try_node.node import TryNode
 from vellum.workflows.outputs.base import BaseOutput
 from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.workflows.base import BaseWorkflow
 
 
@@ -87,3 +91,66 @@ def test_inline_subworkflow_node__nested_try():
     # THEN we only have the outer node's outputs
     valid_events = [e for e in events if e.name == "bar"]
     assert len(valid_events) == len(events)
+
+
+def test_inline_subworkflow_node__runs_subworkflow_inline():
+    # GIVEN a subworkflow whose node records the threads that are running alongside it
+    class ThreadRecordingNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            thread_names: List[str]
+
+        def run(self) -> Outputs:
+            return self.Outputs(thread_names=[thread.name for thread in threading.enumerate()])
+
+    class ThreadRecordingSubworkflow(BaseWorkflow):
+        graph = ThreadRecordingNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            thread_names = ThreadRecordingNode.Outputs.thread_names
+
+    # AND a workflow that runs it with an inline subworkflow node
+    class SubworkflowNode(InlineSubworkflowNode):
+        subworkflow = ThreadRecordingSubworkflow
+
+    class ParentWorkflow(BaseWorkflow):
+        graph = SubworkflowNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            thread_names = SubworkflowNode.Outputs.thread_names
+
+    # WHEN the workflow is run
+    terminal_event = ParentWorkflow().run()
+
+    # THEN the subworkflow was dispatched on the subworkflow node's thread, without a stream thread of its own
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert "ParentWorkflow.stream_thread" in terminal_event.outputs.thread_names
+    assert "ThreadRecordingSubworkflow.stream_thread" not in terminal_event.outputs.thread_names
+
+
+def test_inline_subworkflow_node__shares_vellum_client():
+    # GIVEN a parent workflow context with a vellum client
+    vellum_client = mock.Mock()
+    context = WorkflowContext(vellum_client=vellum_client)
+
+    # AND a subworkflow whose node uses the vellum client
+    class ClientNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            is_parent_client: bool
+
+        def run(self) -> Outputs:
+            return self.Outputs(is_parent_client=self._context.vellum_client is vellum_client)
+
+    class ClientSubworkflow(BaseWorkflow):
+        graph = ClientNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            is_parent_client = ClientNode.Outputs.is_parent_client
+
+    class SubworkflowNode(InlineSubworkflowNode):
+        subworkflow = ClientSubworkflow
+
+    # WHEN the node is run
+    outputs = list(SubworkflowNode(context=context).run())
+
+    # THEN the subworkflow's node used the parent's client
+    assert outputs == [BaseOutput(name="is_parent_client", value=True)]
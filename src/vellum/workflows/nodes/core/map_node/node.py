@@ -1,4 +1,5 @@
 from collections import defaultdict
+from contextvars import copy_context
 import logging
 from queue import Empty, Queue
 from threading import Thread
@@ -17,7 +18,6 @@ from typing import (
     overload,
 )
 
-from vellum.workflows.context import ExecutionContext, execution_context, get_execution_context
 from vellum.workflows.descriptors.base import BaseDescriptor
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.events.workflow import is_workflow_event
@@ -28,7 +28,6 @@ from vellum.workflows.nodes.utils import create_adornment
 from vellum.workflows.outputs import BaseOutputs
 from vellum.workflows.outputs.base import BaseOutput
 from vellum.workflows.references.output import OutputReference
-from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.types.generics import StateType
 from vellum.workflows.workflows.event_filters import all_workflow_event_filter
 
@@ -79,13 +78,13 @@ class MapNode(BaseAdornmentNode[StateType], Generic[StateType, MapNodeItemType])
         fulfilled_iterations: List[bool] = []
         for index, item in enumerate(self.items):
             fulfilled_iterations.append(False)
-            current_execution_context = get_execution_context()
+            # Each iteration runs within a copy of this thread's context, so that it shares its execution context
             thread = Thread(
-                target=self._context_run_subworkflow,
+                target=copy_context().run,
+                args=(self._run_subworkflow,),
                 kwargs={
                     "item": item,
                     "index": index,
-                    "current_execution_context": current_execution_context,
                 },
             )
             if self.max_concurrency is None:
@@ -106,13 +105,6 @@ class MapNode(BaseAdornmentNode[StateType], Generic[StateType, MapNodeItemType])
             while map_node_event := self._event_queue.get():
                 index = map_node_event[0]
                 subworkflow_event = map_node_event[1]
-                self._context._emit_subworkflow_event(subworkflow_event)
-
-                if not is_workflow_event(subworkflow_event):
-                    continue
-
-                if subworkflow_event.workflow_definition != self.subworkflow:
-                    continue
 
                 if subworkflow_event.name == "workflow.execution.initiated":
                     for output_name in mapped_items.keys():
@@ -162,28 +154,24 @@ class MapNode(BaseAdornmentNode[StateType], Generic[StateType, MapNodeItemType])
         for output_name, output_list in mapped_items.items():
             yield BaseOutput(name=output_name, value=output_list)
 
-    def _context_run_subworkflow(
-        self, *, item: MapNodeItemType, index: int, current_execution_context: ExecutionContext
-    ) -> None:
-        parent_context = current_execution_context.parent_context
-        trace_id = current_execution_context.trace_id
-        with execution_context(parent_context=parent_context, trace_id=trace_id):
-            self._run_subworkflow(item=item, index=index)
-
     def _run_subworkflow(self, *, item: MapNodeItemType, index: int) -> None:
-        context = WorkflowContext(vellum_client=self._context.vellum_client)
+        # Every iteration reads the same items, so they're shared rather than copied into each iteration's inputs
+        context = self._context._create_subworkflow_context(shared_inputs=[self.items])
         subworkflow = self.subworkflow(
             parent_state=self.state,
             context=context,
         )
         events = subworkflow.stream(
             inputs=self.SubworkflowInputs(index=index, item=item, all_items=self.items),
-            node_output_mocks=self._context._get_all_node_output_mocks(),
             event_filter=all_workflow_event_filter,
         )
 
         for event in events:
-            self._event_queue.put((index, event))
+            # Iterations forward their events to the parent Workflow themselves, only handing the events of their
+            # own subworkflow back to the Map Node
+            self._context._emit_subworkflow_event(event)
+            if is_workflow_event(event) and event.workflow_definition == self.subworkflow:
+                self._event_queue.put((index, event))
 
     def _start_thread(self) -> bool:
         if self._concurrency_queue.empty():
@@ -1,4 +1,5 @@
 import time
+from typing import Dict
 
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases import BaseNode
@@ -116,3 +117,42 @@ def test_map_node__inner_try():
     # THEN the workflow should succeed
     assert outputs[-1].name == "final_output"
     assert len(outputs[-1].value) == 2
+
+
+def test_map_node__items_are_copied_into_each_iteration():
+    # GIVEN a node that mutates the item it's given
+    class MutatingNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+        all_items = MapNode.SubworkflowInputs.all_items
+
+        class Outputs(BaseNode.Outputs):
+            value: int
+            all_items_id: int
+
+        def run(self) -> Outputs:
+            item: Dict[str, int] = self.item
+            item["value"] += 10
+            return self.Outputs(value=item["value"], all_items_id=id(self.all_items))
+
+    class MutatingWorkflow(BaseWorkflow[MapNode.SubworkflowInputs, BaseState]):
+        graph = MutatingNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            value = MutatingNode.Outputs.value
+            all_items_id = MutatingNode.Outputs.all_items_id
+
+    # AND a map node over mutable items referencing that workflow
+    class MutatingMapNode(MapNode):
+        items = [{"value": 1}, {"value": 2}]
+        subworkflow = MutatingWorkflow
+
+    # WHEN the node is run
+    node = MutatingMapNode()
+    outputs = {output.name: output.value for output in node.run() if output.is_fulfilled}
+
+    # THEN each iteration mutated its own copy of its item
+    assert outputs["value"] == [11, 12]
+    assert node.items == [{"value": 1}, {"value": 2}]
+
+    # AND every iteration shares the map node's items rather than copying them
+    assert outputs["all_items_id"] == [id(node.items), id(node.items)]
@@ -9,7 +9,6 @@ from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases import BaseNode
 from vellum.workflows.nodes.bases.base_adornment_node import BaseAdornmentNode
 from vellum.workflows.nodes.utils import create_adornment
-from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.types.generics import StateType
 
 
@@ -38,14 +37,13 @@ class RetryNode(BaseAdornmentNode[StateType], Generic[StateType]):
 
         for index in range(self.max_attempts):
             attempt_number = index + 1
-            context = WorkflowContext(vellum_client=self._context.vellum_client)
+            context = self._context._create_subworkflow_context()
             subworkflow = self.subworkflow(
                 parent_state=self.state,
                 context=context,
             )
             terminal_event = subworkflow.run(
                 inputs=self.SubworkflowInputs(attempt_number=attempt_number),
-                node_output_mocks=self._context._get_all_node_output_mocks(),
             )
             if terminal_event.name == "workflow.execution.fulfilled":
                 node_outputs = self.Outputs()
@@ -60,6 +58,8 @@ class RetryNode(BaseAdornmentNode[StateType], Generic[StateType]):
                     code=WorkflowErrorCode.INVALID_OUTPUTS,
                     message=f"Subworkflow unexpectedly paused on attempt {attempt_number}",
                 )
+            elif terminal_event.error.code == WorkflowErrorCode.WORKFLOW_CANCELLED:
+                raise NodeException(terminal_event.error.message, code=terminal_event.error.code)
             elif self.retry_on_error_code and self.retry_on_error_code != terminal_event.error.code:
                 raise NodeException(
                     code=WorkflowErrorCode.INVALID_OUTPUTS,
@@ -9,7 +9,6 @@ from vellum.workflows.nodes.bases.base_adornment_node import BaseAdornmentNode
 from vellum.workflows.nodes.utils import create_adornment
 from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
 from vellum.workflows.references.output import OutputReference
-from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.types.generics import StateType
 from vellum.workflows.workflows.event_filters import all_workflow_event_filter
 
@@ -32,11 +31,10 @@ class TryNode(BaseAdornmentNode[StateType], Generic[StateType]):
         with execution_context(parent_context=parent_context):
             subworkflow = self.subworkflow(
                 parent_state=self.state,
-                context=WorkflowContext(vellum_client=self._context.vellum_client),
+                context=self._context._create_subworkflow_context(),
             )
             subworkflow_stream = subworkflow.stream(
                 event_filter=all_workflow_event_filter,
-                node_output_mocks=self._context._get_all_node_output_mocks(),
             )
 
         outputs: Optional[BaseOutputs] = None
@@ -66,7 +64,10 @@ class TryNode(BaseAdornmentNode[StateType], Generic[StateType]):
                     message="Subworkflow unexpectedly paused within Try Node",
                 )
             elif event.name == "workflow.execution.rejected":
-                if self.on_error_code and self.on_error_code != event.error.code:
+                if event.error.code == WorkflowErrorCode.WORKFLOW_CANCELLED:
+                    # Cancellation is never handled, so that it reaches the Workflow that was cancelled
+                    exception = NodeException(code=event.error.code, message=event.error.message)
+                elif self.on_error_code and self.on_error_code != event.error.code:
                     exception = NodeException(
                         code=WorkflowErrorCode.INVALID_OUTPUTS,
                         message=f"""Unexpected rejection: {event.error.code.value}.
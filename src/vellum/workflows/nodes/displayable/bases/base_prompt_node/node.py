@@ -21,6 +21,9 @@ class BasePromptNode(BaseNode, Generic[StateType]):
     class Trigger(BaseNode.Trigger):
         merge_behavior = MergeBehavior.AWAIT_ANY
 
+    class Execution(BaseNode.Execution):
+        resource_pools = ("llm",)
+
     class Outputs(BaseOutputs):
         results: List[PromptOutput]
 
@@ -42,26 +45,30 @@ class BasePromptNode(BaseNode, Generic[StateType]):
         except ApiError as e:
             self._handle_api_error(e)
 
-        # We don't use the INITIATED event anyway, so we can just skip it
-        # and use the exception handling to catch other api level errors
-        try:
-            next(prompt_event_stream)
-        except ApiError as e:
-            self._handle_api_error(e)
-
         outputs: Optional[List[PromptOutput]] = None
-        for event in prompt_event_stream:
-            if event.state == "INITIATED":
-                continue
-            elif event.state == "STREAMING":
-                yield BaseOutput(name="results", delta=event.output.value)
-            elif event.state == "FULFILLED":
-                outputs = event.outputs
-                yield BaseOutput(name="results", value=event.outputs)
-            elif event.state == "REJECTED":
-                workflow_error = vellum_error_to_workflow_error(event.error)
-                raise NodeException.of(workflow_error)
+        # Cancelling the Node closes the stream right away, rather than once its next event arrives
+        with self._context._closing_on_cancel(prompt_event_stream):
+            # We don't use the INITIATED event anyway, so we can just skip it
+            # and use the exception handling to catch other api level errors
+            try:
+                next(prompt_event_stream)
+            except ApiError as e:
+                self._handle_api_error(e)
+
+            for event in prompt_event_stream:
+                self._context._raise_if_cancelled()
+                if event.state == "INITIATED":
+                    continue
+                elif event.state == "STREAMING":
+                    yield BaseOutput(name="results", delta=event.output.value)
+                elif event.state == "FULFILLED":
+                    outputs = event.outputs
+                    yield BaseOutput(name="results", value=event.outputs)
+                elif event.state == "REJECTED":
+                    workflow_error = vellum_error_to_workflow_error(event.error)
+                    raise NodeException.of(workflow_error)
 
+        self._context._raise_if_cancelled()
         return outputs
 
     def _handle_api_error(self, e: ApiError):
@@ -85,6 +85,9 @@ class BaseSearchNode(BaseNode[StateType], Generic[StateType]):
     class Trigger(BaseNode.Trigger):
         merge_behavior = MergeBehavior.AWAIT_ANY
 
+    class Execution(BaseNode.Execution):
+        resource_pools = ("search",)
+
     class Outputs(BaseOutputs):
         """
         The outputs of the SearchNode.
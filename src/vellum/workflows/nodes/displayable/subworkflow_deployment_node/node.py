@@ -155,44 +155,50 @@ class SubworkflowDeploymentNode(BaseNode[StateType], Generic[StateType]):
         except ApiError as e:
             self._handle_api_error(e)
 
-        # We don't use the INITIATED event anyway, so we can just skip it
-        # and use the exception handling to catch other api level errors
-        try:
-            next(subworkflow_stream)
-        except ApiError as e:
-            self._handle_api_error(e)
-
         outputs: Optional[List[WorkflowOutput]] = None
         fulfilled_output_names: Set[str] = set()
-        for event in subworkflow_stream:
-            if event.type != "WORKFLOW":
-                continue
-            if event.data.state == "INITIATED":
-                continue
-            elif event.data.state == "STREAMING":
-                if event.data.output:
-                    if event.data.output.state == "STREAMING":
-                        yield BaseOutput(
-                            name=event.data.output.name,
-                            delta=event.data.output.delta,
+        # Cancelling the Node closes the connection to the Workflow Deployment right away, rather than once its next
+        # event arrives, and it's closed once the Node is done rather than left streaming in the background
+        with self._context._closing_on_cancel(subworkflow_stream):
+            # We don't use the INITIATED event anyway, so we can just skip it
+            # and use the exception handling to catch other api level errors
+            try:
+                next(subworkflow_stream)
+            except ApiError as e:
+                self._handle_api_error(e)
+
+            for event in subworkflow_stream:
+                self._context._raise_if_cancelled()
+                if event.type != "WORKFLOW":
+                    continue
+                if event.data.state == "INITIATED":
+                    continue
+                elif event.data.state == "STREAMING":
+                    if event.data.output:
+                        if event.data.output.state == "STREAMING":
+                            yield BaseOutput(
+                                name=event.data.output.name,
+                                delta=event.data.output.delta,
+                            )
+                        elif event.data.output.state == "FULFILLED":
+                            yield BaseOutput(
+                                name=event.data.output.name,
+                                value=event.data.output.value,
+                            )
+                            fulfilled_output_names.add(event.data.output.name)
+                elif event.data.state == "FULFILLED":
+                    outputs = event.data.outputs
+                elif event.data.state == "REJECTED":
+                    error = event.data.error
+                    if not error:
+                        raise NodeException(
+                            message="Expected to receive an error from REJECTED event",
+                            code=WorkflowErrorCode.INTERNAL_ERROR,
                         )
-                    elif event.data.output.state == "FULFILLED":
-                        yield BaseOutput(
-                            name=event.data.output.name,
-                            value=event.data.output.value,
-                        )
-                        fulfilled_output_names.add(event.data.output.name)
-            elif event.data.state == "FULFILLED":
-                outputs = event.data.outputs
-            elif event.data.state == "REJECTED":
-                error = event.data.error
-                if not error:
-                    raise NodeException(
-                        message="Expected to receive an error from REJECTED event",
-                        code=WorkflowErrorCode.INTERNAL_ERROR,
-                    )
-                workflow_error = workflow_event_error_to_workflow_error(error)
-                raise NodeException.of(workflow_error)
+                    workflow_error = workflow_event_error_to_workflow_error(error)
+                    raise NodeException.of(workflow_error)
+
+        self._context._raise_if_cancelled()
 
         if outputs is None:
             raise NodeException(
@@ -1,9 +1,11 @@
-from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Type
 
+from orderly_set import OrderedSet
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
 from vellum.workflows.descriptors.base import BaseDescriptor
+from vellum.workflows.descriptors.compiler import CompiledDescriptor, compile_descriptor
 from vellum.workflows.descriptors.exceptions import InvalidExpressionException
 from vellum.workflows.edges.edge import Edge
 from vellum.workflows.errors.types import WorkflowErrorCode
@@ -19,7 +21,7 @@ if TYPE_CHECKING:
 class Port:
     node_class: Type["BaseNode"]
 
-    _edges: List[Edge]
+    _edges: OrderedSet[Edge]
     _condition: Optional[BaseDescriptor]
     _condition_type: Optional[ConditionType]
 
@@ -33,9 +35,10 @@ class Port:
         self.default = default
         self.node_class = None  # type: ignore[assignment]
         self._fork_state = fork_state
-        self._edges = []
+        self._edges = OrderedSet()
         self._condition: Optional[BaseDescriptor] = condition
         self._condition_type: Optional[ConditionType] = condition_type
+        self._compiled_condition: Optional[CompiledDescriptor] = None
 
     def __set_name__(self, owner: Type, name: str) -> None:
         self.name = name
@@ -67,8 +70,7 @@ class Port:
             return Graph.from_port(self) >> Graph.from_port(other)
 
         edge = Edge(from_port=self, to_node=other)
-        if edge not in self._edges:
-            self._edges.append(edge)
+        self._edges.add(edge)
 
         return Graph.from_edge(edge)
 
@@ -89,7 +91,10 @@ class Port:
             if self._condition is None:
                 return False
 
-            value = self._condition.resolve(state)
+            if self._compiled_condition is None:
+                self._compiled_condition = compile_descriptor(self._condition)
+
+            value = self._compiled_condition(state)
             return bool(value)
         except InvalidExpressionException as e:
             raise NodeException(
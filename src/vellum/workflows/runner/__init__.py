@@ -1,5 +1,12 @@
-from .runner import WorkflowRunner
+from .metrics import BaseRunnerMetrics, InMemoryRunnerMetrics
+from .resource_pools import ResourcePool, configure_resource_pools
+from .runner import DeltaCoalescingWindow, WorkflowRunner
 
 __all__ = [
+    "BaseRunnerMetrics",
+    "DeltaCoalescingWindow",
+    "InMemoryRunnerMetrics",
+    "ResourcePool",
     "WorkflowRunner",
+    "configure_resource_pools",
 ]
@@ -0,0 +1,206 @@
+from collections import defaultdict
+from collections.abc import Mapping
+from copy import deepcopy
+import dataclasses
+import inspect
+from queue import Queue
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from vellum.workflows.constants import undefined
+from vellum.workflows.descriptors.base import BaseDescriptor
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.outputs.base import BaseOutputs
+from vellum.workflows.references.lazy import LazyReference
+from vellum.workflows.references.output import OutputReference
+from vellum.workflows.references.state_value import StateValueReference
+from vellum.workflows.references.workflow_input import WorkflowInputReference
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.store import Store
+from vellum.workflows.types.generics import StateType
+
+if TYPE_CHECKING:
+    from vellum.workflows.workflows.base import BaseWorkflow
+
+PreviousRunArg = Union[BaseState, Store]
+
+
+def _iter_descriptors(value: Any, visited: Set[int]) -> Iterator[BaseDescriptor]:
+    if inspect.isclass(value) or isinstance(value, (str, bytes)):
+        return
+
+    if isinstance(value, (BaseDescriptor, BaseModel)) or dataclasses.is_dataclass(value):
+        if id(value) in visited:
+            return
+        visited.add(id(value))
+
+    if isinstance(value, LazyReference):
+        yield value
+        if not isinstance(value._get, str):
+            yield from _iter_descriptors(value._get(), visited)
+    elif isinstance(value, BaseDescriptor):
+        yield value
+        for attribute_value in vars(value).values():
+            yield from _iter_descriptors(attribute_value, visited)
+    elif isinstance(value, BaseModel):
+        for attribute_value in value.__dict__.values():
+            yield from _iter_descriptors(attribute_value, visited)
+    elif dataclasses.is_dataclass(value):
+        for field in dataclasses.fields(value):
+            yield from _iter_descriptors(getattr(value, field.name), visited)
+    elif isinstance(value, Mapping):
+        for key, item in value.items():
+            yield from _iter_descriptors(key, visited)
+            yield from _iter_descriptors(item, visited)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            yield from _iter_descriptors(item, visited)
+
+
+def get_node_references(node: Type[BaseNode]) -> Iterator[BaseDescriptor]:
+    """
+    Yields every descriptor that a Node's attributes and port conditions reference, including those nested within
+    expressions and collections.
+    """
+
+    visited: Set[int] = set()
+    for reference in node:
+        yield from _iter_descriptors(reference.instance, visited)
+
+    for port in node.Ports:
+        yield from _iter_descriptors(port._condition, visited)
+
+
+def get_affected_nodes(
+    workflow_class: Type["BaseWorkflow"],
+    changed_inputs: Iterable[str],
+    changed_state: Iterable[str] = (),
+) -> Set[Type[BaseNode]]:
+    """
+    Returns the Nodes of the Workflow that reference any of the named inputs or state values, along with every Node
+    that transitively references the outputs of one of them.
+
+    Only the descriptors that a Node is defined with are considered. Values that a Node reads or writes within its
+    `run` method, e.g. through `self.state`, aren't visible to this analysis.
+    """
+
+    changed_input_names = set(changed_inputs)
+    changed_state_names = set(changed_state)
+    nodes = list(workflow_class.get_nodes())
+    nodes_by_output_name = {str(output): node for node in nodes for output in node.Outputs}
+
+    affected_nodes: Set[Type[BaseNode]] = set()
+    dependents: Dict[Type[BaseNode], Set[Type[BaseNode]]] = defaultdict(set)
+    for node in nodes:
+        for descriptor in get_node_references(node):
+            if isinstance(descriptor, WorkflowInputReference):
+                if descriptor.name in changed_input_names:
+                    affected_nodes.add(node)
+            elif isinstance(descriptor, StateValueReference):
+                if descriptor.name in changed_state_names:
+                    affected_nodes.add(node)
+            elif isinstance(descriptor, (OutputReference, LazyReference)):
+                upstream_node = nodes_by_output_name.get(str(descriptor))
+                if upstream_node is not None and upstream_node is not node:
+                    dependents[upstream_node].add(node)
+
+    pending_nodes = list(affected_nodes)
+    while pending_nodes:
+        for dependent in dependents[pending_nodes.pop()]:
+            if dependent not in affected_nodes:
+                affected_nodes.add(dependent)
+                pending_nodes.append(dependent)
+
+    return affected_nodes
+
+
+def _get_previous_state(previous_run: PreviousRunArg) -> BaseState:
+    if isinstance(previous_run, BaseState):
+        return previous_run
+
+    # Like `BaseWorkflow.get_most_recent_state`, later snapshots win ties, since they were taken after the others
+    most_recent_state: Optional[BaseState] = None
+    for state_snapshot in previous_run.state_snapshots:
+        if most_recent_state is None or state_snapshot.meta.updated_ts >= most_recent_state.meta.updated_ts:
+            most_recent_state = state_snapshot
+
+    if most_recent_state is None:
+        raise ValueError("Cannot run incrementally from a Store without any state snapshots")
+
+    return most_recent_state
+
+
+def _get_state_values(state: BaseState) -> Dict[str, Any]:
+    return {key: value for key, value in state if isinstance(key, str) and not key.startswith("_") and key != "meta"}
+
+
+def _get_changed_names(previous_values: Dict[str, Any], values: Dict[str, Any]) -> Set[str]:
+    return {
+        name
+        for name in previous_values.keys() | values.keys()
+        if previous_values.get(name, undefined) != values.get(name, undefined)
+    }
+
+
+def prepare_incremental_run(
+    workflow: "BaseWorkflow[Any, StateType]",
+    previous_run: PreviousRunArg,
+    inputs: BaseInputs,
+    state: Optional[StateType] = None,
+) -> Tuple[StateType, List[BaseOutputs]]:
+    """
+    Compares the inputs, and the state values if provided, with those of a previous run of the Workflow, returning
+    the state to start the new run from along with the outputs to replay for each Node that's unaffected by the
+    changes. Nodes that are affected, that didn't run before, or that ran more than once, e.g. within a loop, run
+    as usual.
+
+    The new run starts from the same state as a fresh run would, i.e. from `state` if provided or from the default
+    state otherwise, so that the Nodes that run again don't apply their writes on top of their previous run's. Only
+    the outputs of the other Nodes are replayed. Values that the previous run wrote to its state, and that differ from
+    the new run's, count as changed, since the Nodes that wrote them may not run again to write them.
+    """
+
+    previous_state = _get_previous_state(previous_run)
+    state_class = workflow.get_state_class()
+    if not isinstance(previous_state, state_class):
+        raise ValueError(
+            f"Cannot run {workflow.__class__.__name__} incrementally from the state of a different Workflow, "
+            f"expected {state_class.__name__} but got {previous_state.__class__.__name__}"
+        )
+
+    if state is not None:
+        initial_state = deepcopy(state)
+        initial_state.meta.workflow_inputs = inputs
+    else:
+        initial_state = workflow.get_default_state(inputs)
+
+    previous_input_values = {reference.name: value for reference, value in previous_state.meta.workflow_inputs}
+    input_values = {reference.name: value for reference, value in inputs}
+
+    affected_nodes = get_affected_nodes(
+        workflow.__class__,
+        changed_inputs=_get_changed_names(previous_input_values, input_values),
+        changed_state=_get_changed_names(_get_state_values(previous_state), _get_state_values(initial_state)),
+    )
+
+    node_execution_cache = previous_state.meta.node_execution_cache
+    replayed_outputs: List[BaseOutputs] = []
+    for node in workflow.get_nodes():
+        if node in affected_nodes or node_execution_cache.get_execution_count(node) != 1:
+            continue
+
+        output_values = {}
+        for output in node.Outputs:
+            value = previous_state.meta.node_outputs.get(output, undefined)
+            if value is not undefined:
+                output_values[output.name] = value
+
+        # Outputs that were still streaming when the previous run ended are incomplete, so the Node runs again
+        if any(isinstance(value, Queue) for value in output_values.values()):
+            continue
+
+        replayed_outputs.append(node.Outputs(**output_values))
+
+    return initial_state, replayed_outputs
@@ -0,0 +1,81 @@
+from threading import Lock
+import tracemalloc
+from typing import Any, Optional
+
+_lock = Lock()
+_tracing_users = 0
+_started_tracing = False
+_active_measurements = 0
+
+
+def start_memory_tracing() -> None:
+    """
+    Starts `tracemalloc` if it isn't already tracing. Calls are reference counted, so tracing is only stopped once
+    every caller has called `stop_memory_tracing`, and never if it was started by someone else.
+    """
+
+    global _tracing_users, _started_tracing
+    with _lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracing_users += 1
+
+
+def stop_memory_tracing() -> None:
+    global _tracing_users, _started_tracing
+    with _lock:
+        _tracing_users = max(_tracing_users - 1, 0)
+        if _tracing_users == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+class MemoryMeasurement:
+    """
+    Measures the memory allocated between `start` and `stop`, as traced by `tracemalloc`. Nothing is measured if
+    `tracemalloc` isn't tracing when the measurement starts.
+
+    `tracemalloc` traces the whole process, so measurements that overlap, e.g. those of Nodes running concurrently,
+    include each other's allocations. The peak of overlapping measurements is taken since the earliest of them
+    started, which makes it an upper bound. Run with `max_concurrency=1` for exact per Node attribution.
+    """
+
+    def __init__(self) -> None:
+        # The most memory allocated at once during the measurement, relative to when it started
+        self.peak_bytes = 0
+        # The memory allocated during the measurement that was still allocated when it ended. Negative if more was
+        # freed than allocated
+        self.retained_bytes = 0
+        self._allocated_before: Optional[int] = None
+
+    def start(self) -> None:
+        global _active_measurements
+        if not tracemalloc.is_tracing():
+            return
+
+        with _lock:
+            if _active_measurements == 0:
+                tracemalloc.reset_peak()
+            _active_measurements += 1
+            self._allocated_before, _ = tracemalloc.get_traced_memory()
+
+    def stop(self) -> None:
+        global _active_measurements
+        if self._allocated_before is None:
+            return
+
+        with _lock:
+            allocated_after, peak = tracemalloc.get_traced_memory()
+            _active_measurements -= 1
+
+        self.peak_bytes = max(peak - self._allocated_before, 0)
+        self.retained_bytes = allocated_after - self._allocated_before
+        self._allocated_before = None
+
+    def __enter__(self) -> "MemoryMeasurement":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
@@ -0,0 +1,88 @@
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+MetricTags = Dict[str, str]
+_TagsKey = FrozenSet[Tuple[str, str]]
+
+# Histograms, in seconds. State snapshot metrics are also tagged with the Node that triggered them, if any
+NODE_QUEUE_WAIT = "node.queue_wait"
+NODE_RESOURCE_POOL_WAIT = "node.resource_pool_wait"
+NODE_TIME_TO_FIRST_OUTPUT = "node.time_to_first_output"
+NODE_RUN_DURATION = "node.run_duration"
+CONCURRENCY_QUEUE_WAIT = "runner.concurrency_queue_wait"
+STATE_SNAPSHOT_DURATION = "runner.state_snapshot_duration"
+EMITTER_LAG = "runner.emitter_lag"
+
+# Histograms, in bytes, only reported when memory profiling is enabled
+NODE_PEAK_BYTES = "node.peak_bytes"
+NODE_RETAINED_BYTES = "node.retained_bytes"
+STATE_SNAPSHOT_PEAK_BYTES = "runner.state_snapshot_peak_bytes"
+STATE_SNAPSHOT_RETAINED_BYTES = "runner.state_snapshot_retained_bytes"
+
+# Counters
+NODE_FULFILLED = "node.fulfilled"
+NODE_REJECTED = "node.rejected"
+
+
+class BaseRunnerMetrics:
+    """
+    Receives timing and count metrics from the Workflow Runner. The default implementation discards them, so
+    subclasses only need to override what they want to record, e.g. to forward them to StatsD or Prometheus.
+
+    Metrics are reported from the runner's worker threads, so implementations must be thread safe.
+    """
+
+    def increment(self, name: str, value: int = 1, tags: Optional[MetricTags] = None) -> None:
+        pass
+
+    def observe(self, name: str, value: float, tags: Optional[MetricTags] = None) -> None:
+        pass
+
+
+class InMemoryRunnerMetrics(BaseRunnerMetrics):
+    """
+    Aggregates metrics in memory, which is useful for tests and for profiling runs locally.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counters: Dict[str, Dict[_TagsKey, int]] = defaultdict(lambda: defaultdict(int))
+        self._histograms: Dict[str, Dict[_TagsKey, List[float]]] = defaultdict(lambda: defaultdict(list))
+
+    def increment(self, name: str, value: int = 1, tags: Optional[MetricTags] = None) -> None:
+        with self._lock:
+            self._counters[name][_get_tags_key(tags)] += value
+
+    def observe(self, name: str, value: float, tags: Optional[MetricTags] = None) -> None:
+        with self._lock:
+            self._histograms[name][_get_tags_key(tags)].append(value)
+
+    def get_counter(self, name: str, **tags: str) -> int:
+        """
+        Sums a counter across every series whose tags include the given tags.
+        """
+
+        with self._lock:
+            return sum(value for tags_key, value in self._counters.get(name, {}).items() if _matches(tags_key, tags))
+
+    def get_histogram(self, name: str, **tags: str) -> List[float]:
+        """
+        Collects the observations of a histogram across every series whose tags include the given tags.
+        """
+
+        with self._lock:
+            return [
+                value
+                for tags_key, values in self._histograms.get(name, {}).items()
+                if _matches(tags_key, tags)
+                for value in values
+            ]
+
+
+def _get_tags_key(tags: Optional[MetricTags]) -> _TagsKey:
+    return frozenset(tags.items()) if tags else frozenset()
+
+
+def _matches(tags_key: _TagsKey, tags: MetricTags) -> bool:
+    return all((name, value) in tags_key for name, value in tags.items())
@@ -0,0 +1,136 @@
+from contextvars import ContextVar, Token
+from threading import Condition, Lock
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from vellum.workflows.state.context import WorkflowContext
+
+# How often, in seconds, a Node waiting on a resource pool checks whether it's been cancelled
+RESOURCE_POOL_POLL_INTERVAL = 0.1
+
+_lock = Lock()
+_resource_pools: Dict[str, "ResourcePool"] = {}
+
+# The pools held by the Node whose thread, or whose subworkflows' threads, we're running on. Context variables are
+# inherited by the threads that the Workflow Runner and MapNode start, so this reaches subworkflows at any depth
+_held_resource_pools: ContextVar[FrozenSet[str]] = ContextVar("held_resource_pools", default=frozenset())
+
+
+class ResourcePool:
+    """
+    Caps how many Nodes that are members of the pool may run at once, across every Workflow running in the process,
+    including subworkflows at any depth. Nodes declare the pools they're members of on their `Execution` class.
+    """
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self._size = _validate_size(name, size)
+        self._in_use = 0
+        self._condition = Condition()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def resize(self, size: int) -> None:
+        with self._condition:
+            self._size = _validate_size(self.name, size)
+            self._condition.notify_all()
+
+    def acquire(self, context: "WorkflowContext") -> None:
+        """
+        Waits for a free slot in the pool, raising if the Node's Workflow is cancelled or the Node times out first.
+        """
+
+        with self._condition:
+            while self._in_use >= self._size:
+                context._raise_if_cancelled()
+                self._condition.wait(timeout=RESOURCE_POOL_POLL_INTERVAL)
+
+            self._in_use += 1
+
+    def release(self) -> None:
+        with self._condition:
+            self._in_use -= 1
+            self._condition.notify()
+
+
+class ResourcePoolLease:
+    """
+    The slots a Node holds in its resource pools while it runs.
+    """
+
+    def __init__(self, pools: List[ResourcePool], token: Token[FrozenSet[str]]):
+        self.pools = pools
+        self._token = token
+
+    def release(self) -> None:
+        for pool in reversed(self.pools):
+            pool.release()
+
+        _held_resource_pools.reset(self._token)
+
+
+def _validate_size(name: str, size: int) -> int:
+    if size < 1:
+        raise ValueError(f"Resource pool {name} must have a size of at least 1, got {size}")
+
+    return size
+
+
+def configure_resource_pools(**sizes: int) -> None:
+    """
+    Sets the size of each of the named resource pools, creating them if needed, e.g.
+
+        configure_resource_pools(llm=20, search=50, cpu=os.cpu_count())
+
+    Nodes that are members of a pool that was never configured run without limit.
+    """
+
+    with _lock:
+        for name, size in sizes.items():
+            pool = _resource_pools.get(name)
+            if pool is None:
+                _resource_pools[name] = ResourcePool(name, size)
+            else:
+                pool.resize(size)
+
+
+def get_resource_pool(name: str) -> Optional[ResourcePool]:
+    return _resource_pools.get(name)
+
+
+def clear_resource_pools() -> None:
+    with _lock:
+        _resource_pools.clear()
+
+
+def acquire_resource_pools(names: Iterable[str], context: "WorkflowContext") -> Optional[ResourcePoolLease]:
+    """
+    Acquires a slot in each of the named pools that has been configured, returning `None` if there are none to
+    acquire. Pools that are already held by the Node running the current subworkflow are skipped, since the Nodes
+    within it do their work on that Node's behalf, and waiting on the slot it holds would deadlock.
+    """
+
+    held_pool_names = _held_resource_pools.get()
+    pools = [pool for name in sorted(set(names) - held_pool_names) if (pool := _resource_pools.get(name)) is not None]
+    if not pools:
+        return None
+
+    # Pools are always acquired in the same order, so that Nodes that are members of several can't deadlock
+    acquired_pools: List[ResourcePool] = []
+    try:
+        for pool in pools:
+            pool.acquire(context)
+            acquired_pools.append(pool)
+    except BaseException:
+        for pool in reversed(acquired_pools):
+            pool.release()
+        raise
+
+    token = _held_resource_pools.set(held_pool_names | {pool.name for pool in pools})
+    return ResourcePoolLease(pools, token)
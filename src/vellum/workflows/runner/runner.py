@@ -1,16 +1,35 @@
 from collections import defaultdict
+from contextvars import copy_context
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import chain, count
 import logging
-from queue import Empty, Queue
-from threading import Event as ThreadingEvent, Thread
+from queue import Empty, PriorityQueue, Queue
+from threading import Event as ThreadingEvent, RLock, Thread, local
+import time
 from uuid import UUID
-from typing import TYPE_CHECKING, Any, Dict, Generic, Iterable, Iterator, Optional, Sequence, Set, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
 
 from vellum.workflows.constants import undefined
 from vellum.workflows.context import ExecutionContext, execution_context, get_execution_context, get_parent_context
 from vellum.workflows.descriptors.base import BaseDescriptor
 from vellum.workflows.edges.edge import Edge
+from vellum.workflows.emitters.dispatcher import get_default_emitter_dispatcher
 from vellum.workflows.errors import WorkflowError, WorkflowErrorCode
 from vellum.workflows.events import (
     NodeExecutionFulfilledEvent,
@@ -29,8 +48,9 @@ from vellum.workflows.events.node import (
     NodeExecutionInitiatedBody,
     NodeExecutionRejectedBody,
     NodeExecutionStreamingBody,
+    NodeExecutionTimings,
 )
-from vellum.workflows.events.types import BaseEvent, NodeParentContext, WorkflowParentContext
+from vellum.workflows.events.types import NodeParentContext, WorkflowParentContext
 from vellum.workflows.events.workflow import (
     WorkflowExecutionFulfilledBody,
     WorkflowExecutionInitiatedBody,
@@ -49,9 +69,29 @@ from vellum.workflows.nodes.bases.base import NodeRunResponse
 from vellum.workflows.nodes.mocks import MockNodeExecutionArg
 from vellum.workflows.outputs import BaseOutputs
 from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.ports.node_ports import NodePorts
 from vellum.workflows.ports.port import Port
 from vellum.workflows.references import ExternalInputReference, OutputReference
-from vellum.workflows.state.base import BaseState
+from vellum.workflows.runner.incremental import PreviousRunArg, prepare_incremental_run
+from vellum.workflows.runner.memory import MemoryMeasurement, start_memory_tracing, stop_memory_tracing
+from vellum.workflows.runner.metrics import (
+    CONCURRENCY_QUEUE_WAIT,
+    EMITTER_LAG,
+    NODE_FULFILLED,
+    NODE_PEAK_BYTES,
+    NODE_QUEUE_WAIT,
+    NODE_REJECTED,
+    NODE_RESOURCE_POOL_WAIT,
+    NODE_RETAINED_BYTES,
+    NODE_RUN_DURATION,
+    NODE_TIME_TO_FIRST_OUTPUT,
+    STATE_SNAPSHOT_DURATION,
+    STATE_SNAPSHOT_PEAK_BYTES,
+    STATE_SNAPSHOT_RETAINED_BYTES,
+    BaseRunnerMetrics,
+)
+from vellum.workflows.runner.resource_pools import ResourcePoolLease, acquire_resource_pools
+from vellum.workflows.state.checkpoint import BaseCheckpointer
 from vellum.workflows.types.generics import InputsType, OutputsType, StateType
 
 if TYPE_CHECKING:
@@ -59,15 +99,98 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How often, in seconds, the runner checks its cancel signal while waiting on its Nodes
+CANCEL_POLL_INTERVAL = 0.1
+
 RunFromNodeArg = Sequence[Type[BaseNode]]
 ExternalInputsArg = Dict[ExternalInputReference, Any]
-BackgroundThreadItem = Union[BaseState, WorkflowEvent, None]
 
 
 @dataclass
 class ActiveNode(Generic[StateType]):
     node: BaseNode[StateType]
     was_outputs_streamed: bool = False
+    # The monotonic time by which the Node must finish, if it has a timeout
+    deadline: Optional[float] = None
+
+
+@dataclass(order=True)
+class _QueuedNode(Generic[StateType]):
+    # Ordered by the Node's priority, then by the length of the longest path of Nodes left to run after it, and then
+    # by when it was queued
+    sort_key: Tuple[int, int, int]
+    state: StateType = field(compare=False)
+    node_class: Type[BaseNode] = field(compare=False)
+    invoked_by: Optional[Edge] = field(compare=False)
+    queued_at: float = field(compare=False)
+
+
+def _get_remaining_path_lengths(edges: Iterable[Edge]) -> Dict[Type[BaseNode], int]:
+    """
+    Counts the Nodes on the longest path from each Node to the end of the graph, itself included. Edges that loop
+    back to a Node already on the path are ignored.
+    """
+
+    successors: Dict[Type[BaseNode], Set[Type[BaseNode]]] = defaultdict(set)
+    for edge in edges:
+        successors[edge.from_port.node_class].add(edge.to_node)
+
+    lengths: Dict[Type[BaseNode], int] = {}
+    for root in list(successors):
+        if root in lengths:
+            continue
+
+        # Walks the graph depth first without recursion, since chains of Nodes may be arbitrarily long
+        stack = [(root, iter(successors[root]))]
+        on_path = {root}
+        while stack:
+            node_class, remaining_successors = stack[-1]
+            successor = next(remaining_successors, None)
+            if successor is None:
+                stack.pop()
+                on_path.discard(node_class)
+                lengths[node_class] = 1 + max(
+                    (lengths[successor] for successor in successors[node_class] if successor in lengths), default=0
+                )
+            elif successor not in lengths and successor not in on_path:
+                on_path.add(successor)
+                stack.append((successor, iter(successors[successor])))
+
+    return lengths
+
+
+@dataclass(frozen=True)
+class DeltaCoalescingWindow:
+    """
+    Configures the runner to merge consecutive string deltas streamed by a node for the same output into a
+    single streaming event. Buffered deltas are flushed once `max_seconds` have elapsed since the first buffered
+    delta or once `max_size` characters have been buffered, whichever comes first, and always before the node
+    streams any other output, finishes or raises.
+
+    The window is only checked as deltas arrive: the runner doesn't flush on a timer, so a node whose stream stalls
+    holds on to its buffered text until its next output, or until it finishes.
+    """
+
+    max_seconds: float = 0.05
+    max_size: int = 1024
+
+
+@dataclass
+class _DeltaBuffer:
+    name: str
+    parts: List[str] = field(default_factory=list)
+    size: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def append(self, delta: str) -> None:
+        self.parts.append(delta)
+        self.size += len(delta)
+
+    def is_full(self, window: DeltaCoalescingWindow) -> bool:
+        return self.size >= window.max_size or time.monotonic() - self.started_at >= window.max_seconds
+
+    def flush(self) -> BaseOutput:
+        return BaseOutput(name=self.name, delta="".join(self.parts))
 
 
 class WorkflowRunner(Generic[StateType]):
@@ -84,23 +207,32 @@ class WorkflowRunner(Generic[StateType]):
         node_output_mocks: Optional[MockNodeExecutionArg] = None,
         max_concurrency: Optional[int] = None,
         init_execution_context: Optional[ExecutionContext] = None,
+        delta_coalescing: Optional[DeltaCoalescingWindow] = None,
+        event_filter: Optional[Callable[[Type["BaseWorkflow"], WorkflowEvent], bool]] = None,
+        metrics: Optional[BaseRunnerMetrics] = None,
+        memory_profiling: bool = False,
+        timeout: Optional[float] = None,
+        previous_run: Optional[PreviousRunArg] = None,
+        checkpointer: Optional[BaseCheckpointer] = None,
     ):
         if state and external_inputs:
             raise ValueError("Can only run a Workflow providing one of state or external inputs, not both")
 
+        if previous_run is not None and (entrypoint_nodes or external_inputs):
+            raise ValueError("Cannot run a Workflow incrementally while resuming it from nodes or external inputs")
+
         self.workflow = workflow
         self._is_resuming = False
+        # The outputs of the Nodes that an incremental run replays from its previous run, rather than running them
+        self._replayed_outputs: Dict[Type[BaseOutputs], BaseOutputs] = {}
         if entrypoint_nodes:
-            if len(list(entrypoint_nodes)) > 1:
-                raise ValueError("Cannot resume from multiple nodes")
-
-            # TODO: Support resuming from multiple nodes
-            # https://app.shortcut.com/vellum/story/4408
-            node = next(iter(entrypoint_nodes))
             if state:
                 self._initial_state = state
+            elif len(list(entrypoint_nodes)) > 1:
+                # Resuming from several nodes at once, e.g. from a checkpoint, requires the state they share
+                raise ValueError("Cannot resume from multiple nodes without the state to resume them with")
             else:
-                self._initial_state = self.workflow.get_state_at_node(node)
+                self._initial_state = self.workflow.get_state_at_node(next(iter(entrypoint_nodes)))
             self._entrypoints = entrypoint_nodes
         elif external_inputs:
             self._initial_state = self.workflow.get_most_recent_state()
@@ -119,8 +251,18 @@ class WorkflowRunner(Generic[StateType]):
             ]
             self._is_resuming = True
         else:
-            normalized_inputs = deepcopy(inputs) if inputs else self.workflow.get_default_inputs()
-            if state:
+            if not inputs:
+                normalized_inputs = self.workflow.get_default_inputs()
+            else:
+                # Seeding the memo keeps the inputs shared by the Node running this subworkflow from being copied
+                memo: Dict[int, Any] = {id(value): value for value in self.workflow.context._shared_inputs}
+                normalized_inputs = deepcopy(inputs, memo)
+            if previous_run is not None:
+                self._initial_state, replayed_outputs = prepare_incremental_run(
+                    self.workflow, previous_run, normalized_inputs, state
+                )
+                self._replayed_outputs = {outputs.__class__: outputs for outputs in replayed_outputs}
+            elif state:
                 self._initial_state = deepcopy(state)
                 self._initial_state.meta.workflow_inputs = normalized_inputs
             else:
@@ -133,18 +275,52 @@ class WorkflowRunner(Generic[StateType]):
         # This queue is responsible for sending events from the inner worker threads to WorkflowRunner
         self._workflow_event_inner_queue: Queue[WorkflowEvent] = Queue()
 
+        # Subworkflows run their dispatch loop on the thread of the Node that runs them, rather than on a stream thread
+        self._is_inline = self.workflow.context._is_subworkflow_context
         self._max_concurrency = max_concurrency
-        self._concurrency_queue: Queue[Tuple[StateType, Type[BaseNode], Optional[Edge]]] = Queue()
-
-        # This queue is responsible for sending events from WorkflowRunner to the background thread
-        # for user defined emitters
-        self._background_thread_queue: Queue[BackgroundThreadItem] = Queue()
+        self._delta_coalescing = delta_coalescing
+        self._event_filter = event_filter
+        self._metrics = metrics or BaseRunnerMetrics()
+        self._metric_tags = {"workflow": self.workflow.__class__.__name__}
+        self._memory_profiling = memory_profiling
+        self._timeout = timeout
+        self._checkpointer = checkpointer
+        # Set once the run starts, if the Workflow has a timeout
+        self._deadline: Optional[float] = None
+        # The deadlines of the active Nodes that have a timeout, kept apart so runs without timeouts skip checking them
+        self._node_deadlines: Dict[UUID, float] = {}
+        # Nodes that timed out may keep running until they next check whether they've been cancelled, so we drop any
+        # events they emit in the meantime
+        self._timed_out_span_ids: Set[UUID] = set()
+        # Each Node runs on its own thread, which lets us attribute the state snapshots it triggers to it
+        self._running_node = local()
+        self._snapshot_lock = RLock()
+        # Ready Nodes waiting on a free slot, which are run in order of priority rather than in the order they became
+        # ready. Each item also records when it was queued, so that we can measure how long nodes wait for a slot
+        self._concurrency_queue: PriorityQueue[_QueuedNode[StateType]] = PriorityQueue()
+        self._queued_node_count = count()
+        # Only computed for runs with a `max_concurrency`, since they're the only ones that queue Nodes
+        self._remaining_path_lengths: Dict[Type[BaseNode], int] = {}
+
+        # Delivers events and state snapshots to the Workflow's emitters from a thread shared across runs
+        self._emitter_dispatcher = get_default_emitter_dispatcher()
 
         self._dependencies: Dict[Type[BaseNode], Set[Type[BaseNode]]] = defaultdict(set)
+
+        # Workflow outputs that reference node outputs, indexed by node output name so that streamed node
+        # outputs don't need to be checked against every workflow output
+        self._workflow_outputs_by_node_output_name: Dict[str, List[Tuple[OutputReference, OutputReference]]] = (
+            defaultdict(list)
+        )
+        for workflow_output_descriptor in self.workflow.Outputs:
+            node_output_descriptor = workflow_output_descriptor.instance
+            if isinstance(node_output_descriptor, OutputReference):
+                self._workflow_outputs_by_node_output_name[node_output_descriptor.name].append(
+                    (workflow_output_descriptor, node_output_descriptor)
+                )
         self._state_forks: Set[StateType] = {self._initial_state}
 
         self._active_nodes_by_execution_id: Dict[UUID, ActiveNode[StateType]] = {}
-        self._cancel_signal = cancel_signal
         self._execution_context = init_execution_context or get_execution_context()
         self._parent_context = self._execution_context.parent_context
 
@@ -154,30 +330,90 @@ class WorkflowRunner(Generic[StateType]):
             lambda s: self._snapshot_state(s),
         )
         self.workflow.context._register_event_queue(self._workflow_event_inner_queue)
+        # Subworkflows are cancelled along with the Workflow running them, in addition to any cancel signal of their own
+        if cancel_signal or not self.workflow.context._is_subworkflow_context:
+            self.workflow.context._register_cancel_signal(cancel_signal)
         self.workflow.context._register_node_output_mocks(node_output_mocks or [])
 
     def _snapshot_state(self, state: StateType) -> StateType:
-        self._workflow_event_inner_queue.put(
-            WorkflowExecutionSnapshottedEvent(
-                trace_id=state.meta.trace_id,
-                span_id=state.meta.span_id,
-                body=WorkflowExecutionSnapshottedBody(
-                    workflow_definition=self.workflow.__class__,
-                    state=state,
-                ),
-                parent=self._parent_context,
+        started_at = time.monotonic()
+        node_name = getattr(self._running_node, "name", None)
+        tags = {**self._metric_tags, "node": node_name} if node_name else self._metric_tags
+        # Nodes on different threads may snapshot the state at once. Copying and recording each snapshot under a lock
+        # keeps them in the order they were taken, so that the last one recorded reflects every change before it
+        with self._snapshot_lock:
+            if self._memory_profiling:
+                with MemoryMeasurement() as memory:
+                    state = deepcopy(state)
+
+                self._metrics.observe(STATE_SNAPSHOT_PEAK_BYTES, memory.peak_bytes, tags)
+                self._metrics.observe(STATE_SNAPSHOT_RETAINED_BYTES, memory.retained_bytes, tags)
+            else:
+                state = deepcopy(state)
+
+            self._workflow_event_inner_queue.put(
+                WorkflowExecutionSnapshottedEvent(
+                    trace_id=state.meta.trace_id,
+                    span_id=state.meta.span_id,
+                    body=WorkflowExecutionSnapshottedBody(
+                        workflow_definition=self.workflow.__class__,
+                        state=state,
+                    ),
+                    parent=self._parent_context,
+                )
             )
-        )
-        self.workflow._store.append_state_snapshot(state)
-        self._background_thread_queue.put(state)
+            self.workflow._store.append_state_snapshot(state)
+            self._emitter_dispatcher.dispatch_state_snapshot(
+                self.workflow.emitters, state, on_delivered=self._observe_emitter_lag
+            )
+        self._metrics.observe(STATE_SNAPSHOT_DURATION, time.monotonic() - started_at, tags)
         return state
 
     def _emit_event(self, event: WorkflowEvent) -> WorkflowEvent:
         self.workflow._store.append_event(event)
-        self._background_thread_queue.put(event)
+        self._emitter_dispatcher.dispatch_event(self.workflow.emitters, event, on_delivered=self._observe_emitter_lag)
         return event
 
-    def _run_work_item(self, node: BaseNode[StateType], span_id: UUID) -> None:
+    def _observe_emitter_lag(self, lag: float) -> None:
+        self._metrics.observe(EMITTER_LAG, lag, self._metric_tags)
+
+    def _record_node_metrics(
+        self,
+        node: BaseNode[StateType],
+        ready_at: float,
+        initiated_at: float,
+        first_output_at: Optional[float],
+        memory: MemoryMeasurement,
+        is_fulfilled: bool,
+    ) -> NodeExecutionTimings:
+        timings = NodeExecutionTimings(
+            queue_wait=initiated_at - ready_at,
+            time_to_first_output=first_output_at - initiated_at if first_output_at is not None else None,
+            run_duration=time.monotonic() - initiated_at,
+        )
+
+        tags = {**self._metric_tags, "node": node.__class__.__name__}
+        self._metrics.increment(NODE_FULFILLED if is_fulfilled else NODE_REJECTED, tags=tags)
+        self._metrics.observe(NODE_QUEUE_WAIT, timings.queue_wait, tags)
+        if timings.time_to_first_output is not None:
+            self._metrics.observe(NODE_TIME_TO_FIRST_OUTPUT, timings.time_to_first_output, tags)
+        self._metrics.observe(NODE_RUN_DURATION, timings.run_duration, tags)
+
+        if self._memory_profiling:
+            memory.stop()
+            self._metrics.observe(NODE_PEAK_BYTES, memory.peak_bytes, tags)
+            self._metrics.observe(NODE_RETAINED_BYTES, memory.retained_bytes, tags)
+
+        return timings
+
+    def _run_work_item(self, node: BaseNode[StateType], span_id: UUID, ready_at: Optional[float] = None) -> None:
+        initiated_at = time.monotonic()
+        ready_at = ready_at if ready_at is not None else initiated_at
+        first_output_at: Optional[float] = None
+        memory = MemoryMeasurement()
+        if self._memory_profiling:
+            memory.start()
+        self._running_node.name = node.__class__.__name__
         parent_context = get_parent_context()
         self._workflow_event_inner_queue.put(
             NodeExecutionInitiatedEvent(
@@ -193,6 +429,7 @@ class WorkflowRunner(Generic[StateType]):
 
         logger.debug(f"Started running node: {node.__class__.__name__}")
 
+        resource_pool_lease: Optional[ResourcePoolLease] = None
         try:
             updated_parent_context = NodeParentContext(
                 span_id=span_id,
@@ -208,7 +445,15 @@ class WorkflowRunner(Generic[StateType]):
                     was_mocked = True
                     break
 
+            if not was_mocked and node.Outputs in self._replayed_outputs:
+                node_run_response = self._replayed_outputs[node.Outputs]
+                was_mocked = True
+
             if not was_mocked:
+                node._context._raise_if_cancelled()
+                resource_pool_lease = self._acquire_resource_pools(node)
+                # Time spent waiting on resource pools counts towards the Node's queue wait rather than its run
+                initiated_at = time.monotonic() if resource_pool_lease else initiated_at
                 with execution_context(parent_context=updated_parent_context, trace_id=node.state.meta.trace_id):
                     node_run_response = node.run()
 
@@ -256,45 +501,97 @@ class WorkflowRunner(Generic[StateType]):
                         ),
                     )
 
+                # The default ports never invoke on streamed outputs, so we skip evaluating them for every delta
+                evaluates_streaming_ports = node.Ports.__lt__ is not NodePorts.__lt__
+                delta_buffer: Optional[_DeltaBuffer] = None
+
+                def stream_node_output_delta(output: BaseOutput, invoked_ports: Optional[Set[Port]]) -> None:
+                    streaming_output_queues[output.name].put(output.delta)
+                    self._workflow_event_inner_queue.put(
+                        NodeExecutionStreamingEvent(
+                            trace_id=node.state.meta.trace_id,
+                            span_id=span_id,
+                            body=NodeExecutionStreamingBody(
+                                node_definition=node.__class__,
+                                output=output,
+                                invoked_ports=invoked_ports,
+                            ),
+                            parent=parent_context,
+                        ),
+                    )
+
+                def flush_delta_buffer() -> None:
+                    nonlocal delta_buffer
+                    if delta_buffer is None:
+                        return
+
+                    stream_node_output_delta(delta_buffer.flush(), None)
+                    delta_buffer = None
+
                 with execution_context(parent_context=updated_parent_context, trace_id=node.state.meta.trace_id):
-                    for output in node_run_response:
-                        invoked_ports = output > ports
-                        if output.is_initiated:
-                            initiate_node_streaming_output(output)
-                        elif output.is_streaming:
-                            if output.name not in streaming_output_queues:
+                    try:
+                        for output in node_run_response:
+                            if node._context.is_cancelled:
+                                # Stops the Node from producing any more outputs, e.g. closing the stream it's consuming
+                                if isinstance(node_run_response, Generator):
+                                    node_run_response.close()
+                                node._context._raise_if_cancelled()
+
+                            if first_output_at is None:
+                                first_output_at = time.monotonic()
+
+                            if output.is_streaming and not evaluates_streaming_ports:
+                                is_coalescable = self._delta_coalescing is not None and isinstance(output.delta, str)
+                                if delta_buffer is not None and (
+                                    not is_coalescable or delta_buffer.name != output.name
+                                ):
+                                    flush_delta_buffer()
+
+                                if output.name not in streaming_output_queues:
+                                    initiate_node_streaming_output(output)
+
+                                if not self._delta_coalescing or not isinstance(output.delta, str):
+                                    stream_node_output_delta(output, None)
+                                    continue
+
+                                if delta_buffer is None:
+                                    delta_buffer = _DeltaBuffer(output.name)
+
+                                delta_buffer.append(output.delta)
+                                if delta_buffer.is_full(self._delta_coalescing):
+                                    flush_delta_buffer()
+
+                                continue
+
+                            flush_delta_buffer()
+                            invoked_ports = output > ports
+                            if output.is_initiated:
                                 initiate_node_streaming_output(output)
-
-                            streaming_output_queues[output.name].put(output.delta)
-                            self._workflow_event_inner_queue.put(
-                                NodeExecutionStreamingEvent(
-                                    trace_id=node.state.meta.trace_id,
-                                    span_id=span_id,
-                                    body=NodeExecutionStreamingBody(
-                                        node_definition=node.__class__,
-                                        output=output,
-                                        invoked_ports=invoked_ports,
-                                    ),
-                                    parent=parent_context,
-                                ),
-                            )
-                        elif output.is_fulfilled:
-                            if output.name in streaming_output_queues:
-                                streaming_output_queues[output.name].put(undefined)
-
-                            setattr(outputs, output.name, output.value)
-                            self._workflow_event_inner_queue.put(
-                                NodeExecutionStreamingEvent(
-                                    trace_id=node.state.meta.trace_id,
-                                    span_id=span_id,
-                                    body=NodeExecutionStreamingBody(
-                                        node_definition=node.__class__,
-                                        output=output,
-                                        invoked_ports=invoked_ports,
-                                    ),
-                                    parent=parent_context,
+                            elif output.is_streaming:
+                                if output.name not in streaming_output_queues:
+                                    initiate_node_streaming_output(output)
+
+                                stream_node_output_delta(output, invoked_ports)
+                            elif output.is_fulfilled:
+                                if output.name in streaming_output_queues:
+                                    streaming_output_queues[output.name].put(undefined)
+
+                                setattr(outputs, output.name, output.value)
+                                self._workflow_event_inner_queue.put(
+                                    NodeExecutionStreamingEvent(
+                                        trace_id=node.state.meta.trace_id,
+                                        span_id=span_id,
+                                        body=NodeExecutionStreamingBody(
+                                            node_definition=node.__class__,
+                                            output=output,
+                                            invoked_ports=invoked_ports,
+                                        ),
+                                        parent=parent_context,
+                                    )
                                 )
-                            )
+                    finally:
+                        # Deltas that were buffered before the Node raised are still streamed ahead of its rejection
+                        flush_delta_buffer()
 
             node.state.meta.node_execution_cache.fulfill_node_execution(node.__class__, span_id)
 
@@ -316,6 +613,7 @@ class WorkflowRunner(Generic[StateType]):
                         outputs=outputs,
                         invoked_ports=invoked_ports,
                         mocked=was_mocked,
+                        timings=self._record_node_metrics(node, ready_at, initiated_at, first_output_at, memory, True),
                     ),
                     parent=parent_context,
                 )
@@ -328,6 +626,7 @@ class WorkflowRunner(Generic[StateType]):
                     body=NodeExecutionRejectedBody(
                         node_definition=node.__class__,
                         error=e.error,
+                        timings=self._record_node_metrics(node, ready_at, initiated_at, first_output_at, memory, False),
                     ),
                     parent=parent_context,
                 )
@@ -345,19 +644,39 @@ class WorkflowRunner(Generic[StateType]):
                             message=str(e),
                             code=WorkflowErrorCode.INTERNAL_ERROR,
                         ),
+                        timings=self._record_node_metrics(node, ready_at, initiated_at, first_output_at, memory, False),
                     ),
                     parent=parent_context,
                 ),
             )
+        finally:
+            if resource_pool_lease:
+                resource_pool_lease.release()
 
         logger.debug(f"Finished running node: {node.__class__.__name__}")
 
-    def _context_run_work_item(self, node: BaseNode[StateType], span_id: UUID, parent_context=None) -> None:
-        if parent_context is None:
-            parent_context = get_parent_context() or self._parent_context
+    def _acquire_resource_pools(self, node: BaseNode[StateType]) -> Optional[ResourcePoolLease]:
+        if not node.Execution.resource_pools:
+            return None
+
+        waiting_since = time.monotonic()
+        resource_pool_lease = acquire_resource_pools(node.Execution.resource_pools, node._context)
+        if resource_pool_lease:
+            self._metrics.observe(
+                NODE_RESOURCE_POOL_WAIT,
+                time.monotonic() - waiting_since,
+                {**self._metric_tags, "node": node.__class__.__name__},
+            )
 
+        return resource_pool_lease
+
+    def _context_run_work_item(
+        self, node: BaseNode[StateType], span_id: UUID, ready_at: Optional[float] = None
+    ) -> None:
+        # Worker threads run within a copy of the context of the thread that started them
+        parent_context = get_parent_context() or self._parent_context
         with execution_context(parent_context=parent_context, trace_id=node.state.meta.trace_id):
-            self._run_work_item(node, span_id)
+            self._run_work_item(node, span_id, ready_at)
 
     def _handle_invoked_ports(self, state: StateType, ports: Optional[Iterable[Port]]) -> None:
         if not ports:
@@ -372,7 +691,7 @@ class WorkflowRunner(Generic[StateType]):
                     next_state = state
 
                 if self._max_concurrency:
-                    self._concurrency_queue.put((next_state, edge.to_node, edge))
+                    self._queue_node(next_state, edge.to_node, edge)
                 else:
                     self._run_node_if_ready(next_state, edge.to_node, edge)
 
@@ -382,15 +701,33 @@ class WorkflowRunner(Generic[StateType]):
                 if self._concurrency_queue.empty():
                     break
 
-                next_state, node_class, invoked_edge = self._concurrency_queue.get()
-                self._run_node_if_ready(next_state, node_class, invoked_edge)
+                queued_node = self._concurrency_queue.get()
+                self._metrics.observe(
+                    CONCURRENCY_QUEUE_WAIT, time.monotonic() - queued_node.queued_at, self._metric_tags
+                )
+                self._run_node_if_ready(
+                    queued_node.state, queued_node.node_class, queued_node.invoked_by, ready_at=queued_node.queued_at
+                )
+
+    def _queue_node(self, state: StateType, node_class: Type[BaseNode], invoked_by: Optional[Edge] = None) -> None:
+        sort_key = (
+            -node_class.Execution.priority,
+            -self._remaining_path_lengths.get(node_class, 1),
+            next(self._queued_node_count),
+        )
+        self._concurrency_queue.put(_QueuedNode(sort_key, state, node_class, invoked_by, time.monotonic()))
 
     def _run_node_if_ready(
         self,
         state: StateType,
         node_class: Type[BaseNode],
         invoked_by: Optional[Edge] = None,
+        ready_at: Optional[float] = None,
     ) -> None:
+        if self._is_cancelled():
+            return
+
+        ready_at = ready_at if ready_at is not None else time.monotonic()
         with state.__lock__:
             for descriptor in node_class.ExternalInputs:
                 if not isinstance(descriptor, ExternalInputReference):
@@ -405,14 +742,31 @@ class WorkflowRunner(Generic[StateType]):
             if not node_class.Trigger.should_initiate(state, all_deps, node_span_id):
                 return
 
-            current_parent = get_parent_context()
-            node = node_class(state=state, context=self.workflow.context)
-            state.meta.node_execution_cache.initiate_node_execution(node_class, node_span_id)
-            self._active_nodes_by_execution_id[node_span_id] = ActiveNode(node=node)
+            node_timeout = node_class.Execution.timeout
+            # Nodes that may time out get a context of their own, so that they can be cancelled without the Workflow
+            if node_timeout is not None or self._timeout is not None:
+                node_context = self.workflow.context._create_node_context()
+            else:
+                node_context = self.workflow.context
 
+            node = node_class(state=state, context=node_context)
+            state.meta.node_execution_cache.initiate_node_execution(node_class, node_span_id)
+            active_node = ActiveNode(node=node)
+            if node_timeout is not None:
+                active_node.deadline = time.monotonic() + node_timeout
+                self._node_deadlines[node_span_id] = active_node.deadline
+            self._active_nodes_by_execution_id[node_span_id] = active_node
+
+            # A thread per Node, rather than a shared pool, since a Node running a subworkflow blocks on the threads of
+            # the subworkflow's Nodes, and a bounded pool could be exhausted by the Nodes waiting on it
             worker_thread = Thread(
-                target=self._context_run_work_item,
-                kwargs={"node": node, "span_id": node_span_id, "parent_context": current_parent},
+                target=copy_context().run,
+                args=(self._context_run_work_item,),
+                kwargs={
+                    "node": node,
+                    "span_id": node_span_id,
+                    "ready_at": ready_at,
+                },
             )
             worker_thread.start()
 
@@ -424,17 +778,15 @@ class WorkflowRunner(Generic[StateType]):
         node = active_node.node
         if event.name == "node.execution.rejected":
             self._active_nodes_by_execution_id.pop(event.span_id)
+            self._node_deadlines.pop(event.span_id, None)
             return event.error
 
         if event.name == "node.execution.streaming":
-            for workflow_output_descriptor in self.workflow.Outputs:
-                node_output_descriptor = workflow_output_descriptor.instance
-                if not isinstance(node_output_descriptor, OutputReference):
-                    continue
+            for workflow_output_descriptor, node_output_descriptor in self._workflow_outputs_by_node_output_name.get(
+                event.output.name, []
+            ):
                 if node_output_descriptor.outputs_class != event.node_definition.Outputs:
                     continue
-                if node_output_descriptor.name != event.output.name:
-                    continue
 
                 active_node.was_outputs_streamed = True
                 self._workflow_event_outer_queue.put(
@@ -453,16 +805,15 @@ class WorkflowRunner(Generic[StateType]):
 
         if event.name == "node.execution.fulfilled":
             self._active_nodes_by_execution_id.pop(event.span_id)
+            self._node_deadlines.pop(event.span_id, None)
             if not active_node.was_outputs_streamed:
                 for event_node_output_descriptor, node_output_value in event.outputs:
-                    for workflow_output_descriptor in self.workflow.Outputs:
-                        node_output_descriptor = workflow_output_descriptor.instance
-                        if not isinstance(node_output_descriptor, OutputReference):
-                            continue
+                    for (
+                        workflow_output_descriptor,
+                        node_output_descriptor,
+                    ) in self._workflow_outputs_by_node_output_name.get(event_node_output_descriptor.name, []):
                         if node_output_descriptor.outputs_class != event.node_definition.Outputs:
                             continue
-                        if node_output_descriptor.name != event_node_output_descriptor.name:
-                            continue
 
                         self._workflow_event_outer_queue.put(
                             self._stream_workflow_event(
@@ -544,22 +895,38 @@ class WorkflowRunner(Generic[StateType]):
         )
 
     def _stream(self) -> None:
-        for edge in self.workflow.get_edges():
+        for _ in self._dispatch():
+            pass
+
+    def _dispatch(self) -> Iterator[None]:
+        """
+        Runs the Workflow's Nodes and dispatches the events they emit, putting the events to surface on the outer
+        queue. Yields each time an event has been dispatched, so that inline runs can surface events as they go.
+        """
+
+        edges = list(self.workflow.get_edges())
+        for edge in edges:
             self._dependencies[edge.to_node].add(edge.from_port.node_class)
 
+        if self._max_concurrency:
+            self._remaining_path_lengths = _get_remaining_path_lengths(edges)
+
         current_parent = WorkflowParentContext(
             span_id=self._initial_state.meta.span_id,
             workflow_definition=self.workflow.__class__,
             parent=self._parent_context,
             type="WORKFLOW",
         )
+        if self._timeout is not None:
+            self._deadline = time.monotonic() + self._timeout
+
         for node_cls in self._entrypoints:
             try:
                 if not self._max_concurrency or len(self._active_nodes_by_execution_id) < self._max_concurrency:
                     with execution_context(parent_context=current_parent, trace_id=self._initial_state.meta.trace_id):
                         self._run_node_if_ready(self._initial_state, node_cls)
                 else:
-                    self._concurrency_queue.put((self._initial_state, node_cls, None))
+                    self._queue_node(self._initial_state, node_cls)
             except NodeException as e:
                 self._workflow_event_outer_queue.put(self._reject_workflow_event(e.error))
                 return
@@ -579,29 +946,68 @@ class WorkflowRunner(Generic[StateType]):
             if not self._active_nodes_by_execution_id:
                 break
 
-            event = self._workflow_event_inner_queue.get()
+            next_event = self._get_next_inner_event()
+            if next_event is None:
+                if self._is_cancelled():
+                    break
+
+                rejection_error = self._time_out_expired(current_parent)
+                if rejection_error:
+                    break
+
+                continue
+
+            event = next_event
+            if event.span_id in self._timed_out_span_ids:
+                continue
 
             self._workflow_event_outer_queue.put(event)
 
+            active_node = self._active_nodes_by_execution_id.get(event.span_id)
             with execution_context(parent_context=current_parent, trace_id=self._initial_state.meta.trace_id):
                 rejection_error = self._handle_work_item_event(event)
 
             if rejection_error:
                 break
 
-        # Handle any remaining events
+            if self._checkpointer and active_node and event.name == "node.execution.fulfilled":
+                self._save_checkpoint(active_node.node.state)
+
+            yield
+
+        # Handle any remaining events, unless the run was cancelled or timed out, in which case we stop without waiting
+        # on Nodes
         try:
-            while event := self._workflow_event_inner_queue.get_nowait():
+            while (
+                not self._is_cancelled()
+                and not self._timed_out_span_ids
+                and (event := self._workflow_event_inner_queue.get_nowait())
+            ):
                 self._workflow_event_outer_queue.put(event)
 
                 with execution_context(parent_context=current_parent, trace_id=self._initial_state.meta.trace_id):
-                    rejection_error = self._handle_work_item_event(event)
+                    remaining_event_error = self._handle_work_item_event(event)
 
-                if rejection_error:
+                if remaining_event_error:
+                    # Keeps an earlier rejection from being masked by the events of other Nodes still finishing
+                    rejection_error = rejection_error or remaining_event_error
                     break
         except Empty:
             pass
 
+        if self._is_cancelled():
+            # Closes whatever the Nodes still running are blocked on, e.g. a stream, rather than waiting for its next
+            # event to arrive
+            for active_node in self._active_nodes_by_execution_id.values():
+                active_node.node._context._cancel()
+
+            self._workflow_event_outer_queue.put(
+                self._reject_workflow_event(
+                    WorkflowError(code=WorkflowErrorCode.WORKFLOW_CANCELLED, message="Workflow run cancelled")
+                )
+            )
+            return
+
         final_state = self._state_forks.pop()
         for other_state in self._state_forks:
             final_state += other_state
@@ -632,37 +1038,126 @@ class WorkflowRunner(Generic[StateType]):
                     descriptor.instance.resolve(final_state),
                 )
 
+        if self._checkpointer:
+            try:
+                self._checkpointer.clear()
+            except Exception:
+                logger.exception("Failed to clear the Workflow's checkpoint")
+
         self._workflow_event_outer_queue.put(self._fulfill_workflow_event(fulfilled_outputs))
 
-    def _run_background_thread(self) -> None:
-        state_class = self.workflow.get_state_class()
-        while True:
-            item = self._background_thread_queue.get()
-            if item is None:
-                break
+    def _save_checkpoint(self, state: StateType) -> None:
+        """
+        Saves the state at a node boundary, along with the Nodes left to run from it: those that are running, queued
+        or awaiting external inputs. Checkpoints are only saved while there are Nodes left to run.
+        """
 
-            if isinstance(item, state_class):
-                for emitter in self.workflow.emitters:
-                    emitter.snapshot_state(item)
-            elif isinstance(item, BaseEvent):
-                for emitter in self.workflow.emitters:
-                    emitter.emit_event(item)
+        if not self._checkpointer:
+            return
 
-    def _run_cancel_thread(self, kill_switch: ThreadingEvent) -> None:
-        if not self._cancel_signal:
+        frontier: List[Type[BaseNode]] = [
+            active_node.node.__class__ for active_node in self._active_nodes_by_execution_id.values()
+        ]
+        frontier.extend(queued_node.node_class for queued_node in sorted(self._concurrency_queue.queue))
+        frontier.extend(
+            external_input.inputs_class.__parent_class__
+            for external_input, value in state.meta.external_inputs.items()
+            if value is undefined
+        )
+        if not frontier:
             return
 
-        while not kill_switch.wait(timeout=0.1):
-            if self._cancel_signal.is_set():
-                self._workflow_event_outer_queue.put(
-                    self._reject_workflow_event(
-                        WorkflowError(
-                            code=WorkflowErrorCode.WORKFLOW_CANCELLED,
-                            message="Workflow run cancelled",
-                        )
-                    )
+        with self._snapshot_lock:
+            state = deepcopy(state)
+
+        try:
+            self._checkpointer.save(self.workflow.__class__, state, list(dict.fromkeys(frontier)))
+        except Exception:
+            # A checkpoint that fails to save shouldn't fail the run, which may still complete without it
+            logger.exception("Failed to save the Workflow's checkpoint")
+
+    def _is_cancelled(self) -> bool:
+        return self.workflow.context.is_cancelled
+
+    def _get_wait_timeout(self) -> Optional[float]:
+        deadline = min(self._node_deadlines.values()) if self._node_deadlines else None
+        if self._deadline is not None:
+            deadline = self._deadline if deadline is None else min(deadline, self._deadline)
+
+        timeout = deadline - time.monotonic() if deadline is not None else None
+        if self.workflow.context._is_cancellable:
+            timeout = CANCEL_POLL_INTERVAL if timeout is None else min(timeout, CANCEL_POLL_INTERVAL)
+
+        return timeout
+
+    def _get_next_inner_event(self) -> Optional[WorkflowEvent]:
+        """
+        Waits for the next event from the Workflow's Nodes, returning `None` if the run is cancelled or a deadline
+        passes first.
+        """
+
+        while not self._is_cancelled():
+            timeout = self._get_wait_timeout()
+            if timeout is not None and timeout <= 0:
+                return None
+
+            try:
+                return self._workflow_event_inner_queue.get(timeout=timeout)
+            except Empty:
+                continue
+
+        return None
+
+    def _time_out_expired(self, current_parent: WorkflowParentContext) -> Optional[WorkflowError]:
+        """
+        Cancels the Nodes whose deadline, or that of the Workflow, has passed, and stops waiting on them, returning the
+        error to reject the Workflow with. A Node's thread can't be stopped outright, but cancelling the Node's context
+        closes any stream it's blocked on, and otherwise it's freed once the Node next checks whether it's been
+        cancelled, e.g. between the chunks of a stream.
+        """
+
+        now = time.monotonic()
+        if self._deadline is not None and now >= self._deadline:
+            for span_id, active_node in list(self._active_nodes_by_execution_id.items()):
+                self._time_out_node(span_id, active_node)
+
+            return WorkflowError(
+                code=WorkflowErrorCode.WORKFLOW_TIMEOUT,
+                message=f"Workflow exceeded its timeout of {self._timeout} seconds",
+            )
+
+        rejection_error: Optional[WorkflowError] = None
+        for span_id, deadline in list(self._node_deadlines.items()):
+            if now < deadline:
+                continue
+
+            active_node = self._active_nodes_by_execution_id[span_id]
+            node_class = active_node.node.__class__
+            error = WorkflowError(
+                code=WorkflowErrorCode.NODE_TIMEOUT,
+                message=f"Node {node_class.__name__} exceeded its timeout of {node_class.Execution.timeout} seconds",
+            )
+            self._time_out_node(span_id, active_node)
+            self._workflow_event_outer_queue.put(
+                NodeExecutionRejectedEvent(
+                    trace_id=active_node.node.state.meta.trace_id,
+                    span_id=span_id,
+                    body=NodeExecutionRejectedBody(
+                        node_definition=node_class,
+                        error=error,
+                    ),
+                    parent=current_parent,
                 )
-                return
+            )
+            rejection_error = rejection_error or error
+
+        return rejection_error
+
+    def _time_out_node(self, span_id: UUID, active_node: ActiveNode[StateType]) -> None:
+        active_node.node._context._cancel()
+        self._active_nodes_by_execution_id.pop(span_id)
+        self._node_deadlines.pop(span_id, None)
+        self._timed_out_span_ids.add(span_id)
 
     def _is_terminal_event(self, event: WorkflowEvent) -> bool:
         if (
@@ -673,53 +1168,69 @@ class WorkflowRunner(Generic[StateType]):
             return event.workflow_definition == self.workflow.__class__
         return False
 
+    def _should_yield(self, event: WorkflowEvent) -> bool:
+        # Filtered out events are still emitted, but are never yielded to the caller
+        return self._event_filter is None or self._event_filter(self.workflow.__class__, event)
+
     def stream(self) -> WorkflowEventStream:
-        background_thread = Thread(
-            target=self._run_background_thread,
-            name=f"{self.workflow.__class__.__name__}.background_thread",
-        )
-        background_thread.start()
-
-        cancel_thread_kill_switch = ThreadingEvent()
-        if self._cancel_signal:
-            cancel_thread = Thread(
-                target=self._run_cancel_thread,
-                name=f"{self.workflow.__class__.__name__}.cancel_thread",
-                kwargs={"kill_switch": cancel_thread_kill_switch},
-            )
-            cancel_thread.start()
+        if not self._memory_profiling:
+            yield from self._generate_events()
+            return
+
+        start_memory_tracing()
+        try:
+            yield from self._generate_events()
+        finally:
+            stop_memory_tracing()
 
+    def _generate_events(self) -> WorkflowEventStream:
         event: WorkflowEvent
         if self._is_resuming:
             event = self._resume_workflow_event()
         else:
             event = self._initiate_workflow_event()
 
-        yield self._emit_event(event)
-
-        # The extra level of indirection prevents the runner from waiting on the caller to consume the event stream
-        stream_thread = Thread(
-            target=self._stream,
-            name=f"{self.workflow.__class__.__name__}.stream_thread",
-        )
-        stream_thread.start()
+        self._emit_event(event)
+        if self._should_yield(event):
+            yield event
+
+        if self._is_inline:
+            # The Node running a subworkflow consumes its events as they're dispatched, so there's no need for a
+            # stream thread, nor for another hop through the outer queue on the way to the parent Workflow
+            for _ in chain(self._dispatch(), [None]):
+                while not self._workflow_event_outer_queue.empty():
+                    event = self._workflow_event_outer_queue.get_nowait()
+                    self._emit_event(event)
+                    if self._should_yield(event):
+                        yield event
+        else:
+            # The extra level of indirection prevents the runner from waiting on the caller to consume the event stream
+            stream_thread = Thread(
+                target=self._stream,
+                name=f"{self.workflow.__class__.__name__}.stream_thread",
+            )
+            stream_thread.start()
 
-        while stream_thread.is_alive():
-            try:
-                event = self._workflow_event_outer_queue.get(timeout=0.1)
-            except Empty:
-                continue
+            while stream_thread.is_alive():
+                try:
+                    event = self._workflow_event_outer_queue.get(timeout=0.1)
+                except Empty:
+                    continue
 
-            yield self._emit_event(event)
+                self._emit_event(event)
+                if self._should_yield(event):
+                    yield event
 
-            if self._is_terminal_event(event):
-                break
+                if self._is_terminal_event(event):
+                    break
 
-        try:
-            while event := self._workflow_event_outer_queue.get_nowait():
-                yield self._emit_event(event)
-        except Empty:
-            pass
+            try:
+                while event := self._workflow_event_outer_queue.get_nowait():
+                    self._emit_event(event)
+                    if self._should_yield(event):
+                        yield event
+            except Empty:
+                pass
 
         if not self._is_terminal_event(event):
             yield self._reject_workflow_event(
@@ -728,6 +1239,3 @@ class WorkflowRunner(Generic[StateType]):
                     message="An unexpected error occurred while streaming Workflow events",
                 )
             )
-
-        self._background_thread_queue.put(None)
-        cancel_thread_kill_switch.set()
@@ -0,0 +1,149 @@
+from threading import Event as ThreadingEvent, Timer
+import time
+from uuid import uuid4
+from typing import Iterator
+
+from vellum import ExecutePromptEvent, InitiatedExecutePromptEvent
+from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.core.inline_subworkflow_node.node import InlineSubworkflowNode
+from vellum.workflows.nodes.core.try_node.node import TryNode
+from vellum.workflows.nodes.displayable.bases.base_prompt_node.node import BasePromptNode
+from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+def test_run__cancel_propagates_into_subworkflows():
+    # GIVEN a Node that polls until its Workflow is cancelled
+    observed_cancellation = ThreadingEvent()
+
+    class PollingNode(BaseNode):
+        def run(self) -> BaseNode.Outputs:
+            started_at = time.monotonic()
+            while time.monotonic() - started_at < 5:
+                if self._context.is_cancelled:
+                    observed_cancellation.set()
+                    break
+                time.sleep(0.01)
+
+            return self.Outputs()
+
+    # AND it runs within a subworkflow, wrapped in a TryNode
+    class InnerWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = TryNode.wrap()(PollingNode)
+
+    class SubworkflowNode(InlineSubworkflowNode):
+        subworkflow = InnerWorkflow
+
+    class OuterWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = SubworkflowNode
+
+    # AND a cancel signal that is set shortly after the Workflow starts
+    cancel_signal = ThreadingEvent()
+    Timer(0.05, cancel_signal.set).start()
+
+    # WHEN we run the Workflow
+    started_at = time.monotonic()
+    terminal_event = OuterWorkflow().run(cancel_signal=cancel_signal)
+
+    # THEN the Workflow is rejected as cancelled, without waiting on the Node
+    assert terminal_event.name == "workflow.execution.rejected", terminal_event
+    assert terminal_event.error.code == WorkflowErrorCode.WORKFLOW_CANCELLED
+    assert time.monotonic() - started_at < 2
+
+    # AND the Node within the subworkflow saw the cancellation
+    assert observed_cancellation.wait(timeout=2)
+
+
+def test_stream__cancel_closes_streaming_node():
+    # GIVEN a Node that streams outputs until it's closed
+    stream_closed = ThreadingEvent()
+
+    class StreamingNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            value: str
+
+        def run(self) -> Iterator[BaseOutput]:
+            try:
+                for _ in range(500):
+                    time.sleep(0.01)
+                    yield BaseOutput(name="value", delta="chunk")
+            finally:
+                stream_closed.set()
+
+    class StreamingWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = StreamingNode
+
+    # AND a cancel signal that is set shortly after the Workflow starts
+    cancel_signal = ThreadingEvent()
+    Timer(0.05, cancel_signal.set).start()
+
+    # WHEN we stream the Workflow
+    events = list(StreamingWorkflow().stream(cancel_signal=cancel_signal))
+
+    # THEN the Workflow is rejected as cancelled
+    assert events[-1].name == "workflow.execution.rejected"
+    assert events[-1].error.code == WorkflowErrorCode.WORKFLOW_CANCELLED
+
+    # AND the Node stopped streaming at the next chunk
+    assert stream_closed.wait(timeout=1)
+
+
+class BlockingPromptEventStream:
+    """
+    A Prompt's event stream that blocks after its first event until it's closed, like a response that stalls.
+    """
+
+    def __init__(self) -> None:
+        self.closed = ThreadingEvent()
+        self._initiated = False
+
+    def __iter__(self) -> "BlockingPromptEventStream":
+        return self
+
+    def __next__(self) -> ExecutePromptEvent:
+        if not self._initiated:
+            self._initiated = True
+            return InitiatedExecutePromptEvent(execution_id=str(uuid4()))
+
+        self.closed.wait(timeout=10)
+        raise StopIteration
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+def test_run__cancel_closes_blocked_prompt_stream():
+    # GIVEN a Prompt Node whose stream blocks without sending any events
+    prompt_event_stream = BlockingPromptEventStream()
+    node_finished = ThreadingEvent()
+
+    class BlockedPromptNode(BasePromptNode):
+        def _get_prompt_event_stream(self) -> Iterator[ExecutePromptEvent]:
+            return prompt_event_stream
+
+        def run(self) -> Iterator[BaseOutput]:
+            try:
+                yield from super().run()
+            finally:
+                node_finished.set()
+
+    class PromptWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = BlockedPromptNode
+
+    # AND a cancel signal that is set shortly after the Workflow starts
+    cancel_signal = ThreadingEvent()
+    Timer(0.05, cancel_signal.set).start()
+
+    # WHEN we run the Workflow
+    terminal_event = PromptWorkflow().run(cancel_signal=cancel_signal)
+
+    # THEN the Workflow is rejected as cancelled
+    assert terminal_event.name == "workflow.execution.rejected", terminal_event
+    assert terminal_event.error.code == WorkflowErrorCode.WORKFLOW_CANCELLED
+
+    # AND the stream was closed from the runner, rather than left blocking the Node
+    assert prompt_event_stream.closed.wait(timeout=1)
+    assert node_finished.wait(timeout=1)
@@ -0,0 +1,220 @@
+import pytest
+from typing import ClassVar, List, Set, Type, Union
+
+from vellum.workflows.graph.graph import Graph
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.ports.port import Port
+from vellum.workflows.references.lazy import LazyReference
+from vellum.workflows.runner.incremental import get_affected_nodes
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+
+class Inputs(BaseInputs):
+    topic: str
+    audience: str
+
+
+class State(BaseState):
+    tone: str = "formal"
+
+
+executed_nodes: List[str] = []
+
+
+class TopicNode(BaseNode):
+    topic = Inputs.topic
+
+    class Outputs(BaseNode.Outputs):
+        title: str
+
+    def run(self) -> Outputs:
+        executed_nodes.append("TopicNode")
+        return self.Outputs(title=self.topic.upper())
+
+
+class AudienceNode(BaseNode):
+    audience = Inputs.audience
+
+    class Outputs(BaseNode.Outputs):
+        greeting: str
+
+    def run(self) -> Outputs:
+        executed_nodes.append("AudienceNode")
+        return self.Outputs(greeting=f"Hello {self.audience}")
+
+
+class ToneNode(BaseNode[State]):
+    tone = State.tone
+
+    class Outputs(BaseNode.Outputs):
+        tone: str
+
+    def run(self) -> Outputs:
+        executed_nodes.append("ToneNode")
+        return self.Outputs(tone=self.tone)
+
+
+class SummaryNode(BaseNode):
+    title = TopicNode.Outputs.title
+
+    class Outputs(BaseNode.Outputs):
+        summary: str
+
+    def run(self) -> Outputs:
+        executed_nodes.append("SummaryNode")
+        return self.Outputs(summary=f"About {self.title}")
+
+
+class IncrementalWorkflow(BaseWorkflow[Inputs, State]):
+    graph: ClassVar[Set[Union[Type[BaseNode], Graph]]] = {TopicNode >> SummaryNode, AudienceNode, ToneNode}
+
+    class Outputs(BaseWorkflow.Outputs):
+        summary = SummaryNode.Outputs.summary
+        greeting = AudienceNode.Outputs.greeting
+        tone = ToneNode.Outputs.tone
+
+
+@pytest.fixture(autouse=True)
+def reset_executed_nodes():
+    executed_nodes.clear()
+    yield
+
+
+def test_run__previous_run_reruns_affected_nodes():
+    # GIVEN a Workflow that has already run
+    workflow = IncrementalWorkflow()
+    terminal_event = workflow.run(inputs=Inputs(topic="rivers", audience="students"))
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    previous_state = workflow.get_most_recent_state()
+    executed_nodes.clear()
+
+    # WHEN we run it again incrementally with a different topic
+    events = list(
+        IncrementalWorkflow().stream(
+            inputs=Inputs(topic="lakes", audience="students"),
+            previous_run=previous_state,
+            event_filter=all_workflow_event_filter,
+        )
+    )
+
+    # THEN only the Node that references the topic, and the Node that depends on its outputs, run again
+    assert sorted(executed_nodes) == ["SummaryNode", "TopicNode"]
+
+    # AND the Workflow's outputs reflect both the new and the replayed outputs
+    assert events[-1].name == "workflow.execution.fulfilled", events[-1]
+    assert events[-1].outputs == {"summary": "About LAKES", "greeting": "Hello students", "tone": "formal"}
+
+    # AND the replayed Nodes are reported as mocked
+    mocked_nodes = {
+        event.node_definition.__name__
+        for event in events
+        if event.name == "node.execution.fulfilled" and event.body.mocked
+    }
+    assert mocked_nodes == {"AudienceNode", "ToneNode"}
+
+
+def test_run__previous_run_from_store_with_changed_state():
+    # GIVEN a Workflow that has already run
+    workflow = IncrementalWorkflow()
+    workflow.run(inputs=Inputs(topic="rivers", audience="students"))
+    executed_nodes.clear()
+
+    # WHEN we run it again incrementally from its Store, with the same inputs but a different state value
+    terminal_event = IncrementalWorkflow().run(
+        inputs=Inputs(topic="rivers", audience="students"),
+        state=State(tone="casual"),
+        previous_run=workflow._store,
+    )
+
+    # THEN only the Node that references the state value runs again
+    assert executed_nodes == ["ToneNode"]
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.tone == "casual"
+    assert terminal_event.outputs.summary == "About RIVERS"
+
+
+def test_run__previous_run_state_writes_match_fresh_run():
+    # GIVEN a Node that references the topic and writes to the state as it runs
+    class TopicsState(BaseState):
+        topics: List[str] = []
+
+    class RecordTopicNode(BaseNode[TopicsState]):
+        topic = Inputs.topic
+
+        def run(self) -> BaseNode.Outputs:
+            executed_nodes.append("RecordTopicNode")
+            self.state.topics = [*self.state.topics, self.topic]
+            return self.Outputs()
+
+    class RecordingWorkflow(BaseWorkflow[Inputs, TopicsState]):
+        graph: ClassVar[Set[Union[Type[BaseNode], Graph]]] = {RecordTopicNode, AudienceNode}
+
+    # AND the Workflow has already run
+    workflow = RecordingWorkflow()
+    workflow.run(inputs=Inputs(topic="rivers", audience="students"))
+    previous_state = workflow.get_most_recent_state()
+    assert previous_state.topics == ["rivers"]
+
+    # WHEN we run it again incrementally with a different topic, and from scratch for comparison
+    incremental_workflow = RecordingWorkflow()
+    executed_nodes.clear()
+    terminal_event = incremental_workflow.run(
+        inputs=Inputs(topic="lakes", audience="students"), previous_run=previous_state
+    )
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    incremental_executed_nodes = list(executed_nodes)
+
+    fresh_workflow = RecordingWorkflow()
+    fresh_workflow.run(inputs=Inputs(topic="lakes", audience="students"))
+
+    # THEN only the affected Node runs again
+    assert incremental_executed_nodes == ["RecordTopicNode"]
+
+    # AND its writes apply to the same state as in a fresh run, rather than on top of the previous run's
+    assert incremental_workflow.get_most_recent_state().topics == ["lakes"]
+    assert fresh_workflow.get_most_recent_state().topics == ["lakes"]
+
+
+def test_get_affected_nodes__nested_references():
+    # GIVEN a Node that only references an input within its port conditions
+    class RouterNode(BaseNode):
+        class Ports(BaseNode.Ports):
+            lakes = Port.on_if(Inputs.topic.equals("lakes"))
+            other = Port.on_else()
+
+    # AND a Node that references the outputs of another lazily, within a collection
+    class ListNode(BaseNode):
+        titles = [LazyReference(lambda: TopicNode.Outputs.title)]
+
+    class NestedWorkflow(BaseWorkflow[Inputs, State]):
+        graph: ClassVar[Set[Union[Type[BaseNode], Graph]]] = {RouterNode, TopicNode >> ListNode, AudienceNode}
+
+    # WHEN we get the Nodes affected by a change to the topic
+    affected_nodes = get_affected_nodes(NestedWorkflow, changed_inputs=["topic"])
+
+    # THEN they include every Node that references it, however indirectly
+    assert affected_nodes == {RouterNode, TopicNode, ListNode}
+
+
+def test_run__previous_run_of_different_workflow():
+    # GIVEN the state of a run of a different Workflow
+    class OtherWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = AudienceNode
+
+    previous_state = OtherWorkflow().get_default_state()
+
+    # WHEN we try to run our Workflow incrementally from that state
+    with pytest.raises(ValueError) as exc_info:
+        IncrementalWorkflow().run(
+            inputs=Inputs(topic="rivers", audience="students"),
+            previous_run=previous_state,  # type: ignore[arg-type]
+        )
+
+    # THEN we get a helpful error
+    assert str(exc_info.value) == (
+        "Cannot run IncrementalWorkflow incrementally from the state of a different Workflow, "
+        "expected State but got BaseState"
+    )
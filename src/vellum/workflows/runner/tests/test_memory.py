@@ -0,0 +1,84 @@
+import tracemalloc
+
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.runner import InMemoryRunnerMetrics
+from vellum.workflows.runner.memory import MemoryMeasurement, start_memory_tracing, stop_memory_tracing
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+def test_memory_measurement__peak_and_retained():
+    # GIVEN memory tracing has been started
+    start_memory_tracing()
+    try:
+        # WHEN we measure a block that allocates a large temporary and a smaller value that outlives the block
+        with MemoryMeasurement() as memory:
+            temporary = bytearray(4_000_000)
+            retained = bytearray(1_000_000)
+            del temporary
+    finally:
+        stop_memory_tracing()
+
+    # THEN the peak includes the temporary allocation
+    assert memory.peak_bytes >= 5_000_000
+
+    # AND only the outliving value is retained
+    assert 1_000_000 <= memory.retained_bytes < 2_000_000
+    assert len(retained) == 1_000_000
+
+    # AND tracing was stopped since we started it
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_measurement__not_tracing():
+    # WHEN we measure a block without memory tracing started
+    with MemoryMeasurement() as memory:
+        bytearray(1_000_000)
+
+    # THEN nothing is measured
+    assert memory.peak_bytes == 0
+    assert memory.retained_bytes == 0
+
+
+class AllocatingNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        value: bytearray
+
+    def run(self) -> Outputs:
+        return self.Outputs(value=bytearray(2_000_000))
+
+
+class AllocatingWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+    graph = AllocatingNode
+
+
+def test_workflow_run__memory_profiling():
+    # GIVEN a metrics hook that records in memory
+    metrics = InMemoryRunnerMetrics()
+
+    # WHEN we run a workflow whose node allocates a large output with memory profiling enabled
+    final_event = AllocatingWorkflow().run(metrics=metrics, memory_profiling=True)
+    assert final_event.name == "workflow.execution.fulfilled"
+
+    # THEN the node's allocations are reported
+    assert metrics.get_histogram("node.peak_bytes", node="AllocatingNode")[0] >= 2_000_000
+    assert metrics.get_histogram("node.retained_bytes", node="AllocatingNode")[0] >= 2_000_000
+
+    # AND the state snapshot that copied the output is reported
+    assert max(metrics.get_histogram("runner.state_snapshot_retained_bytes")) >= 2_000_000
+
+    # AND tracing is stopped once the workflow completes
+    assert not tracemalloc.is_tracing()
+
+
+def test_workflow_run__memory_profiling_disabled():
+    # GIVEN a metrics hook that records in memory
+    metrics = InMemoryRunnerMetrics()
+
+    # WHEN we run a workflow without memory profiling
+    AllocatingWorkflow().run(metrics=metrics)
+
+    # THEN no memory metrics are reported
+    assert metrics.get_histogram("node.peak_bytes") == []
+    assert metrics.get_histogram("runner.state_snapshot_retained_bytes") == []
@@ -0,0 +1,123 @@
+import pytest
+from threading import Lock
+import time
+
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.core.inline_subworkflow_node.node import InlineSubworkflowNode
+from vellum.workflows.nodes.core.map_node.node import MapNode
+from vellum.workflows.runner import InMemoryRunnerMetrics, configure_resource_pools
+from vellum.workflows.runner.metrics import NODE_RESOURCE_POOL_WAIT
+from vellum.workflows.runner.resource_pools import clear_resource_pools, get_resource_pool
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+@pytest.fixture(autouse=True)
+def reset_resource_pools():
+    yield
+    clear_resource_pools()
+
+
+def test_run__resource_pool_caps_nested_nodes():
+    # GIVEN a pool of two slots
+    configure_resource_pools(test_pool=2)
+
+    # AND a Node in that pool that records how many of its executions run at once
+    lock = Lock()
+    running = 0
+    max_running = 0
+
+    class PooledNode(BaseNode):
+        class Execution(BaseNode.Execution):
+            resource_pools = ("test_pool",)
+
+        def run(self) -> BaseNode.Outputs:
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+            return self.Outputs()
+
+    # AND a MapNode that runs it in a subworkflow for each of several items, with no concurrency limit of its own
+    class IterationWorkflow(BaseWorkflow[MapNode.SubworkflowInputs, BaseState]):
+        graph = PooledNode
+
+    class PooledMapNode(MapNode):
+        items = list(range(6))
+        subworkflow = IterationWorkflow
+
+    class PooledWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = PooledMapNode
+
+    # WHEN we run the Workflow
+    metrics = InMemoryRunnerMetrics()
+    terminal_event = PooledWorkflow().run(metrics=metrics)
+
+    # THEN it's fulfilled
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+
+    # AND no more Nodes ran at once than the pool allows, even though they ran in separate subworkflows
+    assert max_running == 2
+
+    # AND every slot was released
+    pool = get_resource_pool("test_pool")
+    assert pool is not None
+    assert pool.in_use == 0
+
+
+def test_run__resource_pool_held_by_parent_node():
+    # GIVEN a pool with a single slot
+    configure_resource_pools(test_pool=1)
+
+    # AND a Node in that pool
+    class InnerNode(BaseNode):
+        class Execution(BaseNode.Execution):
+            resource_pools = ("test_pool",)
+
+        class Outputs(BaseNode.Outputs):
+            value = "inner"
+
+    class InnerWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = InnerNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            value = InnerNode.Outputs.value
+
+    # AND it runs within a subworkflow of a Node in the same pool
+    class OuterNode(InlineSubworkflowNode):
+        subworkflow = InnerWorkflow
+
+        class Execution(InlineSubworkflowNode.Execution):
+            resource_pools = ("test_pool",)
+
+    class OuterWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = OuterNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            value = OuterNode.Outputs.value
+
+    # WHEN we run the Workflow with metrics
+    metrics = InMemoryRunnerMetrics()
+    terminal_event = OuterWorkflow().run(metrics=metrics)
+
+    # THEN the inner Node runs in the slot held by the outer Node, rather than waiting on it forever
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.value == "inner"
+
+    # AND only the outer Node waited on the pool
+    assert len(metrics.get_histogram(NODE_RESOURCE_POOL_WAIT, workflow="OuterWorkflow", node="OuterNode")) == 1
+
+
+def test_configure_resource_pools__invalid_size():
+    # WHEN we configure a pool without any slots
+    with pytest.raises(ValueError) as exc_info:
+        configure_resource_pools(test_pool=0)
+
+    # THEN we get a helpful error
+    assert str(exc_info.value) == "Resource pool test_pool must have a size of at least 1, got 0"
@@ -0,0 +1,183 @@
+import pytest
+from threading import Event as ThreadingEvent
+import time
+from typing import Iterator, Optional
+
+from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.core.try_node.node import TryNode
+from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+
+def test_stream__node_timeout():
+    # GIVEN a Node that streams for much longer than its timeout
+    stream_closed = ThreadingEvent()
+
+    class SlowStreamingNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            value: str
+
+        class Execution(BaseNode.Execution):
+            timeout = 0.1
+
+        def run(self) -> Iterator[BaseOutput]:
+            try:
+                for _ in range(500):
+                    time.sleep(0.01)
+                    yield BaseOutput(name="value", delta="chunk")
+            finally:
+                stream_closed.set()
+
+    class TimeoutWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = SlowStreamingNode
+
+    # WHEN we stream the Workflow
+    started_at = time.monotonic()
+    events = list(TimeoutWorkflow().stream(event_filter=all_workflow_event_filter))
+
+    # THEN the Node is rejected once its timeout passes
+    node_rejected_events = [event for event in events if event.name == "node.execution.rejected"]
+    assert len(node_rejected_events) == 1
+    assert node_rejected_events[0].error.code == WorkflowErrorCode.NODE_TIMEOUT
+    assert node_rejected_events[0].error.message == "Node SlowStreamingNode exceeded its timeout of 0.1 seconds"
+
+    # AND so is the Workflow, without waiting on the Node
+    assert events[-1].name == "workflow.execution.rejected"
+    assert events[-1].error.code == WorkflowErrorCode.NODE_TIMEOUT
+    assert time.monotonic() - started_at < 2
+
+    # AND the Node stops streaming at its next chunk
+    assert stream_closed.wait(timeout=1)
+
+
+def test_run__workflow_timeout():
+    # GIVEN a Node that polls until it's cancelled
+    observed_cancellation = ThreadingEvent()
+
+    class PollingNode(BaseNode):
+        def run(self) -> BaseNode.Outputs:
+            started_at = time.monotonic()
+            while time.monotonic() - started_at < 5:
+                if self._context.is_cancelled:
+                    observed_cancellation.set()
+                    break
+                time.sleep(0.01)
+
+            return self.Outputs()
+
+    class TimeoutWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = PollingNode
+
+    # WHEN we run the Workflow with a timeout
+    terminal_event = TimeoutWorkflow().run(timeout=0.1)
+
+    # THEN the Workflow is rejected once the timeout passes
+    assert terminal_event.name == "workflow.execution.rejected"
+    assert terminal_event.error.code == WorkflowErrorCode.WORKFLOW_TIMEOUT
+    assert terminal_event.error.message == "Workflow exceeded its timeout of 0.1 seconds"
+
+    # AND the running Node is cancelled
+    assert observed_cancellation.wait(timeout=1)
+
+
+def test_run__node_timeout_handled_by_try_node():
+    # GIVEN a Node that times out, wrapped in a TryNode
+    @TryNode.wrap()
+    class SlowNode(BaseNode):
+        class Execution(BaseNode.Execution):
+            timeout = 0.05
+
+        def run(self) -> BaseNode.Outputs:
+            while not self._context.is_cancelled:
+                time.sleep(0.01)
+
+            return self.Outputs()
+
+    class TimeoutWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = SlowNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            error = SlowNode.Outputs.error
+
+    # WHEN we run the Workflow
+    terminal_event = TimeoutWorkflow().run()
+
+    # THEN the TryNode handles the timeout like any other error
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.error.code == WorkflowErrorCode.NODE_TIMEOUT
+
+
+def test_run__node_within_timeout():
+    # GIVEN a Node that finishes well within its timeout
+    class FastNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            value: str
+
+        class Execution(BaseNode.Execution):
+            timeout = 5
+
+        def run(self) -> Outputs:
+            return self.Outputs(value="done")
+
+    class FastWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = FastNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            value = FastNode.Outputs.value
+
+    # WHEN we run the Workflow with a timeout of its own
+    started_at = time.monotonic()
+    terminal_event = FastWorkflow().run(timeout=5)
+
+    # THEN it's fulfilled without waiting on either timeout
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert terminal_event.outputs.value == "done"
+    assert time.monotonic() - started_at < 1
+
+
+@pytest.mark.parametrize(
+    ["node_timeout", "workflow_timeout", "error_code"],
+    [(0.1, None, WorkflowErrorCode.NODE_TIMEOUT), (None, 0.1, WorkflowErrorCode.WORKFLOW_TIMEOUT)],
+    ids=["node", "workflow"],
+)
+def test_run__timeout_closes_blocked_stream(
+    node_timeout: Optional[float], workflow_timeout: Optional[float], error_code: WorkflowErrorCode
+):
+    # GIVEN a stream that blocks until it's closed, like a response that stalls
+    stream_closed = ThreadingEvent()
+
+    class BlockingStream:
+        def close(self) -> None:
+            stream_closed.set()
+
+    # AND a Node that consumes it
+    node_finished = ThreadingEvent()
+
+    class BlockedNode(BaseNode):
+        class Execution(BaseNode.Execution):
+            timeout = node_timeout
+
+        def run(self) -> BaseNode.Outputs:
+            with self._context._closing_on_cancel(BlockingStream()):
+                stream_closed.wait(timeout=10)
+
+            node_finished.set()
+            return self.Outputs()
+
+    class TimeoutWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = BlockedNode
+
+    # WHEN we run the Workflow
+    terminal_event = TimeoutWorkflow().run(timeout=workflow_timeout)
+
+    # THEN the Workflow is rejected once the timeout passes
+    assert terminal_event.name == "workflow.execution.rejected"
+    assert terminal_event.error.code == error_code
+
+    # AND the stream was closed from the runner, rather than left blocking the Node
+    assert stream_closed.wait(timeout=1)
+    assert node_finished.wait(timeout=1)
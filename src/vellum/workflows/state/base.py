@@ -5,7 +5,21 @@ from datetime import datetime
 from queue import Queue
 from threading import Lock
 from uuid import UUID, uuid4
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
 from typing_extensions import dataclass_transform
 
 from pydantic import GetCoreSchemaHandler, field_serializer
@@ -102,25 +116,38 @@ class NodeExecutionCache:
         node_executions_fulfilled: Optional[Dict[str, Sequence[str]]] = None,
         node_executions_initiated: Optional[Dict[str, Sequence[str]]] = None,
         node_executions_queued: Optional[Dict[str, Sequence[str]]] = None,
+        node_classes: Optional[Mapping[str, Type["BaseNode"]]] = None,
     ) -> None:
         self._dependencies_invoked = defaultdict(set)
         self._node_executions_fulfilled = defaultdict(Stack[UUID])
         self._node_executions_initiated = defaultdict(set)
         self._node_executions_queued = defaultdict(list)
 
+        # Each Node appears in several of the dumped mappings, so it's only looked up once
+        resolved_node_classes: Dict[str, Type["BaseNode"]] = {}
+
+        def get_node_class(qualname: str) -> Type["BaseNode"]:
+            node_class = resolved_node_classes.get(qualname)
+            if node_class is None:
+                # Nodes that can't be imported by name, e.g. ones declared within a function, can be provided directly
+                node_class = (node_classes.get(qualname) if node_classes else None) or get_class_by_qualname(qualname)
+                resolved_node_classes[qualname] = node_class
+
+            return node_class
+
         for execution_id, dependencies in (dependencies_invoked or {}).items():
-            self._dependencies_invoked[UUID(execution_id)] = {get_class_by_qualname(dep) for dep in dependencies}
+            self._dependencies_invoked[UUID(execution_id)] = {get_node_class(dep) for dep in dependencies}
 
         for node, execution_ids in (node_executions_fulfilled or {}).items():
-            node_class = get_class_by_qualname(node)
+            node_class = get_node_class(node)
             self._node_executions_fulfilled[node_class].extend(UUID(execution_id) for execution_id in execution_ids)
 
         for node, execution_ids in (node_executions_initiated or {}).items():
-            node_class = get_class_by_qualname(node)
+            node_class = get_node_class(node)
             self._node_executions_initiated[node_class].update({UUID(execution_id) for execution_id in execution_ids})
 
         for node, execution_ids in (node_executions_queued or {}).items():
-            node_class = get_class_by_qualname(node)
+            node_class = get_node_class(node)
             self._node_executions_queued[node_class].extend(UUID(execution_id) for execution_id in execution_ids)
 
     def _invoke_dependency(
@@ -375,9 +402,9 @@ class BaseState(metaclass=_BaseStateMeta):
     def __snapshot__(self) -> None:
         """
         Snapshots the current state to the workflow emitter. The invoked callback is overridden by the
-        workflow runner.
+        workflow runner, which is responsible for copying the state.
         """
-        self.__snapshot_callback__(deepcopy(self))
+        self.__snapshot_callback__(self)
 
     @classmethod
     def __get_pydantic_core_schema__(
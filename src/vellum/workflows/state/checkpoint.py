@@ -0,0 +1,180 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import json
+import os
+import sqlite3
+import tempfile
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Generic, List, Optional, Sequence, Type
+
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.codec import get_state_codec
+from vellum.workflows.state.encoder import to_json_bytes
+from vellum.workflows.types.generics import StateType
+
+if TYPE_CHECKING:
+    from vellum.workflows.workflows.base import BaseWorkflow
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class Checkpoint(Generic[StateType]):
+    """
+    The state of a Workflow run at a node boundary, along with the Nodes that were running or queued to run at the
+    time, which are run again when the Workflow is resumed from the checkpoint.
+    """
+
+    state: StateType
+    frontier: List[Type[BaseNode]]
+
+
+class BaseCheckpointer(ABC):
+    """
+    Durably stores the latest checkpoint of a Workflow run, so that it can be resumed in another process with
+    `BaseWorkflow.resume_from_checkpoint`. The Workflow Runner saves a checkpoint each time a Node is fulfilled while
+    others are still left to run, and clears it once the Workflow is fulfilled.
+    """
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def read(self) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def save(
+        self,
+        workflow_class: Type["BaseWorkflow"],
+        state: BaseState,
+        frontier: Sequence[Type[BaseNode]],
+    ) -> None:
+        self.write(encode_checkpoint(workflow_class, state, frontier))
+
+    def load(self, workflow_class: Type["BaseWorkflow[Any, StateType]"]) -> Optional[Checkpoint[StateType]]:
+        data = self.read()
+        if data is None:
+            return None
+
+        return decode_checkpoint(workflow_class, data)
+
+
+class FileCheckpointer(BaseCheckpointer):
+    """
+    Stores the latest checkpoint as a JSON file at `path`. Each checkpoint is written to a temporary file that then
+    replaces the previous one, so that a process that's stopped mid-write leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def write(self, data: bytes) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(data)
+                temporary_file.flush()
+                os.fsync(temporary_file.fileno())
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def read(self) -> Optional[bytes]:
+        try:
+            with open(self.path, "rb") as checkpoint_file:
+                return checkpoint_file.read()
+        except FileNotFoundError:
+            return None
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteCheckpointer(BaseCheckpointer):
+    """
+    Stores the latest checkpoint of the run identified by `key` in a SQLite database at `path`, which may be shared
+    by the checkpointers of many runs.
+    """
+
+    def __init__(self, path: str, key: str):
+        self.path = path
+        self.key = key
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints (key TEXT PRIMARY KEY, data BLOB NOT NULL)"
+            )
+
+    def write(self, data: bytes) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (key, data) VALUES (?, ?)",
+                (self.key, data),
+            )
+
+    def read(self) -> Optional[bytes]:
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM checkpoints WHERE key = ?", (self.key,)).fetchone()
+
+        return bytes(row[0]) if row else None
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM checkpoints WHERE key = ?", (self.key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _get_workflow_name(workflow_class: Type["BaseWorkflow"]) -> str:
+    return f"{workflow_class.__module__}.{workflow_class.__qualname__}"
+
+
+def encode_checkpoint(
+    workflow_class: Type["BaseWorkflow"],
+    state: BaseState,
+    frontier: Sequence[Type[BaseNode]],
+) -> bytes:
+    # Outputs that were still streaming and external inputs that were still awaited are left out of the state. The
+    # Nodes they belong to are part of the frontier, and run again once resumed
+    return to_json_bytes(
+        {
+            "version": CHECKPOINT_VERSION,
+            "workflow": _get_workflow_name(workflow_class),
+            "frontier": [str(node) for node in frontier],
+            "state": get_state_codec(workflow_class).to_dict(state),
+        }
+    )
+
+
+def decode_checkpoint(workflow_class: Type["BaseWorkflow[Any, StateType]"], data: bytes) -> Checkpoint[StateType]:
+    checkpoint = json.loads(data)
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {checkpoint.get('version')}")
+
+    workflow_name = _get_workflow_name(workflow_class)
+    if checkpoint["workflow"] != workflow_name:
+        raise ValueError(f"Checkpoint belongs to {checkpoint['workflow']}, not {workflow_name}")
+
+    node_classes = {str(node): node for node in workflow_class.get_nodes()}
+    frontier = []
+    for node_name in checkpoint["frontier"]:
+        if node_name not in node_classes:
+            raise ValueError(f"Checkpoint resumes from {node_name}, which is not a Node of {workflow_name}")
+        frontier.append(node_classes[node_name])
+
+    state = get_state_codec(workflow_class).from_dict(checkpoint["state"])
+    return Checkpoint(state=state, frontier=frontier)
@@ -0,0 +1,240 @@
+import inspect
+import json
+from queue import Queue
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Literal, Optional, Tuple, Type, Union
+
+from pydantic import TypeAdapter
+from pydantic.errors import PydanticSchemaGenerationError
+
+from vellum.workflows.constants import undefined
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state.base import NodeExecutionCache, StateMeta
+from vellum.workflows.state.encoder import to_json_bytes, to_json_compatible
+from vellum.workflows.types.generics import StateType
+from vellum.workflows.types.utils import infer_types
+
+if TYPE_CHECKING:
+    from vellum.workflows.workflows.base import BaseWorkflow
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+StateFormat = Literal["json", "msgpack"]
+
+Decoder = Callable[[Any], Any]
+
+
+def _decode_identity(value: Any) -> Any:
+    return value
+
+
+def _is_state_value(value: Any) -> bool:
+    # `BaseState.__iter__` also yields the methods and properties declared on a state class
+    return not (inspect.isroutine(value) or inspect.isclass(value) or isinstance(value, (property, classmethod)))
+
+
+class StateCodec(Generic[StateType]):
+    """
+    Encodes the states of a Workflow into JSON or msgpack, and decodes them back into instances of its state class.
+
+    Values are decoded into the types they're annotated with, e.g. on the state class or on a Node's Outputs, so that
+    pydantic models, dataclasses, datetimes and the like survive the round trip. Values typed as `Any` are left as
+    JSON compatible python. Everything that's looked up by name while decoding is resolved once per codec, so use
+    `get_state_codec` to share one codec per Workflow.
+
+    Outputs that are still streaming, external inputs that are still awaited and the parent state of a subworkflow
+    aren't encoded.
+    """
+
+    def __init__(self, workflow_class: Type["BaseWorkflow[Any, StateType]"]):
+        self.workflow_class = workflow_class
+        self._state_class = workflow_class.get_state_class()
+        self._inputs_class = workflow_class.get_inputs_class()
+        self._node_classes: Dict[str, Type[BaseNode]] = {str(node): node for node in workflow_class.get_nodes()}
+        self._outputs_by_name = {str(output): output for node in self._node_classes.values() for output in node.Outputs}
+        self._external_inputs_by_name = {
+            str(external_input): external_input
+            for node in self._node_classes.values()
+            for external_input in node.ExternalInputs
+        }
+        self._input_types = {reference.name: reference.types for reference in self._inputs_class}
+        self._decoders: Dict[Tuple[Any, ...], Decoder] = {}
+        self._state_value_decoders: Dict[str, Decoder] = {}
+
+    def _get_decoder(self, types: Tuple[Any, ...]) -> Decoder:
+        try:
+            return self._decoders[types]
+        except KeyError:
+            pass
+
+        decoder: Decoder = _decode_identity
+        if types and Any not in types:
+            try:
+                decoder = TypeAdapter(Union[types]).validate_python  # type: ignore[arg-type]
+            except PydanticSchemaGenerationError:
+                # Types that pydantic can't validate are left as they were encoded
+                pass
+
+        self._decoders[types] = decoder
+        return decoder
+
+    def _get_state_value_decoder(self, name: str) -> Decoder:
+        try:
+            return self._state_value_decoders[name]
+        except KeyError:
+            pass
+
+        try:
+            decoder = self._get_decoder(infer_types(self._state_class, name))
+        except AttributeError:
+            # Values that were set on the state without being declared on its class
+            decoder = _decode_identity
+
+        self._state_value_decoders[name] = decoder
+        return decoder
+
+    def to_dict(self, state: StateType) -> Dict[str, Any]:
+        """
+        Converts a state into JSON compatible python.
+        """
+
+        meta = state.meta
+        encoded_state = {
+            name: to_json_compatible(value)
+            for name, value in state
+            if isinstance(name, str) and name != "meta" and not name.startswith("_") and _is_state_value(value)
+        }
+        encoded_state["meta"] = {
+            "id": str(meta.id),
+            "trace_id": str(meta.trace_id),
+            "span_id": str(meta.span_id),
+            "updated_ts": meta.updated_ts.isoformat(),
+            "workflow_inputs": to_json_compatible(meta.workflow_inputs),
+            "external_inputs": {
+                str(external_input): to_json_compatible(value)
+                for external_input, value in meta.external_inputs.items()
+                if value is not undefined
+            },
+            "node_outputs": {
+                str(output): to_json_compatible(value)
+                for output, value in meta.node_outputs.items()
+                if not isinstance(value, Queue)
+            },
+            "node_execution_cache": to_json_compatible(meta.node_execution_cache),
+        }
+        return encoded_state
+
+    def from_dict(self, encoded_state: Dict[str, Any]) -> StateType:
+        """
+        Rebuilds a state from the JSON compatible python returned by `to_dict`.
+        """
+
+        encoded_meta = encoded_state["meta"]
+        workflow_name = self.workflow_class.__name__
+
+        node_outputs = {}
+        for output_name, value in encoded_meta["node_outputs"].items():
+            output = self._outputs_by_name.get(output_name)
+            if output is None:
+                raise ValueError(f"State has a value for {output_name}, which is not an output of {workflow_name}")
+            node_outputs[output] = self._get_decoder(output.types)(value)
+
+        external_inputs = {}
+        for external_input_name, value in encoded_meta["external_inputs"].items():
+            external_input = self._external_inputs_by_name.get(external_input_name)
+            if external_input is None:
+                raise ValueError(
+                    f"State has a value for external input {external_input_name}, which {workflow_name} doesn't expect"
+                )
+            external_inputs[external_input] = self._get_decoder(external_input.types)(value)
+
+        workflow_inputs = {
+            name: self._get_decoder(self._input_types[name])(value) if name in self._input_types else value
+            for name, value in encoded_meta["workflow_inputs"].items()
+        }
+
+        meta = StateMeta(
+            id=encoded_meta["id"],
+            trace_id=encoded_meta["trace_id"],
+            span_id=encoded_meta["span_id"],
+            updated_ts=encoded_meta["updated_ts"],
+            workflow_inputs=self._inputs_class(**workflow_inputs),
+            external_inputs=external_inputs,
+            node_outputs=node_outputs,
+            node_execution_cache=NodeExecutionCache(
+                **encoded_meta["node_execution_cache"],
+                node_classes=self._node_classes,
+            ),
+        )
+        state_values = {
+            name: self._get_state_value_decoder(name)(value) for name, value in encoded_state.items() if name != "meta"
+        }
+        return self._state_class(meta=meta, **state_values)
+
+    def encode(self, state: StateType, format: StateFormat = "json") -> bytes:
+        """
+        Serializes a state into compact JSON, or into msgpack when `format` is "msgpack".
+        """
+
+        if format == "msgpack":
+            return _get_msgpack().packb(self.to_dict(state), use_bin_type=True)
+
+        return to_json_bytes(self.to_dict(state))
+
+    def decode(self, data: bytes, format: StateFormat = "json") -> StateType:
+        """
+        Deserializes a state serialized by `encode` in the same format.
+        """
+
+        if format == "msgpack":
+            return self.from_dict(_get_msgpack().unpackb(data, raw=False))
+
+        return self.from_dict(orjson.loads(data) if orjson is not None else json.loads(data))
+
+
+def _get_msgpack() -> Any:
+    if msgpack is None:
+        raise ImportError("The msgpack state format requires the `msgpack` package to be installed")
+
+    return msgpack
+
+
+def get_state_codec(workflow_class: Type["BaseWorkflow[Any, StateType]"]) -> StateCodec[StateType]:
+    """
+    Returns the codec for the states of a Workflow, creating it the first time it's requested, and again whenever the
+    Workflow's graph changes.
+    """
+
+    # The codec lives on the Workflow class itself, so it's released along with the Workflow, and is keyed on the
+    # resolved graph, which is replaced whenever the graph is reassigned or extended
+    resolved_graph = workflow_class._get_resolved_graph()
+    cached_codec: Optional[Tuple[Any, StateCodec[StateType]]] = workflow_class.__dict__.get("__state_codec__")
+    if cached_codec is not None and cached_codec[0] is resolved_graph:
+        return cached_codec[1]
+
+    state_codec = StateCodec(workflow_class)
+    setattr(workflow_class, "__state_codec__", (resolved_graph, state_codec))
+    return state_codec
+
+
+def encode_state(
+    workflow_class: Type["BaseWorkflow[Any, StateType]"],
+    state: StateType,
+    format: StateFormat = "json",
+) -> bytes:
+    return get_state_codec(workflow_class).encode(state, format)
+
+
+def decode_state(
+    workflow_class: Type["BaseWorkflow[Any, StateType]"],
+    data: bytes,
+    format: StateFormat = "json",
+) -> StateType:
+    return get_state_codec(workflow_class).decode(data, format)
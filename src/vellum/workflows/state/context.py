@@ -1,9 +1,14 @@
+from contextlib import contextmanager
 from functools import cached_property
+import logging
 from queue import Queue
-from typing import TYPE_CHECKING, Dict, List, Optional, Type
+from threading import Event as ThreadingEvent, Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type
 
 from vellum import Vellum
 from vellum.workflows.context import ExecutionContext, get_execution_context
+from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.exceptions import NodeException
 from vellum.workflows.nodes.mocks import MockNodeExecution, MockNodeExecutionArg
 from vellum.workflows.outputs.base import BaseOutputs
 from vellum.workflows.references.constant import ConstantValueReference
@@ -12,6 +17,8 @@ from vellum.workflows.vellum_client import create_vellum_client
 if TYPE_CHECKING:
     from vellum.workflows.events.workflow import WorkflowEvent
 
+logger = logging.getLogger(__name__)
+
 
 class WorkflowContext:
     def __init__(
@@ -21,7 +28,14 @@ class WorkflowContext:
         execution_context: Optional[ExecutionContext] = None,
     ):
         self._vellum_client = vellum_client
+        # Set for the contexts of subworkflows, which are run inline by a Node of the parent Workflow
+        self._parent_workflow_context: Optional["WorkflowContext"] = None
+        # Inputs that the Node running the subworkflow shares across its runs, which aren't copied into each run
+        self._shared_inputs: Tuple[Any, ...] = ()
         self._event_queue: Optional[Queue["WorkflowEvent"]] = None
+        self._cancel_signal: Optional[ThreadingEvent] = None
+        self._cancel_callbacks: List[Callable[[], None]] = []
+        self._cancel_callbacks_lock = Lock()
         self._node_output_mocks_map: Dict[Type[BaseOutputs], List[MockNodeExecution]] = {}
         self._execution_context = get_execution_context()
         if not self._execution_context.parent_context and execution_context:
@@ -32,6 +46,9 @@ class WorkflowContext:
         if self._vellum_client:
             return self._vellum_client
 
+        if self._parent_workflow_context:
+            return self._parent_workflow_context.vellum_client
+
         return create_vellum_client()
 
     @cached_property
@@ -42,9 +59,119 @@ class WorkflowContext:
     def node_output_mocks_map(self) -> Dict[Type[BaseOutputs], List[MockNodeExecution]]:
         return self._node_output_mocks_map
 
+    @property
+    def is_cancelled(self) -> bool:
+        """
+        Whether the Workflow run, or that of any Workflow running it as a subworkflow, has been cancelled, or the Node
+        using this context has timed out. Nodes that block for a long time, e.g. while polling or consuming a stream,
+        should check this periodically and stop early.
+        """
+
+        if self._cancel_signal is not None and self._cancel_signal.is_set():
+            return True
+
+        return self._parent_workflow_context is not None and self._parent_workflow_context.is_cancelled
+
+    @property
+    def _is_subworkflow_context(self) -> bool:
+        return self._parent_workflow_context is not None
+
+    @property
+    def _is_cancellable(self) -> bool:
+        if self._cancel_signal is not None:
+            return True
+
+        return self._parent_workflow_context is not None and self._parent_workflow_context._is_cancellable
+
+    def _create_subworkflow_context(self, shared_inputs: Sequence[Any] = ()) -> "WorkflowContext":
+        """
+        Creates the context for a subworkflow that a Node runs. The subworkflow shares this context's Vellum client,
+        which is only created once a Node needs it, along with its Node output mocks and cancel signal, and is run
+        inline on the Node's thread rather than on a stream thread of its own.
+
+        The subworkflow's inputs are deep copied like any other Workflow's, except for the values in `shared_inputs`,
+        which are passed to the subworkflow by reference, e.g. the items that every iteration of a Map Node reads.
+
+        The subworkflow still has a runner of its own, which holds its state and tracks its Nodes' dependencies, and
+        its Nodes still run on worker threads of their own. They can't be handed to the parent runner, since the Node
+        running the subworkflow blocks until they're done.
+        """
+
+        context = WorkflowContext(vellum_client=self._vellum_client)
+        context._parent_workflow_context = self
+        context._node_output_mocks_map = self._node_output_mocks_map
+        context._shared_inputs = tuple(shared_inputs)
+        return context
+
+    def _create_node_context(self) -> "WorkflowContext":
+        """
+        Creates the context for a single Node execution, which can be cancelled on its own, e.g. once the Node times
+        out, along with any subworkflows it runs. Everything else is shared with this context.
+        """
+
+        context = self._create_subworkflow_context()
+        context._execution_context = self._execution_context
+        context._cancel_signal = ThreadingEvent()
+        return context
+
     def _emit_subworkflow_event(self, event: "WorkflowEvent") -> None:
         if self._event_queue:
             self._event_queue.put(event)
+        elif self._parent_workflow_context:
+            # Node contexts have no runner of their own, so events go to the Workflow running the Node
+            self._parent_workflow_context._emit_subworkflow_event(event)
+
+    def _raise_if_cancelled(self) -> None:
+        if self.is_cancelled:
+            raise NodeException(message="Workflow run cancelled", code=WorkflowErrorCode.WORKFLOW_CANCELLED)
+
+    def _cancel(self) -> None:
+        if self._cancel_signal is not None:
+            self._cancel_signal.set()
+
+        with self._cancel_callbacks_lock:
+            cancel_callbacks, self._cancel_callbacks = self._cancel_callbacks, []
+
+        for cancel_callback in cancel_callbacks:
+            try:
+                cancel_callback()
+            except Exception:
+                logger.exception("Failed to run a callback of a cancelled Workflow context")
+
+    @contextmanager
+    def _closing_on_cancel(self, stream: Any) -> Iterator[None]:
+        """
+        Closes `stream`, e.g. the response that a Node is consuming, once the block exits, or as soon as this context
+        is cancelled from the runner's thread, rather than only once the Node next checks whether it's been cancelled.
+        """
+
+        close = getattr(stream, "close", None)
+        if close is None:
+            yield
+            return
+
+        def close_stream() -> None:
+            try:
+                close()
+            except ValueError:
+                # A generator can't be closed while another thread is running it, so it's left to stop once the Node
+                # checks for cancellation at its next item
+                pass
+
+        with self._cancel_callbacks_lock:
+            self._cancel_callbacks.append(close_stream)
+        try:
+            if self.is_cancelled:
+                close_stream()
+            yield
+        finally:
+            with self._cancel_callbacks_lock:
+                if close_stream in self._cancel_callbacks:
+                    self._cancel_callbacks.remove(close_stream)
+            close_stream()
+
+    def _register_cancel_signal(self, cancel_signal: Optional[ThreadingEvent]) -> None:
+        self._cancel_signal = cancel_signal
 
     def _register_event_queue(self, event_queue: Queue["WorkflowEvent"]) -> None:
         self._event_queue = event_queue
@@ -1,10 +1,12 @@
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 import enum
+import json
 from json import JSONEncoder
 from queue import Queue
 from uuid import UUID
-from typing import Any, Callable, Dict, Type
+from weakref import WeakKeyDictionary
+from typing import Any, Callable, Dict, Optional, Set, Type
 
 from pydantic import BaseModel
 
@@ -14,50 +16,233 @@ from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
 from vellum.workflows.ports.port import Port
 from vellum.workflows.state.base import BaseState, NodeExecutionCache
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+Encoder = Callable[[Any], Any]
+MarkedEncoder = Callable[[Any, Set[int]], Any]
+
 
 class DefaultStateEncoder(JSONEncoder):
     encoders: Dict[Type, Callable] = {}
 
     def default(self, obj: Any) -> Any:
-        if isinstance(obj, BaseState):
-            return dict(obj)
+        # `type()` rather than `__class__`, since `undefined` reports itself as its own class
+        default_encoder = _get_default_encoder(type(obj))
+        if default_encoder:
+            return default_encoder(obj)
 
-        if isinstance(obj, (BaseInputs, BaseOutputs)):
-            return {descriptor.name: value for descriptor, value in obj if value is not undefined}
+        if obj.__class__ in self.encoders:
+            return self.encoders[obj.__class__](obj)
 
-        if isinstance(obj, (BaseOutput, Port)):
-            return obj.serialize()
+        return super().default(obj)
 
-        if isinstance(obj, NodeExecutionCache):
-            return obj.dump()
 
-        if isinstance(obj, UUID):
-            return str(obj)
+def _encode_dataclass(obj: Any) -> Any:
+    # Technically, obj is DataclassInstance | type[DataclassInstance], but asdict expects a DataclassInstance
+    # in practice, we only ever pass the former
+    return asdict(obj)
 
-        if isinstance(obj, set):
-            return list(obj)
 
-        if isinstance(obj, BaseModel):
-            return obj.model_dump()
+def _resolve_default_encoder(obj_type: Type) -> Optional[Encoder]:
+    if issubclass(obj_type, BaseState):
+        return dict
 
-        if isinstance(obj, datetime):
-            return obj.isoformat()
+    if issubclass(obj_type, (BaseInputs, BaseOutputs)):
+        return lambda obj: {descriptor.name: value for descriptor, value in obj if value is not undefined}
 
-        if isinstance(obj, enum.Enum):
-            return obj.value
+    if issubclass(obj_type, (BaseOutput, Port)):
+        return lambda obj: obj.serialize()
 
-        if isinstance(obj, Queue):
-            return list(obj.queue)
+    if issubclass(obj_type, NodeExecutionCache):
+        return lambda obj: obj.dump()
 
-        if is_dataclass(obj):
-            # Technically, obj is DataclassInstance | type[DataclassInstance], but asdict expects a DataclassInstance
-            # in practice, we only ever pass the former
-            return asdict(obj)  # type: ignore[call-overload]
+    if issubclass(obj_type, UUID):
+        return str
 
-        if isinstance(obj, type):
-            return str(obj)
+    if issubclass(obj_type, set):
+        return list
 
-        if obj.__class__ in self.encoders:
-            return self.encoders[obj.__class__](obj)
+    if issubclass(obj_type, BaseModel):
+        return lambda obj: obj.model_dump()
 
-        return super().default(obj)
+    if issubclass(obj_type, datetime):
+        return lambda obj: obj.isoformat()
+
+    if issubclass(obj_type, enum.Enum):
+        return lambda obj: obj.value
+
+    if issubclass(obj_type, Queue):
+        return lambda obj: list(obj.queue)
+
+    if is_dataclass(obj_type):
+        return _encode_dataclass
+
+    if issubclass(obj_type, type):
+        return str
+
+    return None
+
+
+# Weakly keyed, so that types created dynamically, e.g. pydantic models, aren't held onto by the cache
+_default_encoders: "WeakKeyDictionary[Type, Optional[Encoder]]" = WeakKeyDictionary()
+
+
+def _get_default_encoder(obj_type: Type) -> Optional[Encoder]:
+    """
+    Returns the `DefaultStateEncoder` conversion for a type, resolving the chain of subclass checks once per type.
+    """
+
+    try:
+        return _default_encoders[obj_type]
+    except KeyError:
+        default_encoder = _resolve_default_encoder(obj_type)
+        _default_encoders[obj_type] = default_encoder
+        return default_encoder
+
+
+def _encode_key(key: Any) -> str:
+    # Mirrors the key coercion performed by `json.dumps`
+    if isinstance(key, str):
+        return str.__str__(key)
+
+    if isinstance(key, float):
+        if key != key:
+            return "NaN"
+        if key == float("inf"):
+            return "Infinity"
+        if key == float("-inf"):
+            return "-Infinity"
+        return float.__repr__(key)
+
+    if key is True:
+        return "true"
+
+    if key is False:
+        return "false"
+
+    if key is None:
+        return "null"
+
+    if isinstance(key, int):
+        return int.__repr__(key)
+
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+def _encode_identity(obj: Any, markers: Set[int]) -> Any:
+    return obj
+
+
+def _mark(obj: Any, markers: Set[int]) -> int:
+    # Mirrors the circular reference check performed by `json.dumps`
+    marker = id(obj)
+    if marker in markers:
+        raise ValueError("Circular reference detected")
+
+    markers.add(marker)
+    return marker
+
+
+def _encode_mapping(obj: Dict[Any, Any], markers: Set[int]) -> Dict[str, Any]:
+    marker = _mark(obj, markers)
+    encoded = {_encode_key(key): _to_json_compatible(value, markers) for key, value in obj.items()}
+    markers.discard(marker)
+    return encoded
+
+
+def _encode_sequence(obj: Any, markers: Set[int]) -> Any:
+    marker = _mark(obj, markers)
+    encoded = [_to_json_compatible(item, markers) for item in obj]
+    markers.discard(marker)
+    return encoded
+
+
+def _resolve_encoder(obj_type: Type) -> MarkedEncoder:
+    if obj_type in (str, int, float, bool, type(None)):
+        return _encode_identity
+
+    if issubclass(obj_type, str):
+        return lambda obj, markers: str.__str__(obj)
+
+    if issubclass(obj_type, int):
+        return lambda obj, markers: int.__int__(obj)
+
+    if issubclass(obj_type, float):
+        return lambda obj, markers: float.__float__(obj)
+
+    if issubclass(obj_type, (list, tuple)):
+        return _encode_sequence
+
+    if issubclass(obj_type, dict):
+        return _encode_mapping
+
+    default_encoder = _get_default_encoder(obj_type)
+    if default_encoder:
+
+        def encode_with_default_encoder(obj: Any, markers: Set[int]) -> Any:
+            marker = _mark(obj, markers)
+            encoded = _to_json_compatible(default_encoder(obj), markers)
+            markers.discard(marker)
+            return encoded
+
+        return encode_with_default_encoder
+
+    def encode_with_registered_encoder(obj: Any, markers: Set[int]) -> Any:
+        # Registered encoders can change at any time, so they are looked up on every call
+        registered_encoder = DefaultStateEncoder.encoders.get(obj.__class__)
+        if registered_encoder is None:
+            raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+        marker = _mark(obj, markers)
+        encoded = _to_json_compatible(registered_encoder(obj), markers)
+        markers.discard(marker)
+        return encoded
+
+    return encode_with_registered_encoder
+
+
+_encoders: "WeakKeyDictionary[Type, MarkedEncoder]" = WeakKeyDictionary()
+
+
+def _to_json_compatible(obj: Any, markers: Set[int]) -> Any:
+    # `type()` rather than `__class__`, since `undefined` reports itself as its own class
+    obj_type = type(obj)
+    try:
+        encoder = _encoders[obj_type]
+    except KeyError:
+        encoder = _resolve_encoder(obj_type)
+        _encoders[obj_type] = encoder
+
+    return encoder(obj, markers)
+
+
+def to_json_compatible(obj: Any) -> Any:
+    """
+    Converts a value into plain JSON-compatible Python in a single pass.
+
+    The result is the same as `json.loads(json.dumps(obj, cls=DefaultStateEncoder))`, but without producing an
+    intermediate string. The conversion for each type is resolved once and cached.
+    """
+
+    return _to_json_compatible(obj, set())
+
+
+def to_json_bytes(obj: Any) -> bytes:
+    """
+    Serializes a value into compact, UTF-8 encoded JSON using the same conversions as `DefaultStateEncoder`.
+
+    Uses `orjson` when it is installed. Note that `orjson` writes non-finite floats as `null`.
+    """
+
+    json_compatible = to_json_compatible(obj)
+    if orjson is not None:
+        try:
+            return orjson.dumps(json_compatible)
+        except orjson.JSONEncodeError:
+            # e.g. integers that exceed 64 bits
+            pass
+
+    return json.dumps(json_compatible, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
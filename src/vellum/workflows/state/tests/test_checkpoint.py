@@ -0,0 +1,171 @@
+import pytest
+import os
+from threading import Event as ThreadingEvent
+from typing import List
+
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.checkpoint import BaseCheckpointer, FileCheckpointer, SQLiteCheckpointer
+from vellum.workflows.types.core import MergeBehavior
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+
+class Inputs(BaseInputs):
+    topic: str
+
+
+class State(BaseState):
+    started_with: str = ""
+
+
+executed_nodes: List[str] = []
+branch_b_fulfilled = ThreadingEvent()
+worker_is_recycled = True
+
+
+class StartNode(BaseNode[State]):
+    topic = Inputs.topic
+
+    class Outputs(BaseNode.Outputs):
+        topic: str
+
+    def run(self) -> Outputs:
+        executed_nodes.append("StartNode")
+        self.state.started_with = self.topic
+        return self.Outputs(topic=self.topic)
+
+
+class BranchANode(BaseNode):
+    topic = StartNode.Outputs.topic
+
+    class Outputs(BaseNode.Outputs):
+        value: str
+
+    def run(self) -> Outputs:
+        executed_nodes.append("BranchANode")
+        branch_b_fulfilled.wait(timeout=1)
+        if worker_is_recycled:
+            raise Exception("Worker was recycled")
+
+        return self.Outputs(value=f"a:{self.topic}")
+
+
+class BranchBNode(BaseNode):
+    topic = StartNode.Outputs.topic
+
+    class Outputs(BaseNode.Outputs):
+        value: str
+
+    def run(self) -> Outputs:
+        executed_nodes.append("BranchBNode")
+        return self.Outputs(value=f"b:{self.topic}")
+
+
+class MergeNode(BaseNode):
+    a = BranchANode.Outputs.value
+    b = BranchBNode.Outputs.value
+
+    class Outputs(BaseNode.Outputs):
+        value: str
+
+    class Trigger(BaseNode.Trigger):
+        merge_behavior = MergeBehavior.AWAIT_ALL
+
+    def run(self) -> Outputs:
+        executed_nodes.append("MergeNode")
+        return self.Outputs(value=f"{self.a}+{self.b}")
+
+
+class CheckpointedWorkflow(BaseWorkflow[Inputs, State]):
+    graph = StartNode >> {BranchANode, BranchBNode} >> MergeNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        value = MergeNode.Outputs.value
+        started_with = State.started_with
+
+
+@pytest.fixture(autouse=True)
+def reset_workflow():
+    global worker_is_recycled
+    executed_nodes.clear()
+    branch_b_fulfilled.clear()
+    worker_is_recycled = True
+    yield
+
+
+def _run_until_worker_is_recycled(checkpointer: BaseCheckpointer) -> None:
+    # Lets the first branch wait on the second, so that its failure is the last thing to happen in the run
+    workflow = CheckpointedWorkflow()
+    events = workflow.stream(
+        inputs=Inputs(topic="rivers"),
+        checkpointer=checkpointer,
+        event_filter=all_workflow_event_filter,
+    )
+    for event in events:
+        if event.name == "node.execution.fulfilled" and event.node_definition == BranchBNode:
+            branch_b_fulfilled.set()
+
+    assert event.name == "workflow.execution.rejected"
+
+
+def test_resume_from_checkpoint__file(tmp_path):
+    global worker_is_recycled
+
+    # GIVEN a Workflow run that saves checkpoints to a file, and that fails before it can finish
+    checkpointer = FileCheckpointer(str(tmp_path / "checkpoint.json"))
+    _run_until_worker_is_recycled(checkpointer)
+    assert sorted(executed_nodes) == ["BranchANode", "BranchBNode", "StartNode"]
+    executed_nodes.clear()
+
+    # WHEN we resume it from its checkpoint with a new Workflow instance
+    worker_is_recycled = False
+    terminal_event = CheckpointedWorkflow().resume_from_checkpoint(FileCheckpointer(str(tmp_path / "checkpoint.json")))
+
+    # THEN only the Nodes that hadn't been fulfilled run
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert executed_nodes == ["BranchANode", "MergeNode"]
+
+    # AND the outputs of the Nodes fulfilled before the checkpoint are restored
+    assert terminal_event.outputs.value == "a:rivers+b:rivers"
+
+    # AND so are the state values written before the checkpoint
+    assert terminal_event.outputs.started_with == "rivers"
+
+    # AND the checkpoint is cleared once the Workflow is fulfilled
+    assert not os.path.exists(tmp_path / "checkpoint.json")
+
+
+def test_resume_from_checkpoint__sqlite(tmp_path):
+    global worker_is_recycled
+
+    # GIVEN a Workflow run that saves checkpoints to a SQLite database, and that fails before it can finish
+    database_path = str(tmp_path / "checkpoints.db")
+    _run_until_worker_is_recycled(SQLiteCheckpointer(database_path, key="run-1"))
+    executed_nodes.clear()
+
+    # WHEN we resume it from the checkpoint saved under the same key
+    worker_is_recycled = False
+    checkpointer = SQLiteCheckpointer(database_path, key="run-1")
+    terminal_event = CheckpointedWorkflow().resume_from_checkpoint(checkpointer)
+
+    # THEN it completes from where it left off
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    assert executed_nodes == ["BranchANode", "MergeNode"]
+    assert terminal_event.outputs.value == "a:rivers+b:rivers"
+
+    # AND the checkpoint is cleared
+    assert checkpointer.read() is None
+
+
+def test_resume_from_checkpoint__no_checkpoint(tmp_path):
+    # GIVEN a checkpointer that hasn't saved anything
+    checkpointer = FileCheckpointer(str(tmp_path / "checkpoint.json"))
+
+    # WHEN we try to resume from it
+    with pytest.raises(ValueError) as exc_info:
+        CheckpointedWorkflow().resume_from_checkpoint(checkpointer)
+
+    # THEN we get a helpful error
+    assert str(exc_info.value) == "No checkpoint was found to resume CheckpointedWorkflow from"
@@ -0,0 +1,165 @@
+import pytest
+from datetime import datetime
+import json
+from typing import ClassVar, List, Set
+
+from vellum import ChatMessage
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state import codec
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.codec import decode_state, encode_state, get_state_codec
+from vellum.workflows.workflows.base import BaseWorkflow, GraphAttribute
+
+
+class Inputs(BaseInputs):
+    started_at: datetime
+
+
+class State(BaseState):
+    messages: List[ChatMessage] = []
+    tags: Set[str] = set()
+
+
+class ChatNode(BaseNode[State]):
+    started_at = Inputs.started_at
+
+    class Outputs(BaseNode.Outputs):
+        message: ChatMessage
+        finished_at: datetime
+
+    def run(self) -> Outputs:
+        message = ChatMessage(role="ASSISTANT", text="Hello")
+        self.state.messages = [message]
+        self.state.tags = {"greeting"}
+        return self.Outputs(message=message, finished_at=self.started_at)
+
+
+class ChatWorkflow(BaseWorkflow[Inputs, State]):
+    graph = ChatNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        message = ChatNode.Outputs.message
+
+
+def _run_workflow() -> State:
+    workflow = ChatWorkflow()
+    terminal_event = workflow.run(inputs=Inputs(started_at=datetime(2025, 1, 1, 12)))
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+    return workflow.get_most_recent_state()
+
+
+def test_state_codec__json_round_trip():
+    # GIVEN the state of a Workflow run with typed state values, inputs and node outputs
+    state = _run_workflow()
+
+    # WHEN we encode it and decode it back
+    decoded_state = decode_state(ChatWorkflow, encode_state(ChatWorkflow, state))
+
+    # THEN the values are decoded into the types they're annotated with
+    assert isinstance(decoded_state, State)
+    assert decoded_state.messages == [ChatMessage(role="ASSISTANT", text="Hello")]
+    assert decoded_state.tags == {"greeting"}
+    decoded_inputs = decoded_state.meta.workflow_inputs
+    assert isinstance(decoded_inputs, Inputs)
+    assert decoded_inputs.started_at == datetime(2025, 1, 1, 12)
+    assert decoded_state.meta.node_outputs == {
+        ChatNode.Outputs.message: ChatMessage(role="ASSISTANT", text="Hello"),
+        ChatNode.Outputs.finished_at: datetime(2025, 1, 1, 12),
+    }
+
+    # AND the metadata of the run is preserved
+    assert decoded_state.meta.id == state.meta.id
+    assert decoded_state.meta.trace_id == state.meta.trace_id
+    assert decoded_state.meta.updated_ts == state.meta.updated_ts
+    assert decoded_state.meta.node_execution_cache.get_execution_count(ChatNode) == 1
+
+
+def test_state_codec__encodes_json():
+    # GIVEN the state of a Workflow run
+    state = _run_workflow()
+
+    # WHEN we encode it as JSON
+    encoded_state = json.loads(encode_state(ChatWorkflow, state))
+
+    # THEN the state values and node outputs are plain JSON
+    assert encoded_state["tags"] == ["greeting"]
+    assert encoded_state["meta"]["node_outputs"]["ChatNode.Outputs.finished_at"] == "2025-01-01T12:00:00"
+
+
+def test_state_codec__msgpack_round_trip():
+    pytest.importorskip("msgpack")
+
+    # GIVEN the state of a Workflow run
+    state = _run_workflow()
+
+    # WHEN we encode it as msgpack and decode it back
+    decoded_state = decode_state(ChatWorkflow, encode_state(ChatWorkflow, state, "msgpack"), "msgpack")
+
+    # THEN we get the same values back
+    assert decoded_state.messages == state.messages
+    assert decoded_state.meta.node_outputs == state.meta.node_outputs
+
+
+def test_state_codec__msgpack_not_installed(monkeypatch):
+    # GIVEN msgpack isn't installed
+    monkeypatch.setattr(codec, "msgpack", None)
+
+    # WHEN we try to encode a state as msgpack
+    with pytest.raises(ImportError) as exc_info:
+        encode_state(ChatWorkflow, _run_workflow(), "msgpack")
+
+    # THEN we get a helpful error
+    assert str(exc_info.value) == "The msgpack state format requires the `msgpack` package to be installed"
+
+
+def test_state_codec__unknown_node_output():
+    # GIVEN an encoded state with an output that isn't one of the Workflow's nodes
+    state_codec = get_state_codec(ChatWorkflow)
+    encoded_state = state_codec.to_dict(_run_workflow())
+    encoded_state["meta"]["node_outputs"]["OtherNode.Outputs.value"] = 1
+
+    # WHEN we decode it
+    with pytest.raises(ValueError) as exc_info:
+        state_codec.from_dict(encoded_state)
+
+    # THEN we get a helpful error
+    assert (
+        str(exc_info.value) == "State has a value for OtherNode.Outputs.value, which is not an output of ChatWorkflow"
+    )
+
+
+def test_get_state_codec__cached():
+    # WHEN we get the codec for the same Workflow twice
+    # THEN it's only created once
+    assert get_state_codec(ChatWorkflow) is get_state_codec(ChatWorkflow)
+
+
+def test_get_state_codec__recreated_when_graph_changes():
+    # GIVEN a Workflow whose graph is later extended with another Node
+    class ReplyNode(BaseNode[State]):
+        class Outputs(BaseNode.Outputs):
+            replied_at: datetime
+
+        def run(self) -> Outputs:
+            return self.Outputs(replied_at=datetime(2025, 1, 1, 13))
+
+    class ExtendedChatWorkflow(BaseWorkflow[Inputs, State]):
+        graph: ClassVar[GraphAttribute] = ChatNode
+
+    state_codec = get_state_codec(ExtendedChatWorkflow)
+
+    # WHEN its graph is reassigned
+    ExtendedChatWorkflow.graph = ChatNode >> ReplyNode
+
+    # THEN a new codec is created, which decodes the outputs of the new Node
+    extended_state_codec = get_state_codec(ExtendedChatWorkflow)
+    assert extended_state_codec is not state_codec
+    assert extended_state_codec is get_state_codec(ExtendedChatWorkflow)
+
+    workflow = ExtendedChatWorkflow()
+    workflow.run(inputs=Inputs(started_at=datetime(2025, 1, 1, 12)))
+    decoded_state = decode_state(
+        ExtendedChatWorkflow, encode_state(ExtendedChatWorkflow, workflow.get_most_recent_state())
+    )
+    assert decoded_state.meta.node_outputs[ReplyNode.Outputs.replied_at] == datetime(2025, 1, 1, 13)
@@ -0,0 +1,189 @@
+import pytest
+from dataclasses import dataclass
+from datetime import datetime
+import enum
+import gc
+import json
+from queue import Queue
+from uuid import UUID
+import weakref
+
+from pydantic import BaseModel
+
+from vellum.workflows.constants import undefined
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.encoder import DefaultStateEncoder, to_json_bytes, to_json_compatible
+
+
+class MockInputs(BaseInputs):
+    foo: str
+
+
+class MockState(BaseState):
+    bar: int = 1
+
+
+class MockNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        baz: str
+
+
+class MockEnum(enum.Enum):
+    FOO = "foo"
+
+
+class MockIntEnum(enum.IntEnum):
+    ONE = 1
+
+
+class MockModel(BaseModel):
+    name: str
+    created_at: datetime
+
+
+@dataclass
+class MockDataclass:
+    uuid: UUID
+    items: tuple
+
+
+def _build_queue() -> Queue:
+    queue: Queue = Queue()
+    queue.put("hello")
+    return queue
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "hello",
+        1.5,
+        {1: "int", 2.5: "float", False: "bool", None: "none"},
+        (1, [2, {3}]),
+        MockInputs(foo="bar"),
+        MockState(),
+        MockNode.Outputs(baz="qux"),
+        BaseOutput(name="baz", delta="q"),
+        UUID("d8a5b5e0-3d1a-4a2e-9b8e-7a0c6c5b0f7a"),
+        datetime(2024, 1, 1, 12, 30),
+        MockEnum.FOO,
+        MockIntEnum.ONE,
+        MockModel(name="model", created_at=datetime(2024, 1, 1)),
+        MockDataclass(uuid=UUID("d8a5b5e0-3d1a-4a2e-9b8e-7a0c6c5b0f7a"), items=(1, "a")),
+        _build_queue(),
+        MockNode,
+        undefined,
+        {"value": undefined},
+    ],
+)
+def test_to_json_compatible__matches_json_round_trip(value):
+    # WHEN we convert the value to JSON compatible python
+    json_compatible = to_json_compatible(value)
+
+    # THEN it matches what the default state encoder produces through a JSON round trip
+    assert json_compatible == json.loads(json.dumps(value, cls=DefaultStateEncoder))
+
+
+def test_to_json_compatible__uses_registered_encoders():
+    # GIVEN a type that is only serializable through a registered encoder
+    class Custom:
+        pass
+
+    DefaultStateEncoder.encoders[Custom] = lambda obj: {"custom": True}
+
+    try:
+        # WHEN we convert it
+        json_compatible = to_json_compatible([Custom()])
+    finally:
+        del DefaultStateEncoder.encoders[Custom]
+
+    # THEN the registered encoder is used
+    assert json_compatible == [{"custom": True}]
+
+
+def test_to_json_compatible__unserializable_value():
+    # GIVEN a value that can't be serialized
+    value = {"foo": object()}
+
+    # WHEN we convert it, THEN the same error as `json.dumps` is raised
+    with pytest.raises(TypeError, match="Object of type object is not JSON serializable"):
+        to_json_compatible(value)
+
+
+def test_to_json_bytes():
+    # WHEN we serialize a value to JSON bytes
+    json_bytes = to_json_bytes({"inputs": MockInputs(foo="bär"), "ids": {1}})
+
+    # THEN the result is compact UTF-8 encoded JSON
+    assert json.loads(json_bytes) == {"inputs": {"foo": "bär"}, "ids": [1]}
+    assert b" " not in json_bytes
+
+
+def test_to_json_compatible__completed_stream_queue():
+    # GIVEN a queue of streamed outputs that has been marked as complete
+    queue: Queue = Queue()
+    queue.put("hello")
+    queue.put("world")
+    queue.put(undefined)
+
+    # WHEN we convert it
+    json_compatible = to_json_compatible({"stream": queue})
+
+    # THEN the completion marker is encoded the same as with the json encoder
+    assert json_compatible == {"stream": ["hello", "world", "undefined"]}
+    assert json.loads(json.dumps({"stream": queue}, cls=DefaultStateEncoder)) == json_compatible
+
+
+def test_default_state_encoder__undefined():
+    # WHEN we serialize an undefined value with the default state encoder
+    serialized = json.dumps({"value": undefined}, cls=DefaultStateEncoder)
+
+    # THEN it falls back to its string representation
+    assert serialized == '{"value": "undefined"}'
+
+
+def _build_circular_list() -> list:
+    value: list = []
+    value.append(value)
+    return value
+
+
+def _build_circular_dict() -> dict:
+    value: dict = {}
+    value["items"] = [value]
+    return value
+
+
+@pytest.mark.parametrize("build_value", [_build_circular_list, _build_circular_dict], ids=["list", "dict"])
+def test_to_json_compatible__circular_reference(build_value):
+    # GIVEN a value that references itself
+    value = build_value()
+
+    # WHEN we convert it, THEN the same error as `json.dumps` is raised
+    with pytest.raises(ValueError, match="Circular reference detected"):
+        json.dumps(value, cls=DefaultStateEncoder)
+    with pytest.raises(ValueError, match="Circular reference detected"):
+        to_json_compatible(value)
+
+
+def test_to_json_compatible__does_not_retain_types():
+    # GIVEN a model class that is created dynamically
+    class DynamicModel(BaseModel):
+        name: str
+
+    model_type = weakref.ref(DynamicModel)
+
+    # AND it has been converted once, so its conversion is cached
+    assert to_json_compatible(DynamicModel(name="foo")) == {"name": "foo"}
+    assert json.dumps(DynamicModel(name="foo"), cls=DefaultStateEncoder) == '{"name": "foo"}'
+
+    # WHEN the class is no longer referenced
+    del DynamicModel
+    gc.collect()
+
+    # THEN the encoder caches haven't kept it alive
+    assert model_type() is None
@@ -5,9 +5,10 @@ import json
 from queue import Queue
 from typing import Dict
 
+from vellum.workflows.constants import undefined
 from vellum.workflows.nodes.bases import BaseNode
 from vellum.workflows.outputs.base import BaseOutputs
-from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.base import BaseState, StateMeta
 from vellum.workflows.state.encoder import DefaultStateEncoder
 
 snapshot_count: Dict[int, int] = defaultdict(int)
@@ -170,3 +171,55 @@ def test_state_json_serialization__with_queue():
 
     # THEN the state is serialized correctly with the queue turned into a list
     assert json_state["meta"]["node_outputs"] == {"MockNode.Outputs.baz": ["test1", "test2"]}
+
+
+def test_output_reference__resolve__from_ancestor():
+    # GIVEN a chain of nested states, where only the root holds a node output
+    root_state = MockState(foo="bar")
+    root_state.meta.node_outputs[MockNode.Outputs.baz] = "hello"
+    middle_state = MockState(foo="bar", meta=StateMeta(parent=root_state))
+    leaf_state = MockState(foo="bar", meta=StateMeta(parent=middle_state))
+
+    # WHEN we resolve the node output from the leaf state
+    resolved_value = MockNode.Outputs.baz.resolve(leaf_state)
+
+    # THEN the root's node output is returned
+    assert resolved_value == "hello"
+
+    # AND subsequent lookups see updates made to the ancestor
+    root_state.meta.node_outputs[MockNode.Outputs.baz] = "world"
+    assert MockNode.Outputs.baz.resolve(leaf_state) == "world"
+
+
+def test_output_reference__resolve__nearer_ancestor_takes_precedence():
+    # GIVEN a chain of nested states, where only the root holds a node output
+    root_state = MockState(foo="bar")
+    root_state.meta.node_outputs[MockNode.Outputs.baz] = "root"
+    middle_state = MockState(foo="bar", meta=StateMeta(parent=root_state))
+    leaf_state = MockState(foo="bar", meta=StateMeta(parent=middle_state))
+    assert MockNode.Outputs.baz.resolve(leaf_state) == "root"
+
+    # WHEN a nearer ancestor later receives the same node output
+    middle_state.meta.node_outputs[MockNode.Outputs.baz] = "middle"
+
+    # THEN the nearer ancestor's value is returned
+    assert MockNode.Outputs.baz.resolve(leaf_state) == "middle"
+
+
+def test_output_reference__resolve__local_output_takes_precedence():
+    # GIVEN a parent state and a nested state that both hold the same node output
+    parent_state = MockState(foo="bar")
+    parent_state.meta.node_outputs[MockNode.Outputs.baz] = "parent"
+    nested_state = MockState(foo="bar", meta=StateMeta(parent=parent_state))
+    assert MockNode.Outputs.baz.resolve(nested_state) == "parent"
+
+    # WHEN the nested state sets its own value
+    nested_state.meta.node_outputs[MockNode.Outputs.baz] = "nested"
+
+    # THEN the nested state's value is returned
+    assert MockNode.Outputs.baz.resolve(nested_state) == "nested"
+
+    # AND removing the ancestor's value no longer resolves through the parent chain
+    del nested_state.meta.node_outputs[MockNode.Outputs.baz]
+    del parent_state.meta.node_outputs[MockNode.Outputs.baz]
+    assert MockNode.Outputs.baz.resolve(nested_state) is undefined
@@ -0,0 +1,31 @@
+import pytest
+
+from vellum.client.environment import VellumEnvironment
+from vellum.utils.rate_limiter import RateLimit, RateLimiter
+from vellum.workflows.vellum_client import create_vellum_client, create_vellum_environment
+
+
+def test_create_vellum_client__rate_limiter(monkeypatch):
+    # GIVEN a rate limiter created for the configured environment
+    monkeypatch.setenv("VELLUM_API_URL", "https://vellum.example.com")
+    rate_limiter = RateLimiter(create_vellum_environment(), default=RateLimit(requests_per_second=10))
+
+    # WHEN we create a client with it
+    client = create_vellum_client(api_key="test-api-key", rate_limiter=rate_limiter)
+
+    # THEN its requests still follow redirects, like those of the default client
+    httpx_client = client._client_wrapper.httpx_client.httpx_client
+    assert httpx_client.follow_redirects is True
+
+
+def test_create_vellum_client__rate_limiter_for_another_environment(monkeypatch):
+    # GIVEN a rate limiter created for a different environment than the configured one
+    monkeypatch.setenv("VELLUM_API_URL", "https://vellum.example.com")
+    rate_limiter = RateLimiter(VellumEnvironment.PRODUCTION, default=RateLimit(requests_per_second=10))
+
+    # WHEN we create a client with it
+    with pytest.raises(ValueError) as exc_info:
+        create_vellum_client(api_key="test-api-key", rate_limiter=rate_limiter)
+
+    # THEN we're told that it wouldn't limit the client's requests
+    assert "created for a different Vellum environment" in str(exc_info.value)
@@ -1,17 +1,29 @@
 import os
 from typing import Optional
 
+import httpx
+
 from vellum import Vellum, VellumEnvironment
+from vellum.utils.rate_limiter import RateLimitedTransport, RateLimiter
 
 
-def create_vellum_client(api_key: Optional[str] = None) -> Vellum:
+def create_vellum_client(api_key: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None) -> Vellum:
     if api_key is None:
         api_key = os.getenv("VELLUM_API_KEY", default="")
 
-    return Vellum(
-        api_key=api_key,
-        environment=create_vellum_environment(),
-    )
+    environment = create_vellum_environment()
+    httpx_client = None
+    if rate_limiter:
+        if not rate_limiter.is_for_environment(environment):
+            raise ValueError(
+                "The rate limiter was created for a different Vellum environment than the one configured for the "
+                "client, so it wouldn't limit any of its requests. Create it with `create_vellum_environment()`."
+            )
+
+        # Mirrors the httpx client that Vellum creates by default
+        httpx_client = httpx.Client(timeout=None, follow_redirects=True, transport=RateLimitedTransport(rate_limiter))
+
+    return Vellum(api_key=api_key, environment=environment, httpx_client=httpx_client)
 
 
 def create_vellum_environment() -> VellumEnvironment:
@@ -24,6 +24,7 @@ from typing import (
     get_args,
 )
 
+from vellum.workflows.constants import undefined
 from vellum.workflows.edges import Edge
 from vellum.workflows.emitters.base import BaseWorkflowEmitter
 from vellum.workflows.errors import WorkflowError, WorkflowErrorCode
@@ -65,11 +66,13 @@ from vellum.workflows.nodes.mocks import MockNodeExecutionArg
 from vellum.workflows.outputs import BaseOutputs
 from vellum.workflows.resolvers.base import BaseWorkflowResolver
 from vellum.workflows.runner import WorkflowRunner
-from vellum.workflows.runner.runner import ExternalInputsArg, RunFromNodeArg
+from vellum.workflows.runner.metrics import BaseRunnerMetrics
+from vellum.workflows.runner.runner import DeltaCoalescingWindow, ExternalInputsArg, RunFromNodeArg
 from vellum.workflows.state.base import BaseState, StateMeta
+from vellum.workflows.state.checkpoint import BaseCheckpointer
 from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.state.store import Store
-from vellum.workflows.types.generics import InputsType, StateType
+from vellum.workflows.types.generics import InputsType, StateType, WorkflowType
 from vellum.workflows.types.utils import get_original_base
 from vellum.workflows.utils.uuids import uuid4_from_hash
 from vellum.workflows.workflows.event_filters import workflow_event_filter
@@ -130,7 +133,41 @@ class _BaseWorkflowMeta(type):
         return workflow_class
 
 
-GraphAttribute = Union[Type[BaseNode], Graph, Set[Type[BaseNode]], Set[Graph]]
+GraphAttribute = Union[Type[BaseNode], Graph, Set[Type[BaseNode]], Set[Graph], Set[Union[Type[BaseNode], Graph]]]
+
+
+def _get_graph_version(source: Any) -> Any:
+    """
+    Returns a value that changes whenever a `graph` or `unused_graphs` attribute does. Graphs are extended in place
+    by `>>` and only ever gain edges, so their number of edges tracks their changes. The same goes for the Ports of a
+    Node, which gain edges whenever they're connected, e.g. by `Node.Ports.default >> OtherNode`.
+    """
+
+    if isinstance(source, Graph):
+        return len(source._edges)
+
+    if isinstance(source, set):
+        return tuple((id(item), _get_graph_version(item)) for item in source)
+
+    if isinstance(source, type) and issubclass(source, BaseNode):
+        return tuple(len(port._edges) for port in source.Ports)
+
+    return None
+
+
+class _ResolvedGraph:
+    """
+    The subgraphs, edges, nodes and entrypoints resolved from a Workflow's `graph` or `unused_graphs` attribute,
+    cached on the Workflow class so that they're only computed once however often they're read.
+    """
+
+    def __init__(self, source: Any, subgraphs: List[Graph]):
+        self.source = source
+        self.version = _get_graph_version(source)
+        self.subgraphs = subgraphs
+        self.edges = list(BaseWorkflow._get_edges_from_subgraphs(subgraphs))
+        self.nodes = list(BaseWorkflow._get_nodes_from_subgraphs(subgraphs))
+        self.entrypoints = list(dict.fromkeys(e for g in subgraphs for e in g.entrypoints))
 
 
 class BaseWorkflow(Generic[InputsType, StateType], metaclass=_BaseWorkflowMeta):
@@ -218,55 +255,84 @@ class BaseWorkflow(Generic[InputsType, StateType], metaclass=_BaseWorkflowMeta):
                     nodes.add(node)
                     yield node
 
+    @classmethod
+    def _get_resolved_graph(cls) -> _ResolvedGraph:
+        """
+        Resolves the Workflow's graph once per class. The cache is keyed on the `graph` attribute itself and on its
+        version, so that it's recomputed if the attribute is reassigned or extended in place, and lives in the
+        class's own `__dict__`, so that subclasses don't share their parent's.
+        """
+        graph = cls.graph
+        resolved_graph = cls.__dict__.get("__resolved_graph__")
+        if (
+            not isinstance(resolved_graph, _ResolvedGraph)
+            or resolved_graph.source is not graph
+            or resolved_graph.version != _get_graph_version(graph)
+        ):
+            resolved_graph = _ResolvedGraph(graph, cls._resolve_graph(graph))
+            setattr(cls, "__resolved_graph__", resolved_graph)
+
+        return resolved_graph
+
+    @classmethod
+    def _get_resolved_unused_graph(cls) -> _ResolvedGraph:
+        unused_graphs = getattr(cls, "unused_graphs", None)
+        resolved_graph = cls.__dict__.get("__resolved_unused_graph__")
+        if (
+            not isinstance(resolved_graph, _ResolvedGraph)
+            or resolved_graph.source is not unused_graphs
+            or resolved_graph.version != _get_graph_version(unused_graphs)
+        ):
+            graphs = []
+            for item in unused_graphs or []:
+                graphs.extend(cls._resolve_graph(item))
+            resolved_graph = _ResolvedGraph(unused_graphs, graphs)
+            setattr(cls, "__resolved_unused_graph__", resolved_graph)
+
+        return resolved_graph
+
     @classmethod
     def get_subgraphs(cls) -> List[Graph]:
-        return cls._resolve_graph(cls.graph)
+        return list(cls._get_resolved_graph().subgraphs)
 
     @classmethod
     def get_edges(cls) -> Iterator[Edge]:
         """
-        Returns an iterator over the edges in the workflow. We use a set to
-        ensure uniqueness, and the iterator to preserve order.
+        Returns an iterator over the edges in the workflow, deduplicated and in the order they were defined.
         """
-        return cls._get_edges_from_subgraphs(cls.get_subgraphs())
+        return iter(cls._get_resolved_graph().edges)
 
     @classmethod
     def get_nodes(cls) -> Iterator[Type[BaseNode]]:
         """
-        Returns an iterator over the nodes in the workflow. We use a set to
-        ensure uniqueness, and the iterator to preserve order.
+        Returns an iterator over the nodes in the workflow, deduplicated and in the order they were defined.
         """
-        return cls._get_nodes_from_subgraphs(cls.get_subgraphs())
+        return iter(cls._get_resolved_graph().nodes)
 
     @classmethod
     def get_unused_subgraphs(cls) -> List[Graph]:
         """
         Returns a list of subgraphs that are defined but not used in the graph
         """
-        if not hasattr(cls, "unused_graphs"):
-            return []
-        graphs = []
-        for item in cls.unused_graphs:
-            graphs.extend(cls._resolve_graph(item))
-        return graphs
+        return list(cls._get_resolved_unused_graph().subgraphs)
 
     @classmethod
     def get_unused_nodes(cls) -> Iterator[Type[BaseNode]]:
         """
         Returns an iterator over the nodes that are defined but not used in the graph.
         """
-        return cls._get_nodes_from_subgraphs(cls.get_unused_subgraphs())
+        return iter(cls._get_resolved_unused_graph().nodes)
 
     @classmethod
     def get_unused_edges(cls) -> Iterator[Edge]:
         """
         Returns an iterator over edges that are defined but not used in the graph.
         """
-        return cls._get_edges_from_subgraphs(cls.get_unused_subgraphs())
+        return iter(cls._get_resolved_unused_graph().edges)
 
     @classmethod
     def get_entrypoints(cls) -> Iterable[Type[BaseNode]]:
-        return iter({e for g in cls.get_subgraphs() for e in g.entrypoints})
+        return iter(cls._get_resolved_graph().entrypoints)
 
     def run(
         self,
@@ -278,6 +344,12 @@ class BaseWorkflow(Generic[InputsType, StateType], metaclass=_BaseWorkflowMeta):
         cancel_signal: Optional[ThreadingEvent] = None,
         node_output_mocks: Optional[MockNodeExecutionArg] = None,
         max_concurrency: Optional[int] = None,
+        delta_coalescing: Optional[DeltaCoalescingWindow] = None,
+        metrics: Optional[BaseRunnerMetrics] = None,
+        memory_profiling: bool = False,
+        timeout: Optional[float] = None,
+        previous_run: Optional[Union[StateType, Store]] = None,
+        checkpointer: Optional[BaseCheckpointer] = None,
     ) -> TerminalWorkflowEvent:
         """
         Invoke a Workflow, returning the last event emitted, which should be one of:
@@ -309,8 +381,39 @@ class BaseWorkflow(Generic[InputsType, StateType], metaclass=_BaseWorkflowMeta):
 
         max_concurrency: Optional[int] = None
             The max number of concurrent threads to run the Workflow with. If not provided, the Workflow will run
-            without limiting concurrency. This configuration only applies to the current Workflow and not to any
-            subworkflows or nodes that utilizes threads.
+            without limiting concurrency. Ready Nodes beyond the limit run in order of their `Execution.priority`, and
+            then of the longest path of Nodes left to run after them. This configuration only applies to the current
+            Workflow and not to any subworkflows or nodes that utilizes threads. To cap how many Nodes use a resource
+            at once across every Workflow in the process, subworkflows included, see `configure_resource_pools`.
+
+        delta_coalescing: Optional[DeltaCoalescingWindow] = None
+            If provided, consecutive string deltas streamed by a Node for the same output are buffered and emitted
+            as a single streaming event once the window's time or size limit is reached.
+
+        metrics: Optional[BaseRunnerMetrics] = None
+            If provided, receives counters and timing histograms for each Node execution, along with the time spent
+            waiting on the concurrency queue, snapshotting state, and delivering to Emitters.
+
+        memory_profiling: bool = False
+            If enabled, traces allocations with `tracemalloc` and reports the peak and retained bytes of each Node
+            execution and state snapshot to `metrics`. Tracing slows execution down significantly, so this is
+            intended for profiling runs only.
+
+        timeout: Optional[float] = None
+            The max number of seconds the Workflow may run for. Once exceeded, its running Nodes are cancelled and the
+            Workflow is rejected with `WORKFLOW_TIMEOUT`. Nodes may also declare a timeout of their own on their
+            `Execution` class, which rejects them with `NODE_TIMEOUT`.
+
+        previous_run: Optional[Union[StateType, Store]] = None
+            The final state, or the Store, of a previous run of this Workflow to run incrementally from. Only the Nodes
+            that reference an input or state value that differs from that run, along with the Nodes that depend on
+            their outputs, are run again. The rest replay their outputs from the previous run and are reported as
+            mocked. The run starts from `state` if provided, or from the default state, like any other run.
+
+        checkpointer: Optional[BaseCheckpointer] = None
+            If provided, durably saves a checkpoint each time a Node is fulfilled while others are left to run, which
+            can be resumed in another process with `resume_from_checkpoint`. The checkpoint is cleared once the
+            Workflow is fulfilled.
         """
 
         events = WorkflowRunner(
@@ -322,7 +425,14 @@ class BaseWorkflow(Generic[InputsType, StateType], metaclass=_BaseWorkflowMeta):
             cancel_signal=cancel_signal,
             node_output_mocks=node_output_mocks,
             max_concurrency=max_concurrency,
+            delta_coalescing=delta_coalescing,
+            metrics=metrics,
+            memory_profiling=memory_profiling,
+            timeout=timeout,
+            previous_run=previous_run,
+            checkpointer=checkpointer,
             init_execution_context=self._execution_context,
+            event_filter=workflow_event_filter,
         ).stream()
         first_event: Optional[Union[WorkflowExecutionInitiatedEvent, WorkflowExecutionResumedEvent]] = None
         last_event = None
@@ -376,6 +486,87 @@ class BaseWorkflow(Generic[InputsType, StateType], metaclass=_BaseWorkflowMeta):
             ),
         )
 
+    def resume_from_checkpoint(
+        self,
+        checkpointer: BaseCheckpointer,
+        *,
+        cancel_signal: Optional[ThreadingEvent] = None,
+        max_concurrency: Optional[int] = None,
+        metrics: Optional[BaseRunnerMetrics] = None,
+        timeout: Optional[float] = None,
+    ) -> TerminalWorkflowEvent:
+        """
+        Resumes a run of this Workflow from the latest checkpoint saved by `checkpointer`, e.g. in a new process after
+        the one that started the run was stopped. Every Node that was running, queued or awaiting external inputs at
+        the time is run again with the checkpointed state, and the run keeps saving checkpoints as it goes.
+
+        To stream the resumed run instead, load the checkpoint and pass it to `stream`:
+
+            checkpoint = checkpointer.load(MyWorkflow)
+            MyWorkflow().stream(state=checkpoint.state, entrypoint_nodes=checkpoint.frontier, checkpointer=checkpointer)
+        """
+
+        checkpoint = checkpointer.load(self.__class__)
+        if checkpoint is None:
+            raise ValueError(f"No checkpoint was found to resume {self.__class__.__name__} from")
+
+        return self.run(
+            state=checkpoint.state,
+            entrypoint_nodes=checkpoint.frontier,
+            cancel_signal=cancel_signal,
+            max_concurrency=max_concurrency,
+            metrics=metrics,
+            timeout=timeout,
+            checkpointer=checkpointer,
+        )
+
+    def hibernate(self, checkpointer: BaseCheckpointer) -> None:
+        """
+        Saves a run of this Workflow that is paused on external inputs with `checkpointer`, then releases the events
+        and state snapshots that this instance holds in memory. The run is picked back up with `rehydrate`, e.g. in
+        another process, once the external inputs are available:
+
+            workflow = MyWorkflow.rehydrate(FileCheckpointer(path))
+            workflow.run(external_inputs={MyNode.ExternalInputs.message: "Hello"})
+
+        Only the most recent state is saved, so the rehydrated Workflow can't be resumed from Nodes that ran before
+        the pause. The hibernated run stays with `checkpointer` until it's cleared.
+        """
+
+        state = self.get_most_recent_state()
+        awaiting_nodes = [
+            external_input.inputs_class.__parent_class__
+            for external_input, value in state.meta.external_inputs.items()
+            if value is undefined and issubclass(external_input.inputs_class.__parent_class__, BaseNode)
+        ]
+        if not awaiting_nodes:
+            raise ValueError(f"Cannot hibernate {self.__class__.__name__}, which isn't paused on external inputs")
+
+        checkpointer.save(self.__class__, state, list(dict.fromkeys(awaiting_nodes)))
+        self._store.clear()
+
+    @classmethod
+    def rehydrate(
+        cls: Type[WorkflowType],
+        checkpointer: BaseCheckpointer,
+        *,
+        context: Optional[WorkflowContext] = None,
+        emitters: Optional[List[BaseWorkflowEmitter]] = None,
+        resolvers: Optional[List[BaseWorkflowResolver]] = None,
+    ) -> WorkflowType:
+        """
+        Creates an instance of this Workflow from a run saved with `hibernate`, which resumes the run from the state it
+        was paused in when given the external inputs it awaits.
+        """
+
+        checkpoint = checkpointer.load(cls)
+        if checkpoint is None:
+            raise ValueError(f"No hibernated run was found to rehydrate {cls.__name__} from")
+
+        workflow = cls(context=context, emitters=emitters, resolvers=resolvers)
+        workflow._store.append_state_snapshot(checkpoint.state)
+        return workflow
+
     def stream(
         self,
         inputs: Optional[InputsType] = None,
@@ -387,6 +578,12 @@ class BaseWorkflow(Generic[InputsType, StateType], metaclass=_BaseWorkflowMeta):
         cancel_signal: Optional[ThreadingEvent] = None,
         node_output_mocks: Optional[MockNodeExecutionArg] = None,
         max_concurrency: Optional[int] = None,
+        delta_coalescing: Optional[DeltaCoalescingWindow] = None,
+        metrics: Optional[BaseRunnerMetrics] = None,
+        memory_profiling: bool = False,
+        timeout: Optional[float] = None,
+        previous_run: Optional[Union[StateType, Store]] = None,
+        checkpointer: Optional[BaseCheckpointer] = None,
     ) -> WorkflowEventStream:
         """
         Invoke a Workflow, yielding events as they are emitted.
@@ -419,12 +616,42 @@ class BaseWorkflow(Generic[InputsType, StateType], metaclass=_BaseWorkflowMeta):
 
         max_concurrency: Optional[int] = None
             The max number of concurrent threads to run the Workflow with. If not provided, the Workflow will run
-            without limiting concurrency. This configuration only applies to the current Workflow and not to any
-            subworkflows or nodes that utilizes threads.
+            without limiting concurrency. Ready Nodes beyond the limit run in order of their `Execution.priority`, and
+            then of the longest path of Nodes left to run after them. This configuration only applies to the current
+            Workflow and not to any subworkflows or nodes that utilizes threads. To cap how many Nodes use a resource
+            at once across every Workflow in the process, subworkflows included, see `configure_resource_pools`.
+
+        delta_coalescing: Optional[DeltaCoalescingWindow] = None
+            If provided, consecutive string deltas streamed by a Node for the same output are buffered and emitted
+            as a single streaming event once the window's time or size limit is reached.
+
+        metrics: Optional[BaseRunnerMetrics] = None
+            If provided, receives counters and timing histograms for each Node execution, along with the time spent
+            waiting on the concurrency queue, snapshotting state, and delivering to Emitters.
+
+        memory_profiling: bool = False
+            If enabled, traces allocations with `tracemalloc` and reports the peak and retained bytes of each Node
+            execution and state snapshot to `metrics`. Tracing slows execution down significantly, so this is
+            intended for profiling runs only.
+
+        timeout: Optional[float] = None
+            The max number of seconds the Workflow may run for. Once exceeded, its running Nodes are cancelled and the
+            Workflow is rejected with `WORKFLOW_TIMEOUT`. Nodes may also declare a timeout of their own on their
+            `Execution` class, which rejects them with `NODE_TIMEOUT`.
+
+        previous_run: Optional[Union[StateType, Store]] = None
+            The final state, or the Store, of a previous run of this Workflow to run incrementally from. Only the Nodes
+            that reference an input or state value that differs from that run, along with the Nodes that depend on
+            their outputs, are run again. The rest replay their outputs from the previous run and are reported as
+            mocked. The run starts from `state` if provided, or from the default state, like any other run.
+
+        checkpointer: Optional[BaseCheckpointer] = None
+            If provided, durably saves a checkpoint each time a Node is fulfilled while others are left to run, which
+            can be resumed in another process with `resume_from_checkpoint`. The checkpoint is cleared once the
+            Workflow is fulfilled.
         """
 
-        should_yield = event_filter or workflow_event_filter
-        for event in WorkflowRunner(
+        yield from WorkflowRunner(
             self,
             inputs=inputs,
             state=state,
@@ -433,10 +660,15 @@ class BaseWorkflow(Generic[InputsType, StateType], metaclass=_BaseWorkflowMeta):
             cancel_signal=cancel_signal,
             node_output_mocks=node_output_mocks,
             max_concurrency=max_concurrency,
+            delta_coalescing=delta_coalescing,
+            metrics=metrics,
+            memory_profiling=memory_profiling,
+            timeout=timeout,
+            previous_run=previous_run,
+            checkpointer=checkpointer,
             init_execution_context=self._execution_context,
-        ).stream():
-            if should_yield(self.__class__, event):
-                yield event
+            event_filter=event_filter or workflow_event_filter,
+        ).stream()
 
     def validate(self) -> None:
         """
@@ -1,25 +1,55 @@
-from typing import TYPE_CHECKING, Type
+from uuid import UUID
+from typing import TYPE_CHECKING, FrozenSet, List, Optional, Tuple, Type
+from typing_extensions import TypeGuard
 
-from vellum.workflows.events.types import VellumCodeResourceDefinition
+from vellum.workflows.events.types import CodeResourceDefinition, VellumCodeResourceDefinition
 
 if TYPE_CHECKING:
-    from vellum.workflows.events.workflow import WorkflowEvent
+    from vellum.workflows.events.workflow import WorkflowEvent, WorkflowExecutionEvent
     from vellum.workflows.workflows.base import BaseWorkflow
 
+WORKFLOW_EVENT_NAMES: FrozenSet[str] = frozenset(
+    {
+        "workflow.execution.initiated",
+        "workflow.execution.resumed",
+        "workflow.execution.fulfilled",
+        "workflow.execution.rejected",
+        "workflow.execution.paused",
+        "workflow.execution.streaming",
+    }
+)
+
+CodeResourceDefinitionKey = Tuple[UUID, str, List[str]]
+
+
+def _get_code_resource_definition_key(definition: CodeResourceDefinition) -> CodeResourceDefinitionKey:
+    return (definition.id, definition.name, definition.module)
+
+
+def _get_workflow_definition_key(workflow_definition: Type["BaseWorkflow"]) -> CodeResourceDefinitionKey:
+    """
+    Encodes a Workflow's definition once, rather than once per filtered event.
+    """
+
+    # The key lives on the Workflow class itself, so it's released along with the Workflow
+    definition_key: Optional[CodeResourceDefinitionKey] = workflow_definition.__dict__.get("__definition_key__")
+    if definition_key is None:
+        definition_key = _get_code_resource_definition_key(VellumCodeResourceDefinition.encode(workflow_definition))
+        setattr(workflow_definition, "__definition_key__", definition_key)
+
+    return definition_key
+
+
+def _is_workflow_execution_event(event: "WorkflowEvent") -> TypeGuard["WorkflowExecutionEvent"]:
+    return event.name in WORKFLOW_EVENT_NAMES
+
 
 def workflow_event_filter(workflow_definition: Type["BaseWorkflow"], event: "WorkflowEvent") -> bool:
     """
     Filters for only Workflow events that were emitted by the `workflow_definition` parameter.
     """
 
-    if (
-        event.name == "workflow.execution.initiated"
-        or event.name == "workflow.execution.resumed"
-        or event.name == "workflow.execution.fulfilled"
-        or event.name == "workflow.execution.rejected"
-        or event.name == "workflow.execution.paused"
-        or event.name == "workflow.execution.streaming"
-    ):
+    if _is_workflow_execution_event(event):
         return event.workflow_definition == workflow_definition
 
     return False
@@ -30,14 +60,7 @@ def root_workflow_event_filter(workflow_definition: Type["BaseWorkflow"], event:
     Filters for Workflow and Node events that were emitted by the `workflow_definition` parameter.
     """
 
-    if (
-        event.name == "workflow.execution.initiated"
-        or event.name == "workflow.execution.resumed"
-        or event.name == "workflow.execution.fulfilled"
-        or event.name == "workflow.execution.rejected"
-        or event.name == "workflow.execution.paused"
-        or event.name == "workflow.execution.streaming"
-    ):
+    if _is_workflow_execution_event(event):
         return event.workflow_definition == workflow_definition
 
     if not event.parent:
@@ -47,9 +70,9 @@ def root_workflow_event_filter(workflow_definition: Type["BaseWorkflow"], event:
         return False
 
     event_parent_definition = event.parent.workflow_definition
-    current_workflow_definition = VellumCodeResourceDefinition.encode(workflow_definition)
-
-    return event_parent_definition.model_dump() == current_workflow_definition.model_dump()
+    return _get_code_resource_definition_key(event_parent_definition) == _get_workflow_definition_key(
+        workflow_definition
+    )
 
 
 def all_workflow_event_filter(workflow_definition: Type["BaseWorkflow"], event: "WorkflowEvent") -> bool:
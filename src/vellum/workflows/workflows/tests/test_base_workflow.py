@@ -1,12 +1,19 @@
 import pytest
+import time
+from typing import ClassVar, Iterator
 
 from vellum.workflows.edges.edge import Edge
+from vellum.workflows.emitters.base import BaseWorkflowEmitter
+from vellum.workflows.emitters.dispatcher import get_default_emitter_dispatcher
+from vellum.workflows.exceptions import NodeException
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases.base import BaseNode
 from vellum.workflows.nodes.core.inline_subworkflow_node.node import InlineSubworkflowNode
-from vellum.workflows.outputs.base import BaseOutputs
+from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
+from vellum.workflows.runner import DeltaCoalescingWindow, InMemoryRunnerMetrics
 from vellum.workflows.state.base import BaseState
-from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.base import BaseWorkflow, GraphAttribute
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
 
 
 def test_base_workflow__inherit_base_outputs():
@@ -174,6 +181,92 @@ def test_workflow__get_edges():
     }
 
 
+def test_workflow__get_nodes__cached_until_graph_reassigned():
+    # GIVEN a workflow with a single node
+    class NodeA(BaseNode):
+        pass
+
+    class NodeB(BaseNode):
+        pass
+
+    class TestWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph: ClassVar[GraphAttribute] = NodeA
+
+    # AND a subclass with a graph of its own
+    class ChildWorkflow(TestWorkflow):
+        graph = NodeA >> NodeB
+
+    # WHEN we read the nodes of each workflow more than once
+    # THEN each workflow gets its own nodes every time
+    assert list(TestWorkflow.get_nodes()) == [NodeA]
+    assert list(ChildWorkflow.get_nodes()) == [NodeA, NodeB]
+    assert list(TestWorkflow.get_nodes()) == [NodeA]
+    assert list(ChildWorkflow.get_entrypoints()) == [NodeA]
+
+    # WHEN we reassign the parent's graph
+    TestWorkflow.graph = NodeB
+
+    # THEN its nodes reflect the new graph
+    assert list(TestWorkflow.get_nodes()) == [NodeB]
+    assert list(TestWorkflow.get_edges()) == []
+
+    # AND the subclass's are unaffected
+    assert list(ChildWorkflow.get_edges()) == [Edge(from_port=NodeA.Ports.default, to_node=NodeB)]
+
+
+def test_workflow__get_nodes__cached_until_graph_extended():
+    # GIVEN a workflow with a graph of two nodes
+    class NodeA(BaseNode):
+        pass
+
+    class NodeB(BaseNode):
+        pass
+
+    class NodeC(BaseNode):
+        pass
+
+    class TestWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = NodeA >> NodeB
+
+    assert list(TestWorkflow.get_nodes()) == [NodeA, NodeB]
+
+    # WHEN we extend its graph in place
+    TestWorkflow.graph = TestWorkflow.graph >> NodeC
+
+    # THEN its nodes and edges reflect the extended graph
+    assert list(TestWorkflow.get_nodes()) == [NodeA, NodeB, NodeC]
+    assert list(TestWorkflow.get_edges()) == [
+        Edge(from_port=NodeA.Ports.default, to_node=NodeB),
+        Edge(from_port=NodeB.Ports.default, to_node=NodeC),
+    ]
+
+
+def test_workflow__get_subgraphs__cached_until_node_ports_connected():
+    # GIVEN a workflow whose graph is a set of nodes
+    class NodeA(BaseNode):
+        pass
+
+    class NodeB(BaseNode):
+        pass
+
+    class NodeC(BaseNode):
+        pass
+
+    class TestWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = {NodeA, NodeB}
+
+    # AND its graph has been resolved
+    subgraphs = TestWorkflow.get_subgraphs()
+    assert TestWorkflow.get_subgraphs() == subgraphs
+
+    # WHEN one of its nodes' ports gains an edge
+    NodeA.Ports.default >> NodeC
+
+    # THEN the graph is resolved again, rather than served from the cache
+    assert all(resolved is not cached for resolved, cached in zip(TestWorkflow.get_subgraphs(), subgraphs))
+    assert set(TestWorkflow.get_nodes()) == {NodeA, NodeB}
+
+
 def test_workflow__get_unused_nodes():
     class NodeA(BaseNode):
         pass
@@ -304,3 +397,166 @@ def test_workflow__node_in_both_graph_and_unused():
 
     # THEN it should raise an error
     assert "Node(s) NodeA cannot appear in both graph and unused_graphs" in str(exc_info.value)
+
+
+def test_workflow__stream_with_delta_coalescing():
+    # GIVEN a node that streams its output as many small string deltas
+    class StreamingNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            text: str
+
+        def run(self) -> Iterator[BaseOutput]:
+            parts = []
+            for part in ["he", "ll", "o ", "wo", "rl", "d"]:
+                parts.append(part)
+                yield BaseOutput(name="text", delta=part)
+
+            yield BaseOutput(name="text", value="".join(parts))
+
+    class StreamingWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = StreamingNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            text = StreamingNode.Outputs.text
+
+    # WHEN we stream the workflow with a delta coalescing window of four characters
+    workflow = StreamingWorkflow()
+    events = list(
+        workflow.stream(
+            event_filter=all_workflow_event_filter,
+            delta_coalescing=DeltaCoalescingWindow(max_seconds=60, max_size=4),
+        )
+    )
+
+    # THEN the node's deltas are coalesced into fewer streaming events
+    node_deltas = [
+        event.output.delta for event in events if event.name == "node.execution.streaming" and event.output.is_streaming
+    ]
+    assert node_deltas == ["hell", "o wo", "rld"]
+
+    # AND the workflow streams the same coalesced deltas
+    workflow_deltas = [
+        event.output.delta
+        for event in events
+        if event.name == "workflow.execution.streaming" and event.output.is_streaming
+    ]
+    assert workflow_deltas == ["hell", "o wo", "rld"]
+
+    # AND the final output is unchanged
+    assert events[-1].name == "workflow.execution.fulfilled"
+    assert events[-1].outputs == {"text": "hello world"}
+
+
+def test_workflow__stream_with_delta_coalescing__node_raises():
+    # GIVEN a node that streams a few string deltas before raising
+    class StreamingNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            text: str
+
+        def run(self) -> Iterator[BaseOutput]:
+            yield BaseOutput(name="text", delta="he")
+            yield BaseOutput(name="text", delta="ll")
+            raise NodeException(message="Stream was interrupted")
+
+    class StreamingWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = StreamingNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            text = StreamingNode.Outputs.text
+
+    # WHEN we stream the workflow with a delta coalescing window larger than what the node streams
+    workflow = StreamingWorkflow()
+    events = list(
+        workflow.stream(
+            event_filter=all_workflow_event_filter,
+            delta_coalescing=DeltaCoalescingWindow(max_seconds=60, max_size=1024),
+        )
+    )
+
+    # THEN the buffered deltas are still streamed before the node is rejected
+    node_event_names = [event.name for event in events if event.name.startswith("node.execution.")]
+    assert node_event_names[-2:] == ["node.execution.streaming", "node.execution.rejected"]
+    node_deltas = [
+        event.output.delta for event in events if event.name == "node.execution.streaming" and event.output.is_streaming
+    ]
+    assert node_deltas == ["hell"]
+
+    # AND the workflow is rejected with the node's error
+    assert events[-1].name == "workflow.execution.rejected"
+    assert events[-1].error.message == "Stream was interrupted"
+
+
+def test_workflow__stream_event_filter_still_emits_filtered_events():
+    # GIVEN an emitter that records every event it receives
+    class RecordingEmitter(BaseWorkflowEmitter):
+        def __init__(self):
+            self.events = []
+
+        def emit_event(self, event):
+            self.events.append(event)
+
+        def snapshot_state(self, state):
+            pass
+
+    class MyNode(BaseNode):
+        pass
+
+    class MyWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = MyNode
+
+    emitter = RecordingEmitter()
+    workflow = MyWorkflow(emitters=[emitter])
+
+    # WHEN we stream the workflow with the default event filter
+    events = list(workflow.stream())
+
+    # THEN only the workflow events are yielded
+    assert [event.name for event in events] == ["workflow.execution.initiated", "workflow.execution.fulfilled"]
+
+    # AND we wait for the emitter to receive all of the events
+    assert get_default_emitter_dispatcher().flush(timeout=5)
+
+    # AND the node events were still sent to the emitter
+    emitted_event_names = [event.name for event in emitter.events]
+    assert "node.execution.initiated" in emitted_event_names
+    assert "node.execution.fulfilled" in emitted_event_names
+
+
+def test_workflow__run_with_metrics():
+    # GIVEN a node that streams an output before fulfilling
+    class StreamingNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            text: str
+
+        def run(self) -> Iterator[BaseOutput]:
+            yield BaseOutput(name="text", delta="hello")
+            time.sleep(0.01)
+            yield BaseOutput(name="text", value="hello")
+
+    class StreamingWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = StreamingNode
+
+    # AND a metrics hook that records in memory
+    metrics = InMemoryRunnerMetrics()
+
+    # WHEN we stream the workflow with the metrics hook
+    workflow = StreamingWorkflow()
+    events = list(workflow.stream(event_filter=all_workflow_event_filter, metrics=metrics))
+
+    # THEN the node's fulfilled event includes a summary of its timings
+    fulfilled_event = next(event for event in events if event.name == "node.execution.fulfilled")
+    timings = fulfilled_event.timings
+    assert timings is not None
+    assert timings.queue_wait >= 0
+    assert timings.time_to_first_output is not None
+    assert timings.run_duration >= timings.time_to_first_output + 0.01
+
+    # AND the metrics hook received the same timings
+    assert metrics.get_counter("node.fulfilled", node="StreamingNode") == 1
+    assert metrics.get_histogram("node.run_duration", node="StreamingNode") == [timings.run_duration]
+    assert metrics.get_histogram("node.time_to_first_output", workflow="StreamingWorkflow") == [
+        timings.time_to_first_output
+    ]
+
+    # AND the state snapshots were timed
+    assert len(metrics.get_histogram("runner.state_snapshot_duration")) > 0
@@ -1,8 +1,11 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from uuid import UUID, uuid4
 
 from vellum.workflows import BaseWorkflow
-from vellum.workflows.context import execution_context, get_execution_context
-from vellum.workflows.events.types import NodeParentContext, WorkflowParentContext
+from vellum.workflows.context import ExecutionContext, execution_context, get_execution_context
+from vellum.workflows.events.types import APIRequestParentContext, NodeParentContext, WorkflowParentContext
 from vellum.workflows.inputs import BaseInputs
 from vellum.workflows.nodes import BaseNode
 from vellum.workflows.references import VellumSecretReference
@@ -58,3 +61,43 @@ def test_context_trace_and_parent():
     with execution_context(parent_context=parent_context, trace_id=uuid4()):
         test = get_execution_context()
         assert test.trace_id != trace_id
+
+
+def test_context__propagates_to_asyncio_tasks_and_copied_contexts():
+    # GIVEN an execution context
+    trace_id = uuid4()
+    parent_context = WorkflowParentContext(workflow_definition=MockWorkflow, span_id=uuid4())
+
+    async def get_task_execution_context() -> ExecutionContext:
+        return get_execution_context()
+
+    with execution_context(parent_context=parent_context, trace_id=trace_id):
+        # WHEN the context is read from an asyncio task and from a thread running within a copy of the context
+        task_context = asyncio.run(get_task_execution_context())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            thread_context = executor.submit(copy_context().run, get_execution_context).result()
+
+    # THEN both see the same execution context
+    assert task_context == ExecutionContext(parent_context=parent_context, trace_id=trace_id)
+    assert thread_context == task_context
+
+    # AND the context is restored once exited
+    assert get_execution_context() == ExecutionContext()
+
+
+def test_context__validates_values():
+    # GIVEN a parent context and trace id that haven't been parsed yet
+    span_id = uuid4()
+    trace_id = uuid4()
+
+    # WHEN we enter an execution context with them
+    with execution_context(
+        parent_context={"type": "API_REQUEST", "span_id": str(span_id)},  # type: ignore[arg-type]
+        trace_id=str(trace_id),  # type: ignore[arg-type]
+    ):
+        context = get_execution_context()
+
+    # THEN they're coerced into their types
+    assert isinstance(context.parent_context, APIRequestParentContext)
+    assert context.parent_context.span_id == span_id
+    assert context.trace_id == trace_id
@@ -0,0 +1,27 @@
+import gc
+import weakref
+
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import _get_workflow_definition_key
+
+
+def test_get_workflow_definition_key__does_not_retain_workflows():
+    # GIVEN a workflow and a subclass of it
+    class MyWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        pass
+
+    class MySubWorkflow(MyWorkflow):
+        pass
+
+    # WHEN we get their definition keys
+    # THEN each is keyed on its own definition, rather than inheriting its parent's
+    assert _get_workflow_definition_key(MyWorkflow)[1] == "MyWorkflow"
+    assert _get_workflow_definition_key(MySubWorkflow)[1] == "MySubWorkflow"
+
+    # AND the workflows are released once they're no longer referenced
+    workflow_class = weakref.ref(MyWorkflow)
+    del MyWorkflow, MySubWorkflow
+    gc.collect()
+    assert workflow_class() is None
@@ -3,6 +3,7 @@ from typing import Union
 
 from vellum.workflows.exceptions import NodeException
 from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.state.checkpoint import FileCheckpointer
 from vellum.workflows.workflows.base import BaseWorkflow
 
 from tests.workflows.basic_external_input.workflow import BasicInputNodeWorkflow, InputNode
@@ -127,3 +128,79 @@ def test_workflow__happy_path_multi_stop_union_type():
 
     # THEN we should get a rejected workflow event with the correct error
     assert "Invalid external input type for message" == str(exc_info.value)
+
+
+def test_workflow__hibernate_and_rehydrate(tmp_path):
+    """
+    Hibernates a paused Workflow to disk and resumes it from a new instance once its external inputs are available.
+    """
+
+    # GIVEN a workflow with a Node that runs before the Input Node
+    executed_nodes = []
+
+    class StartNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            greeting: str
+
+        def run(self) -> Outputs:
+            executed_nodes.append("StartNode")
+            return self.Outputs(greeting="Hello")
+
+    class ReplyNode(BaseNode):
+        class ExternalInputs(BaseNode.ExternalInputs):
+            message: str
+
+        def run(self) -> BaseNode.Outputs:
+            executed_nodes.append("ReplyNode")
+            return self.Outputs()
+
+    class ReplyWorkflow(BaseWorkflow):
+        graph = StartNode >> ReplyNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            greeting = StartNode.Outputs.greeting
+            message = ReplyNode.ExternalInputs.message
+
+    # AND a run of it that is paused on the Input Node
+    workflow = ReplyWorkflow()
+    terminal_event = workflow.run()
+    assert terminal_event.name == "workflow.execution.paused"
+    executed_nodes.clear()
+
+    # WHEN we hibernate the workflow
+    checkpointer = FileCheckpointer(str(tmp_path / "hibernated.json"))
+    workflow.hibernate(checkpointer)
+
+    # THEN the events and state snapshots it held in memory are released
+    assert list(workflow._store.events) == []
+    assert list(workflow._store.state_snapshots) == []
+
+    # WHEN we rehydrate it and resume it with its external inputs
+    rehydrated_workflow = ReplyWorkflow.rehydrate(checkpointer)
+    final_terminal_event = rehydrated_workflow.run(
+        external_inputs={
+            ReplyNode.ExternalInputs.message: "world",
+        },
+    )
+
+    # THEN only the Node that was awaiting external inputs runs
+    assert final_terminal_event.name == "workflow.execution.fulfilled", final_terminal_event
+    assert executed_nodes == ["ReplyNode"]
+    assert final_terminal_event.outputs.greeting == "Hello"
+    assert final_terminal_event.outputs.message == "world"
+
+
+def test_workflow__hibernate_not_paused(tmp_path):
+    """
+    Only Workflows that are paused on external inputs can be hibernated.
+    """
+
+    # GIVEN a workflow that hasn't run yet
+    workflow = BasicInputNodeWorkflow()
+
+    # WHEN we try to hibernate it
+    with pytest.raises(ValueError) as exc_info:
+        workflow.hibernate(FileCheckpointer(str(tmp_path / "hibernated.json")))
+
+    # THEN we get a helpful error
+    assert str(exc_info.value) == "Cannot hibernate BasicInputNodeWorkflow, which isn't paused on external inputs"
@@ -0,0 +1,26 @@
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+
+from tests.workflows.critical_path_scheduling.workflow import (
+    ChainMiddleNode,
+    ChainStartNode,
+    CriticalPathSchedulingWorkflow,
+    StartNode,
+    UrgentShortNode,
+)
+
+
+def test_stream_workflow__critical_path_first():
+    # GIVEN a Workflow that fans out into a chain of Nodes alongside several independent ones
+    workflow = CriticalPathSchedulingWorkflow()
+
+    # WHEN the Workflow is run one Node at a time
+    events = list(workflow.stream(max_concurrency=1, event_filter=all_workflow_event_filter))
+
+    # THEN it completes successfully
+    assert events[-1].name == "workflow.execution.fulfilled", events[-1]
+
+    # AND the Node with a higher priority runs first, followed by the chain, which is the longest path left to run,
+    # until its last Node is no longer than any of the others
+    initiated_nodes = [event.node_definition for event in events if event.name == "node.execution.initiated"]
+    assert initiated_nodes[:4] == [StartNode, UrgentShortNode, ChainStartNode, ChainMiddleNode]
+    assert len(initiated_nodes) == 7
@@ -0,0 +1,47 @@
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state import BaseState
+
+
+class StartNode(BaseNode):
+    pass
+
+
+class ChainStartNode(BaseNode):
+    pass
+
+
+class ChainMiddleNode(BaseNode):
+    pass
+
+
+class ChainEndNode(BaseNode):
+    pass
+
+
+class FirstShortNode(BaseNode):
+    pass
+
+
+class SecondShortNode(BaseNode):
+    pass
+
+
+class UrgentShortNode(BaseNode):
+    class Execution(BaseNode.Execution):
+        priority = 1
+
+
+class CriticalPathSchedulingWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+    """
+    This Workflow fans out into a chain of Nodes alongside several independent ones, to show the order in which
+    ready Nodes run once `max_concurrency` is reached.
+    """
+
+    graph = StartNode >> {
+        FirstShortNode,
+        ChainStartNode >> ChainMiddleNode >> ChainEndNode,
+        SecondShortNode,
+        UrgentShortNode,
+    }